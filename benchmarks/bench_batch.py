@@ -0,0 +1,59 @@
+"""
+Benchmark batch signing against a loop over `sign_headers`
+
+Usage:
+    uv run python benchmarks/bench_batch.py [batch_size]
+"""
+
+import sys
+import time
+
+from xhshow import Xhshow
+
+ACCOUNTS = 8
+
+
+def build_specs(batch_size: int) -> list[tuple]:
+    specs = []
+    for i in range(batch_size):
+        cookies = {"a1": f"a1_value_{i % ACCOUNTS:04d}", "web_session": "session", "webId": "web_id"}
+        if i % 2:
+            specs.append(("POST", "/api/sns/web/v1/comment/post", cookies, {"note_id": str(i), "content": "test"}))
+        else:
+            specs.append(("GET", "/api/sns/web/v1/user_posted", cookies, {"num": "30", "cursor": str(i)}))
+    return specs
+
+
+def per_item_us(func, batch_size: int, rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best / batch_size * 1e6
+
+
+def main() -> None:
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    client = Xhshow()
+    specs = build_specs(batch_size)
+
+    def loop() -> None:
+        for method, uri, cookies, data in specs:
+            if method == "GET":
+                client.sign_headers(method, uri, cookies, params=data)
+            else:
+                client.sign_headers(method, uri, cookies, payload=data)
+
+    def batch() -> None:
+        client.sign_headers_many(specs)
+
+    loop_us = per_item_us(loop, batch_size)
+    batch_us = per_item_us(batch, batch_size)
+    print(f"batch size: {batch_size}, distinct cookie jars: {ACCOUNTS}")
+    print(f"sign_headers loop:  {loop_us:8.2f} us/item")
+    print(f"sign_headers_many:  {batch_us:8.2f} us/item  ({loop_us / batch_us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
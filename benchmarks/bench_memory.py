@@ -0,0 +1,63 @@
+"""
+Measure the memory footprint of N clients (one per account)
+
+Usage:
+    uv run python benchmarks/bench_memory.py [clients]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from xhshow import CryptoConfig, Xhshow
+from xhshow.utils.shared import shared_count
+
+COOKIES = {"a1": "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456", "web_session": "session"}
+TIMESTAMP = 1764896636.081
+
+
+def allocated_bytes(build) -> tuple[int, list]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, objects
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    # Warm up the shared registry so only per-client state is measured
+    Xhshow().sign_headers_get("/api/sns/web/v1/user_posted", COOKIES, params={"num": "30"}, timestamp=TIMESTAMP)
+    config = CryptoConfig().with_overrides(CONTENT_CACHE_SIZE=128)
+
+    cases = {
+        "Xhshow()": lambda: [Xhshow() for _ in range(count)],
+        "Xhshow(config) per client": lambda: [
+            Xhshow(CryptoConfig().with_overrides(CONTENT_CACHE_SIZE=128)) for _ in range(count)
+        ],
+        "Xhshow(shared config)": lambda: [Xhshow(config) for _ in range(count)],
+    }
+
+    print(f"{count} clients")
+    print(f"{'case':<28} {'total KiB':>10} {'per client B':>13}")
+    for name, build in cases.items():
+        total, clients = allocated_bytes(build)
+        print(f"{name:<28} {total / 1024:10.1f} {total / count:13.0f}")
+        del clients
+
+    total, clients = allocated_bytes(
+        lambda: [
+            client.sign_headers_get("/api/sns/web/v1/user_posted", COOKIES, params={"num": "30"}, timestamp=TIMESTAMP)
+            and client
+            for client in (Xhshow() for _ in range(count))
+        ]
+    )
+    print(f"{'Xhshow() after one sign':<28} {total / 1024:10.1f} {total / count:13.0f}")
+    print(f"\nshared objects in registry: {shared_count()}")
+
+
+if __name__ == "__main__":
+    main()
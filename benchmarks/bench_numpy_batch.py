@@ -0,0 +1,65 @@
+"""
+Benchmark the NumPy batch backend against the scalar path of `sign_xs_many`
+
+Requires numpy. Usage:
+    uv run python benchmarks/bench_numpy_batch.py
+"""
+
+import time
+
+from xhshow import CryptoConfig, Xhshow
+from xhshow.core.vectorized import get_batch_encoder
+
+TIMESTAMP = 1764896636.081
+A1 = "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456"
+
+
+def per_item_us(func, batch_size: int, rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best / batch_size * 1e6
+
+
+def main() -> None:
+    scalar = Xhshow(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=0))
+    vectorized = Xhshow(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=1))
+
+    print(f"{'batch size':>10} {'scalar us':>10} {'numpy us':>10} {'speedup':>8}")
+    for batch_size in (16, 64, 128, 256, 1024, 8192):
+        specs = [("GET", "/api/sns/web/v1/user_posted", A1, {"cursor": str(i)}) for i in range(batch_size)]
+        scalar_us = per_item_us(lambda specs=specs: scalar.sign_xs_many(specs, TIMESTAMP), batch_size)
+        numpy_us = per_item_us(lambda specs=specs: vectorized.sign_xs_many(specs, TIMESTAMP), batch_size)
+        print(f"{batch_size:>10} {scalar_us:10.2f} {numpy_us:10.2f} {scalar_us / numpy_us:7.2f}x")
+
+    # XOR, X3 Base64 and envelope only, on prebuilt payloads
+    processor = scalar.crypto_processor
+    envelope = scalar._envelope
+    batch_encoder = get_batch_encoder(vectorized.config)
+    width = processor.layout.SIGNED_SIZE
+
+    print(f"\n{'batch size':>10} {'scalar us':>10} {'numpy us':>10} {'speedup':>8}  (xor + x3 + envelope)")
+    for batch_size in (16, 64, 128, 256, 1024, 8192):
+        payloads = b"".join(
+            bytes(processor.build_payload_bytes(bytes(16), A1, "xhs-pc-web", i, TIMESTAMP)[:width])
+            for i in range(batch_size)
+        )
+        records = [payloads[start : start + width] for start in range(0, len(payloads), width)]
+
+        def scalar_stage(records=records) -> None:
+            for record in records:
+                envelope.wrap(processor.b64encoder.encode_x3_bytes(processor.bit_ops.xor_transform_bytes(record)))
+
+        def numpy_stage(payloads=payloads) -> None:
+            rows = batch_encoder.xor_rows(batch_encoder.as_rows(payloads, width))
+            batch_encoder.wrap_rows(batch_encoder.encode_x3_rows(rows), envelope)
+
+        scalar_us = per_item_us(scalar_stage, batch_size)
+        numpy_us = per_item_us(numpy_stage, batch_size)
+        print(f"{batch_size:>10} {scalar_us:10.2f} {numpy_us:10.2f} {scalar_us / numpy_us:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
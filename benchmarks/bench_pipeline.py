@@ -0,0 +1,103 @@
+"""
+Per-stage allocation and time benchmark: str/list pipeline vs bytes pipeline
+
+Usage:
+    uv run python benchmarks/bench_pipeline.py [iterations]
+"""
+
+import base64
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+
+from xhshow import Xhshow
+
+TIMESTAMP = 1764896636.081
+A1 = "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456"
+URI = "/api/sns/web/v1/user_posted"
+PARAMS = {"num": "30", "cursor": "", "user_id": "5ff0e6410000000001008400", "image_formats": ["jpg", "webp"]}
+
+
+def measure(func, iterations: int) -> tuple[float, float]:
+    """Return (us per call, peak traced KiB of a single call)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed / iterations * 1e6, peak / 1024
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    client = Xhshow()
+    processor = client.crypto_processor
+    encoder = processor.b64encoder
+    config = client.config
+
+    content = client._build_content_string("GET", URI, PARAMS)
+    content_bytes = content.encode()
+    d_value = hashlib.md5(content_bytes).hexdigest()
+    digest = bytes.fromhex(d_value)
+    payload_list = processor.build_payload_array(d_value, A1, "xhs-pc-web", content, TIMESTAMP)
+    payload_bytes = processor.build_payload_bytes(digest, A1, "xhs-pc-web", len(content), TIMESTAMP)
+    xored_list = processor.bit_ops.xor_transform_array(payload_list)[:124]
+    xored_bytes = processor.bit_ops.xor_transform_bytes(memoryview(payload_bytes)[:124])
+    x3_str = encoder.encode_x3(xored_list)
+    x3_bytes = encoder.encode_x3_bytes(xored_bytes)
+    x3_table = str.maketrans(config.STANDARD_BASE64_ALPHABET, config.X3_BASE64_ALPHABET)
+
+    def legacy_envelope() -> str:
+        data = config.SIGNATURE_DATA_TEMPLATE.copy()
+        data["x3"] = config.X3_PREFIX + x3_str
+        return config.XYS_PREFIX + encoder.encode(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    stages = [
+        (
+            "md5",
+            lambda: hashlib.md5(content.encode("utf-8")).hexdigest(),
+            lambda: hashlib.md5(content_bytes).digest(),
+        ),
+        (
+            "payload",
+            lambda: processor.build_payload_array(d_value, A1, "xhs-pc-web", content, TIMESTAMP),
+            lambda: processor.build_payload_bytes(digest, A1, "xhs-pc-web", len(content), TIMESTAMP),
+        ),
+        (
+            "xor",
+            lambda: processor.bit_ops.xor_transform_array(payload_list)[:124],
+            lambda: processor.bit_ops.xor_transform_bytes(memoryview(payload_bytes)[:124]),
+        ),
+        (
+            "x3 base64",
+            lambda: base64.b64encode(xored_list).decode("utf-8").translate(x3_table),
+            lambda: encoder.encode_x3_bytes(xored_bytes),
+        ),
+        (
+            "envelope",
+            legacy_envelope,
+            lambda: client._envelope.wrap(x3_bytes),
+        ),
+    ]
+
+    print(f"{'stage':<14} {'str us':>8} {'bytes us':>9} {'str peak KiB':>13} {'bytes peak KiB':>15}")
+    for name, legacy, native in stages:
+        legacy_us, legacy_peak = measure(legacy, iterations)
+        native_us, native_peak = measure(native, iterations)
+        print(f"{name:<14} {legacy_us:8.2f} {native_us:9.2f} {legacy_peak:13.2f} {native_peak:15.2f}")
+
+    sign_us, sign_peak = measure(
+        lambda: client.sign_xs_bytes("GET", URI, A1, payload=PARAMS, timestamp=TIMESTAMP), iterations
+    )
+    print(f"sign_xs_bytes end to end: {sign_us:.2f} us, peak {sign_peak:.2f} KiB")
+
+
+if __name__ == "__main__":
+    main()
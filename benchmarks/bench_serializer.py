@@ -0,0 +1,49 @@
+"""
+Benchmark JSON serializer backends on POST bodies of growing size
+
+Usage:
+    uv run python benchmarks/bench_serializer.py [iterations]
+"""
+
+import sys
+import timeit
+from functools import partial
+
+from xhshow.utils.serializer import available_serializers, get_serializer
+
+
+def make_body(items: int) -> dict:
+    return {
+        "cursor": "",
+        "items": [
+            {
+                "note_id": f"{index:024x}",
+                "title": "笔记标题 Note title",
+                "desc": "评论内容，包含中文与 English text " * 3,
+                "liked": index % 2 == 0,
+                "score": index / 7,
+                "count": index,
+                "tags": ["美食", "travel", None],
+            }
+            for index in range(items)
+        ],
+    }
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    names = available_serializers()
+    print(f"{'items':>6} " + " ".join(f"{name:>12}" for name in names))
+
+    for items in (10, 100, 2000):
+        body = make_body(items)
+        number = max(1, iterations * 2000 // items)
+        timings = [
+            min(timeit.repeat(partial(get_serializer(name).dumps_bytes, body), number=number, repeat=3)) / number
+            for name in names
+        ]
+        print(f"{items:>6} " + " ".join(f"{seconds * 1e6:9.1f} us" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark validation decorator overhead against a validate-once RequestTemplate
+
+Usage:
+    uv run python benchmarks/bench_template.py [iterations]
+"""
+
+import sys
+import timeit
+
+from xhshow import Xhshow
+
+URL = "https://edith.xiaohongshu.com/api/sns/web/v1/user_posted"
+A1 = "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456"
+PARAMS = {"num": "30", "cursor": "", "user_id": "5ff0e6410000000001008400", "image_formats": "jpg,webp,avif"}
+TIMESTAMP = 1764896636.081
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    client = Xhshow()
+    template = client.template("GET", URL)
+
+    cases = {
+        "sign_xs_get (two decorators)": lambda: client.sign_xs_get(URL, A1, params=PARAMS, timestamp=TIMESTAMP),
+        "sign_xs (one decorator)": lambda: client.sign_xs("GET", URL, A1, payload=PARAMS, timestamp=TIMESTAMP),
+        "template.sign": lambda: template.sign(A1, PARAMS, timestamp=TIMESTAMP),
+        "no validation (lower bound)": lambda: client._sign_xs_core(
+            "GET", template.uri, A1, "xhs-pc-web", PARAMS, TIMESTAMP
+        ),
+    }
+
+    baseline = None
+    for name, func in cases.items():
+        us = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+        baseline = baseline or us
+        print(f"{name:<30} {us:7.2f} us  ({baseline / us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark the overhead of sampled self-verification (CryptoConfig.SELF_VERIFY_RATE)
+
+Usage:
+    uv run python benchmarks/bench_verify.py [iterations]
+"""
+
+import hashlib
+import sys
+import timeit
+from functools import partial
+
+from xhshow import CryptoConfig, Xhshow
+from xhshow.core.verify import SignatureVerifier
+
+URL = "https://edith.xiaohongshu.com/api/sns/web/v1/user_posted"
+A1 = "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456"
+PARAMS = {"num": "30", "cursor": "", "user_id": "5ff0e6410000000001008400", "image_formats": "jpg,webp,avif"}
+TIMESTAMP = 1764896636.081
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    cases = {
+        "disabled": CryptoConfig(),
+        "rate 0.001": CryptoConfig().with_overrides(SELF_VERIFY_RATE=0.001),
+        "rate 0.01": CryptoConfig().with_overrides(SELF_VERIFY_RATE=0.01),
+        "rate 0.1": CryptoConfig().with_overrides(SELF_VERIFY_RATE=0.1),
+        "rate 1.0": CryptoConfig().with_overrides(SELF_VERIFY_RATE=1.0),
+        "rate 1.0, 100/s budget": CryptoConfig().with_overrides(SELF_VERIFY_RATE=1.0, SELF_VERIFY_MAX_PER_SECOND=100),
+    }
+
+    baseline = None
+    for name, config in cases.items():
+        sign = Xhshow(config).template("GET", URL).sign
+        us = min(timeit.repeat(partial(sign, A1, PARAMS, TIMESTAMP), number=iterations, repeat=3)) / iterations * 1e6
+        baseline = baseline or us
+        print(f"{name:<24} {us:7.2f} us  ({(us / baseline - 1) * 100:+6.1f}%)")
+
+    # Per-call costs: the added latency is sample + rate * check
+    client = Xhshow()
+    template = client.template("GET", URL)
+    content = client._build_content_string("GET", template.uri, PARAMS)
+    signature = template.sign_bytes(A1, PARAMS, TIMESTAMP)
+    digest = hashlib.md5(content.encode("utf-8")).digest()
+    verifier = SignatureVerifier(client.config, rate=0.01)
+    costs = {
+        "sample()": verifier.sample,
+        "check()": lambda: verifier.check(signature, digest, len(content), A1, "xhs-pc-web", TIMESTAMP),
+    }
+    for name, func in costs.items():
+        us = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+        print(f"{name:<24} {us:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark x-s-common latency: full fingerprint vs b1-only fingerprint fields
+
+Usage:
+    uv run python benchmarks/bench_xs_common.py [iterations]
+"""
+
+import sys
+import timeit
+
+from xhshow import CryptoConfig, Xhshow
+from xhshow.generators.fingerprint import FingerprintGenerator
+
+COOKIES = {
+    "a1": "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456",
+    "web_session": "040069b5f5c0e1d2a3b4c5d6e7f8091a2b3c4d",
+    "webId": "0a1b2c3d4e5f60718293a4b5c6d7e8f9",
+}
+TIMESTAMP = 1764896636.081
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    config = CryptoConfig()
+    generator = FingerprintGenerator(config)
+    client = Xhshow(config)
+
+    cases = {
+        "generate (full fingerprint)": lambda: generator.generate(COOKIES, config.PUBLIC_USERAGENT, TIMESTAMP),
+        "generate_b1_fields": lambda: generator.generate_b1_fields(TIMESTAMP),
+        "full fingerprint + b1": lambda: generator.generate_b1(
+            generator.generate(COOKIES, config.PUBLIC_USERAGENT, TIMESTAMP)
+        ),
+        "b1 fields + b1": lambda: generator.generate_b1(generator.generate_b1_fields(TIMESTAMP)),
+        "sign_xs_common": lambda: client.sign_xs_common(COOKIES, TIMESTAMP),
+    }
+
+    for name, func in cases.items():
+        us = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+        print(f"{name:<30} {us:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,18 @@
 from .client import Xhshow
 from .config import CryptoConfig
+from .core.batch import RequestSpec
 from .core.crypto import CryptoProcessor
+from .core.request import SignedRequest
+from .core.template import RequestTemplate
+from .utils.random_gen import RandomGenerator
 
 __version__ = "0.1.0"
-__all__ = ["CryptoConfig", "CryptoProcessor", "Xhshow"]
+__all__ = [
+    "CryptoConfig",
+    "CryptoProcessor",
+    "RandomGenerator",
+    "RequestSpec",
+    "RequestTemplate",
+    "SignedRequest",
+    "Xhshow",
+]
@@ -0,0 +1,391 @@
+"""
+Audit logged x-s / x-s-common headers
+
+Log files are memory-mapped, split into newline-aligned chunks and decoded
+in parallel by a process pool. Each line holding an x-s value (`XYS_...`)
+becomes one row; `x-t` and `x-s-common` values on the same line are used
+when present, so JSON lines of `sign_headers` output and plain
+`x-t x-s x-s-common` text logs both work.
+
+Results are written in a compact columnar file (see `write_columns` /
+`read_columns`).
+
+Usage:
+    python -m xhshow.audit headers.log [more.log ...] -o audit.xhsa [--workers N]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO
+
+from .config import CryptoConfig
+from .core.crc32_encrypt import CRC32
+from .core.payload_layout import PayloadLayout
+from .core.x3_parser import X3Parser
+from .utils.encoder import Base64Encoder
+
+__all__ = ["AUDIT_COLUMNS", "audit_chunk", "audit_files", "main", "read_columns", "write_columns"]
+
+# Column name -> array typecode, "str" for UTF-8 string columns
+AUDIT_COLUMNS: dict[str, str] = {
+    "file": "H",  # index into the input file list
+    "line": "Q",  # 1-based line number
+    "valid": "B",  # constant payload fields and checksums match
+    "x_t": "q",  # logged x-t in milliseconds, -1 when absent
+    "timestamp_ms": "q",  # signing time recovered from the payload (+-1 ms)
+    "skew_ms": "q",  # timestamp_ms - x_t, 0 when x-t is absent
+    "time_offset_ms": "q",  # timestamp_ms - env fingerprint B
+    "seed": "I",
+    "sequence": "I",
+    "window_props_length": "I",
+    "content_length": "I",
+    "md5_prefix": "Q",  # first 8 bytes of the content MD5, little-endian
+    "a1": "str",
+    "source": "str",
+    "xsc_a1": "str",  # a1 in x-s-common, empty when absent or undecodable
+    "a1_match": "b",  # 1 / 0, -1 when x-s-common is absent or either header fails to decode
+    "xsc_crc_valid": "b",  # x-s-common x9 matches CRC32(b1), -1 when absent
+}
+
+MAGIC = b"XHSAUDIT1\n"
+DEFAULT_CHUNK_SIZE = 8 << 20
+
+_XS_PATTERN = re.compile(rb"XYS_([A-Za-z0-9+/=]+)")
+_XT_PATTERN = re.compile(rb"x-t\"?\s*[:=]?\s*\"?(\d{10,16})")
+_XSC_PATTERN = re.compile(rb"x-s-common\"?\s*[:=]?\s*\"?([A-Za-z0-9+/=]{16,})")
+_PLAIN_XT_PATTERN = re.compile(rb"(?:^|\s)(\d{13})(?:\s|$)")
+_PLAIN_TOKEN_PATTERN = re.compile(rb"(?<![\w+/=])([A-Za-z0-9+/]{64,}=*)")
+_X3_PATTERN = re.compile(rb'"x3":"([^"]*)"')
+
+
+def _chunk_bounds(mm: mmap.mmap | bytes, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a buffer into chunks ending on newlines"""
+    bounds = []
+    start, size = 0, len(mm)
+    while start < size:
+        end = mm.find(b"\n", min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class _Decoder:
+    """Per-process decoding state built from the shared encoder and x3 parser"""
+
+    def __init__(self, config: CryptoConfig):
+        self.config = config
+        self.encoder = Base64Encoder.shared(config)
+        self.parser = X3Parser.shared(config)
+        self.x3_prefix = config.X3_PREFIX.encode()
+
+    def decode_many(self, decode: Callable[[list[bytes]], list[bytes]], values: list[bytes]) -> list[bytes | None]:
+        """Decode a batch, isolating invalid items instead of failing the whole batch"""
+        try:
+            return list(decode(values))
+        except ValueError:
+            results: list[bytes | None] = []
+            for value in values:
+                try:
+                    results.append(decode([value])[0])
+                except ValueError:
+                    results.append(None)
+            return results
+
+    def payload_columns(self, xs_values: list[bytes]) -> dict[str, Any]:
+        """Decode x-s values to x3 payload columns (`PAYLOAD_COLUMNS`)"""
+        x3_values: list[bytes] = []
+        for signature_json in self.decode_many(self.encoder.decode_many, xs_values):
+            match = _X3_PATTERN.search(signature_json) if signature_json else None
+            # Rows without an x3 value decode to an empty payload and come back invalid
+            valid_x3 = match is not None and match.group(1).startswith(self.x3_prefix)
+            x3_values.append(match.group(1) if valid_x3 else b"")
+        return self.parser.parse_columns(x3_values, numpy=False)
+
+    def xs_commons(self, values: list[bytes | None]) -> list[tuple[str | None, int]]:
+        """Extract (a1, CRC valid) from x-s-common values, a1 is None where absent or undecodable"""
+        present = [value for value in values if value is not None]
+        decoded = iter(self.decode_many(self.encoder.decode_many, present))
+        results = []
+        for value in values:
+            if value is None:
+                results.append((None, -1))
+                continue
+            try:
+                data = json.loads(next(decoded))
+                results.append((str(data["x5"]), int(data["x9"] == CRC32.crc32_js_int(data["x8"]))))
+            except (ValueError, TypeError, KeyError):
+                results.append((None, 0))
+        return results
+
+
+def _x3_a1(a1: str) -> str:
+    """Truncate an a1 value the way it is stored in the x3 payload"""
+    return a1.encode("utf-8")[: PayloadLayout.A1_SIZE].rstrip(b"\x00").decode("utf-8", "replace")
+
+
+def _empty_columns() -> dict[str, Any]:
+    return {name: [] if code == "str" else array(code) for name, code in AUDIT_COLUMNS.items()}
+
+
+def audit_chunk(path: str, start: int, end: int, file_index: int = 0, config: CryptoConfig | None = None) -> tuple:
+    """
+    Decode the logged headers in one byte range of a log file
+
+    Args:
+        path: Log file path
+        start: Chunk start offset (beginning of a line)
+        end: Chunk end offset (after a newline or at end of file)
+        file_index: Value of the `file` column
+        config: Crypto configuration the headers were signed with
+
+    Returns:
+        tuple: (columns dict, number of lines in the chunk, number of bytes)
+            Line numbers are relative to the chunk start.
+    """
+    decoder = _Decoder(config or CryptoConfig())
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = mm[start:end].split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    line_numbers: list[int] = []
+    xs_values: list[bytes] = []
+    x_t_values: list[int] = []
+    xsc_values: list[bytes | None] = []
+    for number, line in enumerate(lines, 1):
+        xs_match = _XS_PATTERN.search(line)
+        if xs_match is None:
+            continue
+        xt_match = _XT_PATTERN.search(line) or _PLAIN_XT_PATTERN.search(line)
+        xsc_match = _XSC_PATTERN.search(line)
+        if xsc_match is None:
+            # Plain text logs: the first long Base64 token after the x-s value
+            xsc_match = _PLAIN_TOKEN_PATTERN.search(line, xs_match.end())
+        line_numbers.append(number)
+        xs_values.append(xs_match.group(1))
+        x_t_values.append(int(xt_match.group(1)) if xt_match else -1)
+        xsc_values.append(xsc_match.group(1) if xsc_match else None)
+
+    columns = _empty_columns()
+    payload = decoder.payload_columns(xs_values)
+    for name in ("valid", "timestamp_ms", "seed", "sequence", "window_props_length", "content_length", "md5_prefix"):
+        columns[name] = payload[name]
+    columns["a1"], columns["source"] = payload["a1"], payload["source"]
+    columns["file"] = array("H", [file_index]) * len(line_numbers)
+    columns["line"] = array("Q", line_numbers)
+    columns["x_t"] = array("q", x_t_values)
+    for timestamp_ms, env_timestamp_ms, x_t in zip(
+        payload["timestamp_ms"], payload["env_timestamp_ms"], x_t_values, strict=True
+    ):
+        # Payloads that failed to decode have zero timestamps
+        columns["skew_ms"].append(timestamp_ms - x_t if x_t >= 0 and timestamp_ms else 0)
+        columns["time_offset_ms"].append(timestamp_ms - env_timestamp_ms)
+    for a1, timestamp_ms, (xsc_a1, xsc_crc_valid) in zip(
+        payload["a1"], payload["timestamp_ms"], decoder.xs_commons(xsc_values), strict=True
+    ):
+        columns["xsc_a1"].append(xsc_a1 or "")
+        # Not applicable when x-s-common is absent or either header failed to decode
+        columns["a1_match"].append(-1 if xsc_a1 is None or not timestamp_ms else int(_x3_a1(xsc_a1) == a1))
+        columns["xsc_crc_valid"].append(xsc_crc_valid)
+    return columns, len(lines), end - start
+
+
+def _merge(target: dict[str, Any], columns: dict[str, Any], line_offset: int) -> None:
+    for name, values in columns.items():
+        if name == "line":
+            values = array("Q", (number + line_offset for number in values))
+        target[name].extend(values)
+
+
+def audit_files(
+    paths: Sequence[str],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    config: CryptoConfig | None = None,
+    progress: Callable[[int, int, int, float], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Decode logged headers of several files into columns
+
+    Args:
+        paths: Log file paths
+        workers: Worker processes, None for `os.cpu_count()`, 1 decodes in-process
+        chunk_size: Approximate bytes per task
+        config: Crypto configuration the headers were signed with
+        progress: Called after each chunk with (bytes done, total bytes, rows, elapsed seconds)
+
+    Returns:
+        dict: Column name -> `array.array` (numeric) or list[str], see `AUDIT_COLUMNS`
+    """
+    tasks = []
+    for file_index, path in enumerate(paths):
+        if os.path.getsize(path) == 0:
+            continue
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tasks.extend((path, start, end, file_index) for start, end in _chunk_bounds(mm, chunk_size))
+
+    total_bytes = sum(end - start for _, start, end, _ in tasks)
+    columns = _empty_columns()
+    done_bytes, rows = 0, 0
+    line_offsets: dict[int, int] = {}
+    started = time.perf_counter()
+
+    def results() -> Iterator[tuple]:
+        if workers == 1 or len(tasks) <= 1:
+            yield from (audit_chunk(*task, config) for task in tasks)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(audit_chunk, *zip(*tasks, strict=True), [config] * len(tasks))
+
+    # executor.map yields in task order, so line numbers can be offset as chunks arrive
+    for (_, _, _, file_index), (chunk_columns, line_count, byte_count) in zip(tasks, results(), strict=False):
+        offset = line_offsets.get(file_index, 0)
+        _merge(columns, chunk_columns, offset)
+        line_offsets[file_index] = offset + line_count
+        done_bytes += byte_count
+        rows += len(chunk_columns["line"])
+        if progress is not None:
+            progress(done_bytes, total_bytes, rows, time.perf_counter() - started)
+    return columns
+
+
+def write_columns(columns: dict[str, Any], file: BinaryIO) -> None:
+    """
+    Write columns in the compact audit format
+
+    Layout: `MAGIC`, one JSON header line (row count, byte order and column
+    types), then each column's raw data in header order. String columns are
+    stored as `len + 1` uint32 offsets followed by the concatenated UTF-8 data.
+
+    Args:
+        columns: Column name -> `array.array` or list[str]
+        file: Binary output file
+    """
+    rows = len(next(iter(columns.values()))) if columns else 0
+    encoded = {}
+    header_columns = []
+    for name, values in columns.items():
+        if isinstance(values, array):
+            header_columns.append({"name": name, "type": values.typecode, "itemsize": values.itemsize})
+        else:
+            data = [value.encode("utf-8") for value in values]
+            offsets = array("I", [0])
+            for item in data:
+                offsets.append(offsets[-1] + len(item))
+            encoded[name] = (offsets, b"".join(data))
+            header_columns.append({"name": name, "type": "str", "bytes": len(encoded[name][1])})
+
+    header = {"rows": rows, "byteorder": sys.byteorder, "columns": header_columns}
+    file.write(MAGIC)
+    file.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+    for name, values in columns.items():
+        if name in encoded:
+            offsets, data = encoded[name]
+            file.write(offsets.tobytes())
+            file.write(data)
+        else:
+            file.write(values.tobytes())
+
+
+def read_columns(path: str) -> dict[str, Any]:
+    """
+    Read a file written by `write_columns`
+
+    Args:
+        path: Audit output file
+
+    Returns:
+        dict: Column name -> `array.array` or list[str]
+
+    Raises:
+        ValueError: Not an audit file
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an xhshow audit file")
+        header = json.loads(file.readline())
+        rows = header["rows"]
+        columns: dict[str, Any] = {}
+        for column in header["columns"]:
+            if column["type"] == "str":
+                offsets = array("I")
+                offsets.frombytes(file.read(4 * (rows + 1)))
+                data = file.read(column["bytes"])
+                if header["byteorder"] != sys.byteorder:
+                    offsets.byteswap()
+                columns[column["name"]] = [data[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(rows)]
+            else:
+                values = array(column["type"])
+                values.frombytes(file.read(column["itemsize"] * rows))
+                if header["byteorder"] != sys.byteorder:
+                    values.byteswap()
+                columns[column["name"]] = values
+    return columns
+
+
+def _report_progress(done: int, total: int, rows: int, elapsed: float) -> None:
+    elapsed = max(elapsed, 1e-9)
+    print(
+        f"\r[audit] {done / 2**20:9.1f}/{total / 2**20:.1f} MiB  {rows:,} rows  "
+        f"{done / 2**20 / elapsed:7.1f} MiB/s  {rows / elapsed:,.0f} rows/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Command line entry: `python -m xhshow.audit LOG [LOG ...] -o OUTPUT`
+
+    Returns:
+        int: Exit status (0 when every row is valid, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(prog="python -m xhshow.audit", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("logs", nargs="+", help="header log files")
+    parser.add_argument("-o", "--output", required=True, help="columnar output file")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE >> 20, help="MiB per task (default: 8)")
+    parser.add_argument("--max-skew-ms", type=int, default=30000, help="report |skew| above this (default: 30000)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    columns = audit_files(
+        args.logs,
+        workers=args.workers,
+        chunk_size=max(args.chunk_size, 1) << 20,
+        progress=None if args.quiet else _report_progress,
+    )
+    with open(args.output, "wb") as file:
+        write_columns(columns, file)
+    elapsed = time.perf_counter() - started
+
+    rows = len(columns["line"])
+    invalid = rows - sum(columns["valid"])
+    skewed = sum(
+        1
+        for x_t, skew in zip(columns["x_t"], columns["skew_ms"], strict=True)
+        if x_t >= 0 and abs(skew) > args.max_skew_ms
+    )
+    a1_mismatch = sum(1 for match in columns["a1_match"] if match == 0)
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"{rows:,} rows in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s): "
+        f"{invalid} invalid, {skewed} skewed > {args.max_skew_ms} ms, {a1_mismatch} a1 mismatches -> {args.output}"
+    )
+    return 0 if invalid == 0 and skewed == 0 and a1_mismatch == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,28 @@
 import hashlib
 import json
 import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from typing import Any, Literal
 
 from .config import CryptoConfig
+from .core.batch import RequestSpec, SigningContext
 from .core.common_sign import XsCommonSigner
 from .core.crypto import CryptoProcessor
+from .core.digest import ContentDigester, canonical_request_key
+from .core.envelope import XysEnvelope
+from .core.request import SignedRequest
+from .core.template import RequestTemplate
+from .core.vectorized import NumpyBatchEncoder, get_batch_encoder
+from .core.verify import SignatureMismatch, SignatureVerifier, VerifyStats
+from .core.x3_parser import X3Parser, X3Payload
+from .utils.cache import CacheStats
 from .utils.random_gen import RandomGenerator
-from .utils.url_utils import build_url, extract_uri
+from .utils.serializer import get_serializer
+from .utils.shared import intern_config
+from .utils.url_utils import append_query, build_url, encode_query, extract_uri
 from .utils.validators import (
+    RequestSignatureValidator,
     validate_get_signature_params,
     validate_post_signature_params,
     validate_signature_params,
@@ -19,12 +33,61 @@ __all__ = ["Xhshow"]
 
 
 class Xhshow:
-    """Xiaohongshu request client wrapper"""
-
-    def __init__(self, config: CryptoConfig | None = None):
-        self.config = config or CryptoConfig()
-        self.crypto_processor = CryptoProcessor(self.config)
-        self.random_generator = RandomGenerator()
+    """
+    Xiaohongshu request client wrapper
+
+    Args:
+        config: Crypto configuration, defaults to `CryptoConfig()`
+        random_generator: Random source for payload fields, trace IDs and
+            fingerprints. Pass `RandomGenerator(seed=...)` for reproducible
+            output; defaults to an independent unseeded generator per client.
+        on_verify_mismatch: Called with a `SignatureMismatch` when a signature
+            sampled by `CryptoConfig.SELF_VERIFY_RATE` does not decode back
+            to its inputs
+
+    Examples:
+        >>> client = Xhshow(random_generator=RandomGenerator(seed=42))
+    """
+
+    __slots__ = (
+        "config",
+        "random_generator",
+        "crypto_processor",
+        "serializer",
+        "_envelope",
+        "content_digester",
+        "_batch_encoder",
+        "_batch_encoder_resolved",
+        "_verifier",
+        "_xs_common_signer",
+    )
+
+    def __init__(
+        self,
+        config: CryptoConfig | None = None,
+        random_generator: RandomGenerator | None = None,
+        on_verify_mismatch: Callable[[SignatureMismatch], None] | None = None,
+    ):
+        # Equal configs resolve to one shared instance, and so do their encoders and layouts
+        self.config = intern_config(config)
+        self.random_generator = random_generator or RandomGenerator()
+        self.crypto_processor = CryptoProcessor(self.config, self.random_generator)
+        self.serializer = get_serializer(self.config.JSON_SERIALIZER)
+        self._envelope = XysEnvelope.shared(self.config)
+        self.content_digester = ContentDigester(self.config)
+        self._batch_encoder: NumpyBatchEncoder | None = None
+        self._batch_encoder_resolved = False
+        self._xs_common_signer = XsCommonSigner(self.config, self.random_generator)
+        self._verifier: SignatureVerifier | None = None
+        if self.config.SELF_VERIFY_RATE:
+            seed = self.random_generator.seed
+            self._verifier = SignatureVerifier(
+                self.config,
+                self.config.SELF_VERIFY_RATE,
+                on_verify_mismatch,
+                self.config.SELF_VERIFY_MAX_PER_SECOND,
+                seed=None if seed is None else f"verify:{seed!r}",
+            )
 
     def _build_content_string(self, method: str, uri: str, payload: dict[str, Any] | None = None) -> str:
         """
@@ -38,21 +101,29 @@ class Xhshow:
         Returns:
             str: Built content string
         """
+        separator, tail = self._build_content_parts(method, payload)
+        return uri + separator + tail
+
+    def _build_content_parts(self, method: str, payload: dict[str, Any] | None = None) -> tuple[str, str]:
+        """
+        Build the parts of the content string following the URI
+
+        Args:
+            method: Request method ("GET" or "POST")
+            payload: Request parameters
+
+        Returns:
+            tuple[str, str]: (separator, tail), the content string is `uri + separator + tail`
+        """
         payload = payload or {}
 
         if method.upper() == "POST":
-            return uri + json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+            body = self.serializer.dumps(payload)
+            return body[:1], body[1:]
         else:
-            if not payload:
-                return uri
-            else:
-                # XHS signature algorithm requires only '=' to be encoded as '%3D',
-                # other characters (including ',') should remain unencoded
-                params = [
-                    f"{key}={(','.join(str(v) for v in value) if isinstance(value, list | tuple) else (str(value) if value is not None else '')).replace('=', '%3D')}"  # noqa: E501
-                    for key, value in payload.items()
-                ]
-                return f"{uri}?{'&'.join(params)}"
+            # Same encoding rules as build_url: only '=' is encoded as '%3D'
+            query_string = encode_query(payload)
+            return ("?", query_string) if query_string else ("", "")
 
     def _generate_d_value(self, content: str) -> str:
         """
@@ -87,13 +158,32 @@ class Xhshow:
         Returns:
             str: Base64 encoded signature
         """
-        payload_array = self.crypto_processor.build_payload_array(
-            d_value, a1_value, xsec_appid, string_param, timestamp
-        )
+        return self._build_signature_bytes(
+            bytes.fromhex(d_value), a1_value, xsec_appid, len(string_param), timestamp
+        ).decode("utf-8")
 
-        xor_result = self.crypto_processor.bit_ops.xor_transform_array(payload_array)
+    def _build_signature_bytes(
+        self,
+        md5_digest: bytes,
+        a1_value: str,
+        xsec_appid: str,
+        content_length: int,
+        timestamp: float | None,
+    ) -> bytes:
+        """
+        Build signature without leaving bytes
+
+        Args:
+            md5_digest: Raw MD5 digest of the content string
+            a1_value: a1 value from cookies
+            xsec_appid: Application identifier
+            content_length: Length of the content string
+            timestamp: Unix timestamp in seconds (defaults to current time)
 
-        return self.crypto_processor.b64encoder.encode_x3(xor_result[:124])
+        Returns:
+            bytes: Base64 encoded signature (X3 alphabet)
+        """
+        return self.crypto_processor.build_x3_bytes(md5_digest, a1_value, xsec_appid, content_length, timestamp)
 
     @validate_signature_params
     def sign_xs(
@@ -128,36 +218,270 @@ class Xhshow:
             TypeError: Parameter type error
             ValueError: Parameter value error
         """
-        uri = extract_uri(uri)
+        return self._sign_xs_core(method, extract_uri(uri), a1_value, xsec_appid, payload, timestamp)
 
-        signature_data = self.crypto_processor.config.SIGNATURE_DATA_TEMPLATE.copy()
+    def _sign_xs_core(
+        self,
+        method: str,
+        uri: str,
+        a1_value: str,
+        xsec_appid: str,
+        payload: dict[str, Any] | None,
+        timestamp: float | None,
+    ) -> str:
+        """
+        Generate request signature from already validated parameters
 
-        content_string = self._build_content_string(method, uri, payload)
+        Args:
+            method: Upper-case request method ("GET" or "POST")
+            uri: Request URI path (already extracted from the URL)
+            a1_value: a1 value from cookies
+            xsec_appid: Application identifier
+            payload: Request parameters
+            timestamp: Unix timestamp in seconds (defaults to current time)
 
-        d_value = self._generate_d_value(content_string)
-        signature_data["x3"] = self.crypto_processor.config.X3_PREFIX + self._build_signature(
-            d_value, a1_value, xsec_appid, content_string, timestamp
-        )
-        return self.crypto_processor.config.XYS_PREFIX + self.crypto_processor.b64encoder.encode(
-            json.dumps(signature_data, separators=(",", ":"), ensure_ascii=False)
+        Returns:
+            str: Complete signature string
+        """
+        return self._sign_xs_core_bytes(method, uri, a1_value, xsec_appid, payload, timestamp).decode("utf-8")
+
+    def _sign_xs_core_bytes(
+        self,
+        method: str,
+        uri: str,
+        a1_value: str,
+        xsec_appid: str,
+        payload: dict[str, Any] | None,
+        timestamp: float | None,
+    ) -> bytes:
+        """
+        Generate request signature as bytes from already validated parameters
+
+        The MD5 digest reuses the per-endpoint prefix state; MD5, payload, XOR, x3 Base64
+        and the precompiled signature data envelope all operate on bytes.
+
+        Args:
+            method: Upper-case request method ("GET" or "POST")
+            uri: Request URI path (already extracted from the URL)
+            a1_value: a1 value from cookies
+            xsec_appid: Application identifier
+            payload: Request parameters
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            bytes: Complete signature as ASCII bytes
+        """
+        content_length, md5_digest = self._digest_content(method, uri, payload)
+        return self._sign_digest(md5_digest, content_length, a1_value, xsec_appid, timestamp)
+
+    def _sign_digest(
+        self,
+        md5_digest: bytes,
+        content_length: int,
+        a1_value: str,
+        xsec_appid: str,
+        timestamp: float | None,
+    ) -> bytes:
+        """
+        Generate request signature from a content digest
+
+        Args:
+            md5_digest: Raw MD5 digest of the content string
+            content_length: Length of the content string
+            a1_value: a1 value from cookies
+            xsec_appid: Application identifier
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            bytes: Complete signature as ASCII bytes
+        """
+        verifier = self._verifier
+        if verifier is None or not verifier.sample():
+            x3 = self._build_signature_bytes(md5_digest, a1_value, xsec_appid, content_length, timestamp)
+            return self._envelope.wrap(x3)
+
+        if timestamp is None:
+            timestamp = time.time()
+        x3 = self._build_signature_bytes(md5_digest, a1_value, xsec_appid, content_length, timestamp)
+        signature = self._envelope.wrap(x3)
+        verifier.check(signature, md5_digest, content_length, a1_value, xsec_appid, timestamp)
+        return signature
+
+    def _sign_digests(self, entries: list[tuple[bytes, int, str, str]], timestamp: float) -> list[bytes]:
+        """
+        Generate signatures for a batch of content digests
+
+        Batches of at least `NUMPY_BATCH_THRESHOLD` entries are assembled into
+        one payload matrix and XORed/encoded with the NumPy backend when it is installed.
+
+        Args:
+            entries: `(md5_digest, content_length, a1_value, xsec_appid)` per request
+            timestamp: Unix timestamp in seconds shared by the batch
+
+        Returns:
+            list[bytes]: Complete signatures as ASCII bytes, in the order of `entries`
+        """
+        batch_encoder = self._get_batch_encoder(len(entries))
+        if batch_encoder is None:
+            return [self._sign_digest(*entry, timestamp) for entry in entries]
+        rows = self.crypto_processor.build_payload_rows(entries, timestamp)
+        return self._encode_payload_rows(batch_encoder, rows, entries, timestamp)
+
+    def _get_batch_encoder(self, count: int) -> NumpyBatchEncoder | None:
+        """Get the NumPy batch encoder for a batch of `count` requests, None below the threshold or when unavailable"""
+        threshold = self.config.NUMPY_BATCH_THRESHOLD
+        if not threshold or count < threshold:
+            return None
+        if not self._batch_encoder_resolved:
+            self._batch_encoder = get_batch_encoder(self.config)
+            self._batch_encoder_resolved = True
+        return self._batch_encoder
+
+    def _encode_payload_rows(
+        self,
+        batch_encoder: NumpyBatchEncoder,
+        rows: tuple[bytearray, bytearray, bytearray],
+        entries: list[tuple[bytes, int, str, str]],
+        timestamp: float,
+    ) -> list[bytes]:
+        """
+        Encode payload rows built by `CryptoProcessor.build_payload_rows` into signatures
+
+        Args:
+            batch_encoder: NumPy batch encoder
+            rows: (templates, numeric blocks, checksum seeds), one record per entry
+            entries: `(md5_digest, content_length, a1_value, xsec_appid)` per request
+            timestamp: Unix timestamp in seconds shared by the batch
+
+        Returns:
+            list[bytes]: Complete signatures as ASCII bytes, in the order of `entries`
+        """
+        x3_rows = batch_encoder.build_x3_rows(*rows, self.crypto_processor.layout)
+        signatures = batch_encoder.wrap_rows(x3_rows, self._envelope)
+        verifier = self._verifier
+        if verifier is not None:
+            for signature, entry in zip(signatures, entries, strict=True):
+                if verifier.sample():
+                    verifier.check(signature, *entry, timestamp)
+        return signatures
+
+    def _digest_content(self, method: str, uri: str, payload: dict[str, Any] | None) -> tuple[int, bytes]:
+        """
+        Compute content string length and MD5 digest, using the content cache when enabled
+
+        POST bodies are streamed into MD5 when `POST_DIGEST_STREAMING` is enabled.
+
+        Args:
+            method: Upper-case request method ("GET" or "POST")
+            uri: Request URI path
+            payload: Request parameters
+
+        Returns:
+            tuple[int, bytes]: (content string length, raw MD5 digest)
+        """
+        digester = self.content_digester
+        key = canonical_request_key(method, uri, payload) if digester.content_cache.maxsize else None
+        if key is not None:
+            cached = digester.content_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if method == "POST" and self.config.POST_DIGEST_STREAMING:
+            result = digester.digest_json(uri, payload or {})
+        else:
+            result = digester.digest(uri, *self._build_content_parts(method, payload))
+        if key is not None:
+            digester.content_cache.put(key, result)
+        return result
+
+    @validate_signature_params
+    def sign_xs_bytes(
+        self,
+        method: Literal["GET", "POST"],
+        uri: str,
+        a1_value: str,
+        xsec_appid: str = "xhs-pc-web",
+        payload: dict[str, Any] | None = None,
+        timestamp: float | None = None,
+    ) -> bytes:
+        """
+        Generate request signature as ASCII bytes
+
+        Same as `sign_xs`, for HTTP clients that accept bytes header values.
+
+        Args:
+            method: Request method ("GET" or "POST")
+            uri: Request URI or full URL
+            a1_value: a1 value from cookies
+            xsec_appid: Application identifier, defaults to `xhs-pc-web`
+            payload: Request parameters
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            bytes: Complete signature
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+        """
+        return self._sign_xs_core_bytes(method, extract_uri(uri), a1_value, xsec_appid, payload, timestamp)
+
+    def template(
+        self,
+        method: Literal["GET", "POST"],
+        uri: str,
+        xsec_appid: str = "xhs-pc-web",
+    ) -> RequestTemplate:
+        """
+        Create a validate-once request template for a hot endpoint
+
+        Method, URI (including URI extraction) and xsec_appid are validated
+        once; the template's `sign` only checks the a1 value and parameters.
+
+        Args:
+            method: Request method ("GET" or "POST")
+            uri: Request URI or full URL
+            xsec_appid: Application identifier, defaults to `xhs-pc-web`
+
+        Returns:
+            RequestTemplate: Template bound to this client
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+
+        Examples:
+            >>> client = Xhshow()
+            >>> user_posted = client.template("GET", "/api/sns/web/v1/user_posted")
+            >>> x_s = user_posted.sign("your_a1_value", {"num": "30"})
+        """
+        validator = RequestSignatureValidator
+        return RequestTemplate(
+            self,
+            validator.validate_method(method),
+            extract_uri(validator.validate_uri(uri)),
+            validator.validate_xsec_appid(xsec_appid),
         )
 
     def sign_xs_common(
         self,
         cookie_dict: dict[str, Any] | str,
+        timestamp: float | None = None,
     ) -> str:
         """
         Generate x-s-common signature
 
+        With `CryptoConfig.XS_COMMON_CACHE_SIZE` set, the signature of a
+        cookie jar is reused for `XS_COMMON_CACHE_TTL` seconds.
+
         Args:
             cookie_dict: Complete cookie dictionary or cookie string
+            timestamp: Unix timestamp in seconds used by the fingerprint (defaults to current time)
 
         Returns:
             Encoded x-s-common signature string
         """
-        parsed_cookies = self._parse_cookies(cookie_dict)
-        signer = XsCommonSigner(self.config)
-        return signer.sign(parsed_cookies)
+        return self._xs_common_signer.sign(self._parse_cookies(cookie_dict), timestamp)
 
     @validate_get_signature_params
     def sign_xs_get(
@@ -256,7 +580,22 @@ class Xhshow:
             x3_signature = x3_signature[len(self.config.X3_PREFIX) :]
 
         decoded_bytes = self.crypto_processor.b64encoder.decode_x3(x3_signature)
-        return self.crypto_processor.bit_ops.xor_transform_array(list(decoded_bytes))
+        return bytearray(self.crypto_processor.bit_ops.xor_transform_bytes(decoded_bytes))
+
+    def parse_x3(self, x3_signature: str) -> X3Payload:
+        """
+        Decode x3 signature into named payload fields
+
+        Args:
+            x3_signature: x3 signature string (can include or exclude prefix)
+
+        Returns:
+            X3Payload: Version, seed, timestamps, sequence, lengths, MD5 prefix, a1, source and checksum
+
+        Raises:
+            ValueError: Invalid signature format
+        """
+        return X3Parser.shared(self.config).parse(x3_signature)
 
     def decode_xs(self, xs_signature: str) -> dict[str, Any]:
         """
@@ -315,7 +654,45 @@ class Xhshow:
             >>> client.build_json_body({"username": "test", "password": "123456"})
             '{"username":"test","password":"123456"}'
         """
-        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        return self.serializer.dumps(payload)
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Get usage statistics of the client caches
+
+        Returns:
+            dict: Cache name to statistics (hits, misses, evictions, size, maxsize)
+
+        Examples:
+            >>> client = Xhshow()
+            >>> client.cache_stats()["md5_prefix"]
+            CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=64)
+        """
+        return {
+            "md5_prefix": self.content_digester.prefix_cache.stats(),
+            "content": self.content_digester.content_cache.stats(),
+            "payload_template": self.crypto_processor.template_cache.stats(),
+            "xs_common": self._xs_common_signer.cache.stats(),
+        }
+
+    def verify_stats(self) -> VerifyStats:
+        """
+        Get sampled self-verification statistics
+
+        Verification is enabled by `CryptoConfig.SELF_VERIFY_RATE`; mismatches
+        are also reported to the `on_verify_mismatch` callback.
+
+        Returns:
+            VerifyStats: Sampled, checked, skipped and mismatching signature counts (all 0 when disabled)
+
+        Examples:
+            >>> client = Xhshow(CryptoConfig().with_overrides(SELF_VERIFY_RATE=0.01), on_verify_mismatch=print)
+            >>> client.verify_stats().mismatches
+            0
+        """
+        if self._verifier is None:
+            return VerifyStats(0, 0, 0, 0)
+        return self._verifier.stats()
 
     def get_b3_trace_id(self) -> str:
         """
@@ -459,19 +836,112 @@ class Xhshow:
             raise ValueError("Missing 'a1' in cookies")
 
         x_s = self.sign_xs(method_upper, uri, a1_value, xsec_appid, request_data, timestamp)
-        x_s_common = self.sign_xs_common(cookie_dict)
-        x_t = self.get_x_t(timestamp)
-        x_b3_traceid = self.get_b3_trace_id()
-        x_xray_traceid = self.get_xray_trace_id(timestamp=int(timestamp * 1000))
+        x_s_common = self.sign_xs_common(cookie_dict, timestamp)
+
+        return self._assemble_headers(x_s, x_s_common, timestamp)
+
+    def _assemble_headers(self, x_s: str, x_s_common: str, timestamp: float) -> dict[str, str]:
+        """
+        Assemble signed headers with trace IDs
 
+        Args:
+            x_s: x-s signature
+            x_s_common: x-s-common signature
+            timestamp: Unix timestamp in seconds used for x-t and x-xray-traceid
+
+        Returns:
+            dict: Complete headers including x-s, x-s-common, x-t, x-b3-traceid, x-xray-traceid
+        """
+        timestamp_ms = int(timestamp * 1000)
         return {
             "x-s": x_s,
             "x-s-common": x_s_common,
-            "x-t": str(x_t),
-            "x-b3-traceid": x_b3_traceid,
-            "x-xray-traceid": x_xray_traceid,
+            "x-t": str(timestamp_ms),
+            "x-b3-traceid": self.random_generator.generate_b3_trace_id(),
+            "x-xray-traceid": self.random_generator.generate_xray_trace_id(timestamp_ms),
         }
 
+    def prepare_request(
+        self,
+        method: Literal["GET", "POST"],
+        url: str,
+        cookies: dict[str, Any] | str,
+        xsec_appid: str = "xhs-pc-web",
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        timestamp: float | None = None,
+    ) -> SignedRequest:
+        """
+        Prepare a signed request: final URL, body bytes and headers
+
+        POST bodies are serialized once; the same bytes are hashed for the
+        signature and returned for sending.
+
+        Args:
+            method: Request method ("GET" or "POST")
+            url: Full request URL
+            cookies: Complete cookie dictionary or cookie string
+            xsec_appid: Application identifier, defaults to `xhs-pc-web`
+            params: GET request parameters (only used when method="GET")
+            payload: POST request body data (only used when method="POST")
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            SignedRequest: Request with `url`, `body` and `headers`
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+
+        Examples:
+            >>> client = Xhshow()
+            >>> request = client.prepare_request(
+            ...     "POST",
+            ...     "https://edith.xiaohongshu.com/api/sns/web/v1/login",
+            ...     cookies={"a1": "your_a1_value", "web_session": "..."},
+            ...     payload={"username": "test"},
+            ... )
+            >>> requests.post(request.url, data=request.body, headers=request.headers)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        validator = RequestSignatureValidator
+        method_upper = validator.validate_method(method)
+        if method_upper == "GET" and payload is not None:
+            raise ValueError("GET requests must use 'params', not 'payload'")
+        if method_upper == "POST" and params is not None:
+            raise ValueError("POST requests must use 'payload', not 'params'")
+
+        url = validator.validate_uri(url)
+        uri = extract_uri(url)
+        xsec_appid = validator.validate_xsec_appid(xsec_appid)
+        request_data = validator.validate_payload(params if method_upper == "GET" else payload)
+        cookie_dict, a1_value = self._parse_cookie_state(cookies)
+
+        if method_upper == "POST":
+            body = self.serializer.dumps_bytes(request_data or {})
+            body_length = len(body) if body.isascii() else len(body.decode("utf-8"))
+            content_length, md5_digest = self.content_digester.digest_bytes(
+                uri, "{", memoryview(body)[1:], body_length - 1
+            )
+            x_s = self._sign_digest(md5_digest, content_length, a1_value, xsec_appid, timestamp)
+        else:
+            # The query string is encoded once for both the signature and the URL
+            body = None
+            query_string = encode_query(request_data)
+            content_length, md5_digest = self.content_digester.digest(uri, "?" if query_string else "", query_string)
+            x_s = self._sign_digest(md5_digest, content_length, a1_value, xsec_appid, timestamp)
+            url = append_query(url, query_string)
+
+        x_s_common = self._xs_common_signer.sign(cookie_dict, timestamp)
+        return SignedRequest(
+            method_upper,
+            url,
+            body,
+            self._assemble_headers(x_s.decode("utf-8"), x_s_common, timestamp),
+        )
+
     def sign_headers_get(
         self,
         uri: str,
@@ -535,3 +1005,222 @@ class Xhshow:
             ... )
         """
         return self.sign_headers("POST", uri, cookies, xsec_appid, payload=payload, timestamp=timestamp)
+
+    def sign_xs_many(
+        self,
+        specs: Iterable[RequestSpec | tuple],
+        timestamp: float | None = None,
+    ) -> list[str]:
+        """
+        Generate x-s signatures for a batch of requests
+
+        URI extraction is memoized across the batch and all signatures share
+        one timestamp.
+
+        Args:
+            specs: Request specs `(method, uri, a1_value, data[, xsec_appid])`,
+                where data is the GET params or POST payload
+            timestamp: Unix timestamp in seconds shared by the batch (defaults to current time)
+
+        Returns:
+            list[str]: Signatures in the order of `specs`
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+
+        Examples:
+            >>> client = Xhshow()
+            >>> signatures = client.sign_xs_many([
+            ...     ("GET", "/api/sns/web/v1/user_posted", "your_a1_value", {"num": "30"}),
+            ...     ("POST", "/api/sns/web/v1/login", "your_a1_value", {"username": "test"}),
+            ... ])
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        validator = RequestSignatureValidator
+        context = SigningContext()
+        entries = []
+        for spec in specs:
+            spec = spec if isinstance(spec, RequestSpec) else RequestSpec(*spec)
+            method = validator.validate_method(spec.method)
+            uri = context.resolve_uri(spec.uri)
+            a1_value = validator.validate_a1_value(spec.credential)
+            xsec_appid = validator.validate_xsec_appid(spec.xsec_appid)
+            content_length, md5_digest = self._digest_content(method, uri, validator.validate_payload(spec.data))
+            entries.append((md5_digest, content_length, a1_value, xsec_appid))
+
+        return [signature.decode("utf-8") for signature in self._sign_digests(entries, timestamp)]
+
+    def sign_headers_many(
+        self,
+        specs: Iterable[RequestSpec | tuple],
+        timestamp: float | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        Generate complete request headers for a batch of requests
+
+        Cookie parsing is done once per distinct cookie jar in the batch, URI
+        extraction is memoized and all headers share one timestamp. Random values
+        are drawn in the same order as a `sign_headers` loop, so a seeded client
+        produces the same headers either way.
+
+        Args:
+            specs: Request specs `(method, uri, cookies, data[, xsec_appid])`,
+                where data is the GET params or POST payload
+            timestamp: Unix timestamp in seconds shared by the batch (defaults to current time)
+
+        Returns:
+            list[dict]: Headers in the order of `specs`, each including
+                x-s, x-s-common, x-t, x-b3-traceid, x-xray-traceid
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+
+        Examples:
+            >>> client = Xhshow()
+            >>> cookies = {"a1": "your_a1_value", "web_session": "..."}
+            >>> headers_list = client.sign_headers_many([
+            ...     ("GET", "/api/sns/web/v1/user_posted", cookies, {"num": "30"}),
+            ...     ("POST", "/api/sns/web/v1/login", cookies, {"username": "test"}),
+            ... ])
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        validator = RequestSignatureValidator
+        context = SigningContext()
+        specs = [spec if isinstance(spec, RequestSpec) else RequestSpec(*spec) for spec in specs]
+        batch_encoder = self._get_batch_encoder(len(specs))
+        rows = (bytearray(), bytearray(), bytearray())
+        entries = []
+        headers_list = []
+
+        # Per request: x-s fields, then x-s-common, then trace IDs (same order as `sign_headers`)
+        for spec in specs:
+            cookie_dict, a1_value = context.cookie_state(spec.credential, self._parse_cookie_state)
+            method = validator.validate_method(spec.method)
+            uri = context.resolve_uri(spec.uri)
+            xsec_appid = validator.validate_xsec_appid(spec.xsec_appid)
+            content_length, md5_digest = self._digest_content(method, uri, validator.validate_payload(spec.data))
+            entry = (md5_digest, content_length, a1_value, xsec_appid)
+            if batch_encoder is None:
+                x_s = self._sign_digest(*entry, timestamp).decode("utf-8")
+            else:
+                # Only the random fields are drawn here, the rows are encoded together below
+                self.crypto_processor.append_payload_row(rows, *entry, timestamp)
+                entries.append(entry)
+                x_s = ""
+            x_s_common = self._xs_common_signer.sign(cookie_dict, timestamp)
+            headers_list.append(self._assemble_headers(x_s, x_s_common, timestamp))
+
+        if batch_encoder is not None:
+            signatures = self._encode_payload_rows(batch_encoder, rows, entries, timestamp)
+            for headers, signature in zip(headers_list, signatures, strict=True):
+                headers["x-s"] = signature.decode("utf-8")
+        return headers_list
+
+    def sign_iter(
+        self,
+        specs: Iterable[RequestSpec | tuple],
+        chunk_size: int | None = None,
+        timestamp: float | None = None,
+    ) -> Iterator[dict[str, str]] | Iterator[list[dict[str, str]]]:
+        """
+        Lazily generate request headers for a (possibly unbounded) stream of requests
+
+        Specs are consumed one at a time and signed with a single signing
+        context, so memory stays bounded regardless of the stream length.
+
+        Args:
+            specs: Iterable of request specs `(method, uri, cookies, data[, xsec_appid])`
+            chunk_size: If set, yield lists of up to `chunk_size` headers instead of single headers
+            timestamp: Unix timestamp in seconds shared by all requests
+                (defaults to the current time of each request)
+
+        Returns:
+            Iterator: Headers dicts, or lists of headers dicts when `chunk_size` is set
+
+        Raises:
+            ValueError: chunk_size is not a positive integer
+
+        Examples:
+            >>> client = Xhshow()
+            >>> cookies = {"a1": "your_a1_value", "web_session": "..."}
+            >>> specs = (("GET", "/api/sns/web/v1/user_posted", cookies, {"cursor": str(i)}) for i in range(10**6))
+            >>> for batch in client.sign_iter(specs, chunk_size=100):
+            ...     send(batch)
+        """
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+
+        signed = self._sign_stream(specs, timestamp)
+        if chunk_size is None:
+            return signed
+        return iter(lambda: list(islice(signed, chunk_size)), [])
+
+    def _sign_stream(
+        self,
+        specs: Iterable[RequestSpec | tuple],
+        timestamp: float | None,
+    ) -> Iterator[dict[str, str]]:
+        """Sign request specs lazily with one shared signing context"""
+        context = SigningContext()
+        for spec in specs:
+            yield self._sign_spec_headers(spec, context, time.time() if timestamp is None else timestamp)
+
+    def _sign_spec_headers(
+        self,
+        spec: RequestSpec | tuple,
+        context: SigningContext,
+        timestamp: float,
+    ) -> dict[str, str]:
+        """
+        Generate complete request headers for one request spec
+
+        Args:
+            spec: Request spec `(method, uri, cookies, data[, xsec_appid])`
+            context: Signing context shared with the other requests
+            timestamp: Unix timestamp in seconds
+
+        Returns:
+            dict: Complete headers including x-s, x-s-common, x-t, x-b3-traceid, x-xray-traceid
+        """
+        validator = RequestSignatureValidator
+        spec = spec if isinstance(spec, RequestSpec) else RequestSpec(*spec)
+
+        # Only the parsed cookies are memoized: x-s-common embeds the signing time
+        # and goes through the signer (and its TTL cache) for every request
+        cookie_dict, a1_value = context.cookie_state(spec.credential, self._parse_cookie_state)
+        x_s = self._sign_xs_core(
+            validator.validate_method(spec.method),
+            context.resolve_uri(spec.uri),
+            a1_value,
+            validator.validate_xsec_appid(spec.xsec_appid),
+            validator.validate_payload(spec.data),
+            timestamp,
+        )
+        return self._assemble_headers(x_s, self._xs_common_signer.sign(cookie_dict, timestamp), timestamp)
+
+    def _parse_cookie_state(self, cookies: dict[str, Any] | str) -> tuple[dict[str, Any], str]:
+        """
+        Parse cookies and extract the validated a1 value
+
+        Args:
+            cookies: Complete cookie dictionary or cookie string
+
+        Returns:
+            tuple: (parsed cookie dict, validated a1 value)
+
+        Raises:
+            ValueError: Missing 'a1' in cookies
+        """
+        cookie_dict = self._parse_cookies(cookies)
+
+        a1_value = cookie_dict.get("a1")
+        if not a1_value:
+            raise ValueError("Missing 'a1' in cookies")
+
+        return cookie_dict, RequestSignatureValidator.validate_a1_value(a1_value)
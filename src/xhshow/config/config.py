@@ -100,6 +100,30 @@ class CryptoConfig:
         }
     )
 
+    # JSON serializer backend: "auto", "json" or "orjson"
+    JSON_SERIALIZER: str = "auto"
+
+    # Cache sizes (0 disables the cache)
+    MD5_PREFIX_CACHE_SIZE: int = 64
+    CONTENT_CACHE_SIZE: int = 0
+    PAYLOAD_TEMPLATE_CACHE_SIZE: int = 1024
+
+    # x-s-common cache per cookie jar (0 disables) and entry lifetime in seconds
+    XS_COMMON_CACHE_SIZE: int = 0
+    XS_COMMON_CACHE_TTL: float = 300.0
+
+    # Streaming POST body digest (avoids materializing large content strings)
+    POST_DIGEST_STREAMING: bool = False
+    DIGEST_OFFLOAD_CHUNK_SIZE: int = 65536
+
+    # Batches with at least this many signatures use the NumPy backend when installed (0 disables)
+    NUMPY_BATCH_THRESHOLD: int = 64
+
+    # Sampled self-verification: fraction of x-s values decoded and compared with their inputs (0 disables),
+    # and the maximum number of checks per second (0 for no limit)
+    SELF_VERIFY_RATE: float = 0.0
+    SELF_VERIFY_MAX_PER_SECOND: int = 0
+
     PUBLIC_USERAGENT: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/142.0.0.0 Safari/537.36 Edg/142.0.0.0"
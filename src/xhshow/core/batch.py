@@ -0,0 +1,109 @@
+"""Batch signing helpers"""
+
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+from ..utils.url_utils import extract_uri
+from ..utils.validators import RequestSignatureValidator
+
+__all__ = ["RequestSpec", "SigningContext"]
+
+
+class RequestSpec(NamedTuple):
+    """
+    Request specification accepted by the batch signing APIs
+
+    Plain tuples with the same layout are accepted as well.
+
+    Attributes:
+        method: Request method ("GET" or "POST")
+        uri: Request URI or full URL
+        credential: a1 value for `sign_xs_many`, complete cookies (dict or string)
+            for `sign_headers_many` / `sign_iter`
+        data: GET params or POST payload
+        xsec_appid: Application identifier, defaults to `xhs-pc-web`
+    """
+
+    method: str
+    uri: str
+    credential: Any
+    data: dict[str, Any] | None = None
+    xsec_appid: str = "xhs-pc-web"
+
+
+class SigningContext:
+    """
+    State shared across the requests of one batch
+
+    Memoizes work that only depends on values repeated between requests:
+    URI validation and extraction, and per cookie jar state built by the
+    caller (parsed cookies and a1 value). Each memo is bounded by
+    `max_entries` so the context can also back unbounded request streams.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._uris: dict[str, str] = {}
+        self._cookie_states: dict[Hashable, Any] = {}
+
+    def resolve_uri(self, uri: Any) -> str:
+        """
+        Validate a URI and extract its path, memoized per raw URI
+
+        Args:
+            uri: Request URI or full URL
+
+        Returns:
+            str: URI path without query string
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+        """
+        try:
+            return self._uris[uri]
+        except (KeyError, TypeError):
+            pass
+
+        path = extract_uri(RequestSignatureValidator.validate_uri(uri))
+        if len(self._uris) >= self.max_entries:
+            self._uris.clear()
+        self._uris[uri] = path
+        return path
+
+    def cookie_state(self, cookies: dict[str, Any] | str, factory: Callable[[dict[str, Any] | str], Any]) -> Any:
+        """
+        Return the per cookie jar state, building it with `factory` on first use
+
+        Args:
+            cookies: Complete cookie dictionary or cookie string
+            factory: Callable building the state from the cookies
+
+        Returns:
+            Any: State produced by `factory`
+        """
+        key = self._cookie_key(cookies)
+        if key is None:
+            return factory(cookies)
+
+        state = self._cookie_states.get(key)
+        if state is None:
+            state = factory(cookies)
+            if len(self._cookie_states) >= self.max_entries:
+                self._cookie_states.clear()
+            self._cookie_states[key] = state
+        return state
+
+    @staticmethod
+    def _cookie_key(cookies: dict[str, Any] | str) -> Hashable | None:
+        """Build a hashable key for cookies, or None when they are not hashable"""
+        if isinstance(cookies, str):
+            return cookies
+        if isinstance(cookies, dict):
+            key = tuple(cookies.items())
+            try:
+                hash(key)
+            except TypeError:
+                return None
+            return key
+        return None
@@ -1,30 +1,60 @@
 """x-s-common signature generation"""
 
-import json
+import hashlib
 from typing import Any
 
 from ..config import CryptoConfig
 from ..core.crc32_encrypt import CRC32
 from ..generators.fingerprint import FingerprintGenerator
+from ..utils.cache import TTLCache
 from ..utils.encoder import Base64Encoder
+from ..utils.random_gen import RandomGenerator
+from ..utils.serializer import get_serializer
+from ..utils.shared import intern_config
 
-__all__ = ["XsCommonSigner"]
+__all__ = ["XsCommonSigner", "cookie_digest"]
+
+
+def cookie_digest(cookie_dict: dict[str, Any]) -> bytes:
+    """
+    Digest a parsed cookie dict independently of key order
+
+    Args:
+        cookie_dict: Cookie dictionary
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    canonical = repr(sorted((str(name), str(value)) for name, value in cookie_dict.items()))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
 
 
 class XsCommonSigner:
-    """Generate x-s-common signatures"""
+    """
+    Generate x-s-common signatures
+
+    With `XS_COMMON_CACHE_SIZE` set, signatures are cached per cookie jar
+    (keyed by `cookie_digest`, so cookie values are not kept) for
+    `XS_COMMON_CACHE_TTL` seconds. A cache hit reuses the fingerprint,
+    including its timestamp, and draws no random values.
+    """
 
-    def __init__(self, config: CryptoConfig | None = None):
-        self.config = config or CryptoConfig()
-        self._fp_generator = FingerprintGenerator(self.config)
-        self._encoder = Base64Encoder(self.config)
+    __slots__ = ("config", "cache", "_fp_generator", "_encoder", "_serializer")
 
-    def sign(self, cookie_dict: dict[str, Any]) -> str:
+    def __init__(self, config: CryptoConfig | None = None, random_generator: RandomGenerator | None = None):
+        self.config = intern_config(config)
+        self.cache = TTLCache(self.config.XS_COMMON_CACHE_SIZE, self.config.XS_COMMON_CACHE_TTL)
+        self._fp_generator = FingerprintGenerator(self.config, random_generator)
+        self._encoder = Base64Encoder.shared(self.config)
+        self._serializer = get_serializer(self.config.JSON_SERIALIZER)
+
+    def sign(self, cookie_dict: dict[str, Any], timestamp: float | None = None) -> str:
         """
-        Generate x-s-common signature
+        Generate x-s-common signature, from the cache when enabled
 
         Args:
             cookie_dict: Cookie dictionary (must be dict, not string)
+            timestamp: Unix timestamp in seconds used by the fingerprint (defaults to current time)
 
         Returns:
             x-s-common signature string
@@ -32,9 +62,21 @@ class XsCommonSigner:
         Raises:
             KeyError: If 'a1' cookie is missing
         """
+        if not self.cache.maxsize:
+            return self._sign(cookie_dict, timestamp)
+
+        key = cookie_digest(cookie_dict)
+        xs_common = self.cache.get(key)
+        if xs_common is None:
+            xs_common = self._sign(cookie_dict, timestamp)
+            self.cache.put(key, xs_common)
+        return xs_common
+
+    def _sign(self, cookie_dict: dict[str, Any], timestamp: float | None) -> str:
+        """Generate a fresh x-s-common signature"""
         a1_value = cookie_dict["a1"]
-        fingerprint = self._fp_generator.generate(cookies=cookie_dict, user_agent=self.config.PUBLIC_USERAGENT)
-        b1 = self._fp_generator.generate_b1(fingerprint)
+        # b1 only encrypts 18 fingerprint fields, so the full fingerprint is never built
+        b1 = self._fp_generator.generate_b1(self._fp_generator.generate_b1_fields(timestamp))
 
         x9 = CRC32.crc32_js_int(b1)
 
@@ -43,7 +85,6 @@ class XsCommonSigner:
         sign_struct["x8"] = b1
         sign_struct["x9"] = x9
 
-        sign_json = json.dumps(sign_struct, separators=(",", ":"), ensure_ascii=False)
-        xs_common = self._encoder.encode(sign_json)
+        xs_common = self._encoder.encode(self._serializer.dumps_bytes(sign_struct))
 
         return xs_common
@@ -13,7 +13,9 @@ where `c` is the intermediate CRC state produced by the core CRC32 loop.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+
+from ..utils.backends import get_backend, selected_backend
 
 DataLike = str | bytes | bytearray | memoryview | Iterable[int]
 __all__ = ["CRC32"]
@@ -25,6 +27,7 @@ class CRC32:
     MASK32: int = 0xFFFFFFFF
     POLY: int = 0xEDB88320
     _TABLE: list[int] | None = None
+    _BACKENDS: dict[str, Callable[[bytes], int]] = {}
 
     @classmethod
     def _ensure_table(cls) -> None:
@@ -78,6 +81,38 @@ class CRC32:
 
         return c
 
+    @staticmethod
+    def _to_bytes(data: DataLike, string_mode: str = "js") -> bytes:
+        """
+        Convert input to the byte sequence fed to the CRC32 core.
+
+        Args:
+            data: Input data (str/bytes/iterable of ints).
+            string_mode: How to treat string input ("js" or "utf8").
+
+        Returns:
+            Bytes with the same interpretation as ``_crc32_core``.
+        """
+        if isinstance(data, bytes | bytearray | memoryview):
+            return bytes(data)
+        if isinstance(data, str):
+            if string_mode.lower() == "utf8":
+                return data.encode("utf-8")
+            try:
+                return data.encode("latin-1")
+            except UnicodeEncodeError:
+                return bytes(ord(ch) & 0xFF for ch in data)
+        return bytes((int(b) & 0xFF) for b in data)
+
+    @classmethod
+    def _backend(cls) -> Callable[[bytes], int]:
+        """Get the selected ``crc32`` backend, built once per backend name."""
+        name = selected_backend("crc32")
+        backend = cls._BACKENDS.get(name)
+        if backend is None:
+            backend = cls._BACKENDS[name] = get_backend("crc32", name)()
+        return backend
+
     @staticmethod
     def _to_signed32(u: int) -> int:
         """
@@ -106,7 +141,9 @@ class CRC32:
 
             (-1 ^ c ^ 0xEDB88320) >>> 0
 
-        where `c` is the intermediate CRC state from `_crc32_core`.
+        where `c` is the intermediate CRC state from `_crc32_core`. The
+        value is computed by the selected ``crc32`` backend (``zlib.crc32``
+        by default, see ``xhshow.utils.backends``).
 
         Args:
             data: Input data (str/bytes/iterable of ints).
@@ -118,7 +155,5 @@ class CRC32:
         Returns:
             CRC32 value as 32-bit integer (signed or unsigned).
         """
-        c = cls._crc32_core(data, string_mode=string_mode)
-        a = cls.POLY
-        u = ((cls.MASK32 ^ c) ^ a) & cls.MASK32  # (-1 ^ c ^ a) >>> 0
+        u = cls._backend()(cls._to_bytes(data, string_mode))
         return cls._to_signed32(u) if signed else u
@@ -1,22 +1,60 @@
 import struct
+import threading
 import time
 
 from ..config import CryptoConfig
 from ..utils.bit_ops import BitOperations
+from ..utils.cache import LRUCache
 from ..utils.encoder import Base64Encoder
 from ..utils.hex_utils import HexProcessor
 from ..utils.random_gen import RandomGenerator
+from ..utils.shared import intern_config
+from .payload_layout import PayloadLayout
 
 __all__ = ["CryptoProcessor"]
 
 
 class CryptoProcessor:
-    def __init__(self, config: CryptoConfig | None = None):
-        self.config = config or CryptoConfig()
-        self.bit_ops = BitOperations(self.config)
-        self.b64encoder = Base64Encoder(self.config)
-        self.hex_processor = HexProcessor(self.config)
-        self.random_gen = RandomGenerator()
+    __slots__ = (
+        "config",
+        "bit_ops",
+        "b64encoder",
+        "hex_processor",
+        "random_gen",
+        "layout",
+        "_buffers",
+        "template_cache",
+        "_numeric_end",
+        "_numeric_key",
+        "_checksum_seed_key",
+        "_payload_field_bounds",
+    )
+
+    def __init__(self, config: CryptoConfig | None = None, random_generator: RandomGenerator | None = None):
+        # Encoders, XOR key material and the layout are shared by all processors with an equal config
+        self.config = intern_config(config)
+        self.bit_ops = BitOperations.shared(self.config)
+        self.b64encoder = Base64Encoder.shared(self.config)
+        self.hex_processor = HexProcessor.shared(self.config)
+        self.random_gen = random_generator or RandomGenerator()
+        self.layout = PayloadLayout.shared(self.config)
+        self._buffers = threading.local()
+        self.template_cache = LRUCache(self.config.PAYLOAD_TEMPLATE_CACHE_SIZE)
+
+        # Key material for the variable payload fields of pre-XORed templates
+        key_bytes = self.bit_ops._key_bytes
+        numeric_start = self.layout.numeric_offset
+        self._numeric_end = numeric_start + self.layout.numeric.size
+        self._numeric_key = int.from_bytes(key_bytes[numeric_start : self._numeric_end], "little")
+        self._checksum_seed_key = key_bytes[self.layout["checksum_seed"].offset]
+
+        # Random payload fields drawn together: seed, time offset, sequence, window props length
+        self._payload_field_bounds = (
+            (0, self.config.MAX_32BIT),
+            (self.config.ENV_FINGERPRINT_TIME_OFFSET_MIN, self.config.ENV_FINGERPRINT_TIME_OFFSET_MAX),
+            (self.config.SEQUENCE_VALUE_MIN, self.config.SEQUENCE_VALUE_MAX),
+            (self.config.WINDOW_PROPS_LENGTH_MIN, self.config.WINDOW_PROPS_LENGTH_MAX),
+        )
 
     def _int_to_le_bytes(self, val: int, length: int = 4) -> list[int]:
         """Convert integer to little-endian byte array"""
@@ -33,18 +71,22 @@ class CryptoProcessor:
 
     def env_fingerprint_a(self, ts: int, xor_key: int) -> list[int]:
         """Generate environment fingerprint A with checksum"""
-        data = bytearray(struct.pack("<Q", ts))
+        return list(self._env_fingerprint_a_bytes(ts, xor_key))
+
+    def _env_fingerprint_a_bytes(self, ts: int, xor_key: int) -> bytes:
+        """Generate environment fingerprint A with checksum as bytes"""
+        return self._env_fingerprint_a_int(ts, xor_key).to_bytes(8, "little")
+
+    def _env_fingerprint_a_int(self, ts: int, xor_key: int) -> int:
+        """Generate environment fingerprint A with checksum as a little-endian 64-bit integer"""
+        data = struct.pack("<Q", ts)
 
         sum1 = sum(data[1:5])
         sum2 = sum(data[5:8])
 
         mark = ((sum1 & 0xFF) + sum2) & 0xFF
-        data[0] = mark
 
-        for i in range(len(data)):
-            data[i] ^= xor_key
-
-        return list(data)
+        return ((ts & ~0xFF) | mark) ^ (xor_key * 0x0101010101010101)
 
     def env_fingerprint_b(self, ts: int) -> list[int]:
         """Generate simple environment fingerprint B (no encryption)"""
@@ -71,70 +113,207 @@ class CryptoProcessor:
         Returns:
             list[int]: Complete payload byte array (124 bytes)
         """
-        payload = []
+        return list(
+            self.build_payload_bytes(
+                bytes.fromhex(hex_parameter), a1_value, app_identifier, len(string_param), timestamp
+            )
+        )
 
-        payload.extend(self.config.VERSION_BYTES)
+    def build_payload_bytes(
+        self,
+        md5_digest: bytes,
+        a1_value: str,
+        app_identifier: str = "xhs-pc-web",
+        content_length: int = 0,
+        timestamp: float | None = None,
+    ) -> bytearray:
+        """
+        Build payload directly as bytes (same layout as `build_payload_array`)
 
-        seed = self.random_gen.generate_random_int()
-        seed_bytes = self._int_to_le_bytes(seed, 4)
-        payload.extend(seed_bytes)
-        seed_byte_0 = seed_bytes[0]
+        Args:
+            md5_digest (bytes): Raw MD5 digest of the content string
+            a1_value (str): a1 value from cookies
+            app_identifier (str): Application identifier, default "xhs-pc-web"
+            content_length (int): Length of the content string (URI length field)
+            timestamp (float | None): Unix timestamp in seconds (defaults to current time)
 
-        if timestamp is None:
-            timestamp = time.time()
-        payload.extend(self.env_fingerprint_a(int(timestamp * 1000), self.config.ENV_FINGERPRINT_XOR_KEY))
+        Returns:
+            bytearray: Complete payload bytes
+        """
+        return bytearray(self._fill_payload(md5_digest, a1_value, app_identifier, content_length, timestamp))
 
-        time_offset = self.random_gen.generate_random_byte_in_range(
-            self.config.ENV_FINGERPRINT_TIME_OFFSET_MIN,
-            self.config.ENV_FINGERPRINT_TIME_OFFSET_MAX,
+    def build_x3_bytes(
+        self,
+        md5_digest: bytes,
+        a1_value: str,
+        app_identifier: str = "xhs-pc-web",
+        content_length: int = 0,
+        timestamp: float | None = None,
+    ) -> bytes:
+        """
+        Build the x3 signature: payload, key XOR and X3 Base64 encoding
+
+        Args:
+            md5_digest (bytes): Raw MD5 digest of the content string
+            a1_value (str): a1 value from cookies
+            app_identifier (str): Application identifier, default "xhs-pc-web"
+            content_length (int): Length of the content string (URI length field)
+            timestamp (float | None): Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            bytes: Base64 encoded x3 signature (X3 alphabet, without prefix)
+        """
+        layout = self.layout
+        template = self._xored_template(a1_value, app_identifier)
+        numeric_values, seed_byte_0 = self._draw_numeric_fields(md5_digest, content_length, timestamp)
+        numeric_int = int.from_bytes(layout.numeric.pack(*numeric_values), "little") ^ self._numeric_key
+
+        xor_result = bytearray(template)
+        xor_result[layout.numeric_offset : self._numeric_end] = numeric_int.to_bytes(layout.numeric.size, "little")
+        xor_result[layout["checksum_seed"].offset] = (
+            seed_byte_0 ^ self.config.CHECKSUM_XOR_KEY ^ self._checksum_seed_key
         )
-        payload.extend(self.env_fingerprint_b(int((timestamp - time_offset) * 1000)))
+        return self.b64encoder.encode_x3_bytes(xor_result)
+
+    def build_payload_rows(
+        self,
+        entries: list[tuple[bytes, int, str, str]],
+        timestamp: float | None = None,
+    ) -> tuple[bytearray, bytearray, bytearray]:
+        """
+        Build the per-request parts of a batch of payloads as concatenated records
 
-        sequence_value = self.random_gen.generate_random_byte_in_range(
-            self.config.SEQUENCE_VALUE_MIN, self.config.SEQUENCE_VALUE_MAX
+        Args:
+            entries: `(md5_digest, content_length, a1_value, app_identifier)` per request
+            timestamp (float | None): Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            tuple: (pre-XORed templates of `SIGNED_SIZE` bytes, unencrypted numeric blocks
+                of `numeric.size` bytes, checksum seed bytes before key XOR), one record per entry
+        """
+        rows = (bytearray(), bytearray(), bytearray())
+        for entry in entries:
+            self.append_payload_row(rows, *entry, timestamp)
+        return rows
+
+    def append_payload_row(
+        self,
+        rows: tuple[bytearray, bytearray, bytearray],
+        md5_digest: bytes,
+        content_length: int,
+        a1_value: str,
+        app_identifier: str,
+        timestamp: float | None = None,
+    ) -> None:
+        """
+        Draw the random values of one request and append its records to `build_payload_rows` output
+
+        Lets callers interleave other draws from the random generator between requests.
+
+        Args:
+            rows: (templates, numeric blocks, checksum seeds) being built
+            md5_digest (bytes): Raw MD5 digest of the content string
+            content_length (int): Length of the content string (URI length field)
+            a1_value (str): a1 value from cookies
+            app_identifier (str): Application identifier
+            timestamp (float | None): Unix timestamp in seconds (defaults to current time)
+        """
+        templates, numerics, checksum_seeds = rows
+        templates += self._xored_template(a1_value, app_identifier)
+        numeric_values, seed_byte_0 = self._draw_numeric_fields(md5_digest, content_length, timestamp)
+        numerics += self.layout.numeric.pack(*numeric_values)
+        checksum_seeds.append(seed_byte_0 ^ self.config.CHECKSUM_XOR_KEY)
+
+    def _xored_template(self, a1_value: str, app_identifier: str) -> bytes:
+        """Get the pre-XORed payload template for (a1, app identifier) from the template cache"""
+        key = (a1_value, app_identifier)
+        template = self.template_cache.get(key)
+        if template is None:
+            template = self._build_xored_template(a1_value, app_identifier)
+            self.template_cache.put(key, template)
+        return template
+
+    def _build_xored_template(self, a1_value: str, app_identifier: str) -> bytes:
+        """
+        Build the signed payload prefix for one (a1, app identifier) pair, already XORed with the key
+
+        Constant, a1 and source bytes are final; the variable fields hold the
+        raw key bytes (zero XOR key) and are overwritten on every signature.
+        """
+        layout = self.layout
+        buffer = layout.template()
+        self._write_identity(buffer, a1_value, app_identifier)
+        return self.bit_ops.xor_transform_bytes(memoryview(buffer)[: layout.SIGNED_SIZE])
+
+    def _payload_buffer(self) -> bytearray:
+        """Get this thread's reusable payload buffer (constant fields prefilled)"""
+        buffer = getattr(self._buffers, "payload", None)
+        if buffer is None:
+            buffer = self._buffers.payload = self.layout.template()
+        return buffer
+
+    def _fill_payload(
+        self,
+        md5_digest: bytes,
+        a1_value: str,
+        app_identifier: str,
+        content_length: int,
+        timestamp: float | None,
+    ) -> bytearray:
+        """
+        Write the variable payload fields into this thread's reusable buffer
+
+        The returned buffer is overwritten by the next call on the same thread.
+        """
+        config = self.config
+        layout = self.layout
+        buffer = self._payload_buffer()
+
+        numeric_values, seed_byte_0 = self._draw_numeric_fields(md5_digest, content_length, timestamp)
+        layout.numeric.pack_into(buffer, layout.numeric_offset, *numeric_values)
+        self._write_identity(buffer, a1_value, app_identifier)
+        buffer[layout["checksum_seed"].offset] = seed_byte_0 ^ config.CHECKSUM_XOR_KEY
+
+        return buffer
+
+    def _write_identity(self, buffer: bytearray, a1_value: str, app_identifier: str) -> None:
+        """Write the padded a1 and source fields into a payload buffer"""
+        layout = self.layout
+
+        a1_field = layout["a1"]
+        buffer[a1_field.offset : a1_field.end] = a1_value.encode("utf-8")[: a1_field.size].ljust(a1_field.size, b"\x00")
+
+        source_field = layout["source"]
+        buffer[source_field.offset : source_field.end] = app_identifier.encode("utf-8")[: source_field.size].ljust(
+            source_field.size, b"\x00"
+        )
+
+    def _draw_numeric_fields(
+        self, md5_digest: bytes, content_length: int, timestamp: float | None
+    ) -> tuple[tuple[int, ...], int]:
+        """
+        Draw the random payload values and compute the numeric block
+
+        Returns:
+            tuple: Values for `PayloadLayout.numeric` and the low seed byte
+        """
+        config = self.config
+
+        if timestamp is None:
+            timestamp = time.time()
+        seed, time_offset, sequence_value, window_props_length = self.random_gen.generate_fields(
+            self._payload_field_bounds
         )
-        payload.extend(self._int_to_le_bytes(sequence_value, 4))
+        seed_byte_0 = seed & 0xFF
 
-        window_props_length = self.random_gen.generate_random_byte_in_range(
-            self.config.WINDOW_PROPS_LENGTH_MIN, self.config.WINDOW_PROPS_LENGTH_MAX
+        values = (
+            seed,
+            self._env_fingerprint_a_int(int(timestamp * 1000), config.ENV_FINGERPRINT_XOR_KEY),
+            int((timestamp - time_offset) * 1000),
+            sequence_value,
+            window_props_length,
+            content_length & config.MAX_32BIT,
+            # MD5 XOR segment
+            int.from_bytes(md5_digest[:8], "little") ^ (seed_byte_0 * 0x0101010101010101),
         )
-        payload.extend(self._int_to_le_bytes(window_props_length, 4))
-
-        # URI length
-        uri_length = len(string_param)
-        payload.extend(self._int_to_le_bytes(uri_length, 4))
-
-        # MD5 XOR segment
-        md5_bytes = bytes.fromhex(hex_parameter)
-        for i in range(8):
-            payload.append(md5_bytes[i] ^ seed_byte_0)
-
-        # A1 length
-        payload.append(52)
-
-        # A1 content
-        a1_bytes = a1_value.encode("utf-8")
-        if len(a1_bytes) > 52:
-            a1_bytes = a1_bytes[:52]
-        elif len(a1_bytes) < 52:
-            a1_bytes = a1_bytes + b"\x00" * (52 - len(a1_bytes))
-        payload.extend(a1_bytes)
-
-        # Source length
-        payload.append(10)
-
-        # Source content
-        source_bytes = app_identifier.encode("utf-8")
-        if len(source_bytes) > 10:
-            source_bytes = source_bytes[:10]
-        elif len(source_bytes) < 10:
-            source_bytes = source_bytes + b"\x00" * (10 - len(source_bytes))
-        payload.extend(source_bytes)
-
-        payload.append(1)
-
-        payload.append(self.config.CHECKSUM_VERSION)
-        payload.append(seed_byte_0 ^ self.config.CHECKSUM_XOR_KEY)
-        payload.extend(self.config.CHECKSUM_FIXED_TAIL)
-
-        return payload
+        return values, seed_byte_0
@@ -0,0 +1,197 @@
+"""Content digest computation for x-s signatures"""
+
+import json
+import os
+import threading
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ..config import CryptoConfig
+from ..utils.backends import get_backend
+from ..utils.cache import LRUCache
+
+__all__ = ["ContentDigester", "canonical_request_key"]
+
+_SCALAR_TYPES = (str, int, bool, type(None))
+
+# One single-worker pool per calling thread, so concurrent signers do not queue behind one worker
+_hash_workers = threading.local()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Get the calling thread's worker used to hash large streamed chunks"""
+    executor = getattr(_hash_workers, "executor", None)
+    if executor is None:
+        executor = _hash_workers.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xhshow-digest")
+    return executor
+
+
+def _reset_hash_workers_after_fork() -> None:
+    # Worker threads are not copied into a forked child; drop the inherited pools
+    global _hash_workers
+    _hash_workers = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_hash_workers_after_fork)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a request value to a hashable, type-tagged form
+
+    Types are kept in the key because equal values can serialize differently
+    (1 / True / 1.0, 0.0 / -0.0, list / tuple in JSON vs query strings).
+
+    Raises:
+        TypeError: Value type is not supported for canonical keys
+    """
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value_type, value
+    if value_type is float:
+        return float, repr(value)
+    if value_type is dict:
+        return dict, tuple((type(k), k, _freeze(v)) for k, v in value.items())
+    if value_type is list or value_type is tuple:
+        return value_type, tuple(_freeze(v) for v in value)
+    raise TypeError(f"unsupported value type: {value_type.__name__}")
+
+
+def canonical_request_key(method: str, uri: str, payload: dict[str, Any] | None) -> Hashable | None:
+    """
+    Build a canonical hashable key for a request content string
+
+    Key order is preserved since it determines the serialized content.
+
+    Args:
+        method: Upper-case request method ("GET" or "POST")
+        uri: Request URI path
+        payload: Request parameters
+
+    Returns:
+        Hashable | None: Canonical key, or None if the payload holds unsupported types
+    """
+    try:
+        return method, uri, _freeze(payload or {})
+    except TypeError:
+        return None
+
+
+class ContentDigester:
+    """
+    Compute content length and MD5 digest of signature content strings
+
+    A content string is `uri + separator + tail`, where the separator is
+    "?" for GET requests with params, the JSON opening "{" for POST requests
+    and empty otherwise. MD5 states already fed with `uri + separator` are
+    kept per endpoint, so each call copies the state and only hashes the tail.
+
+    An optional content cache (`CONTENT_CACHE_SIZE`) maps canonical requests
+    to their finished (content length, digest) pairs.
+
+    `digest_json` streams POST bodies into MD5 without building the content
+    string; chunks of at least `DIGEST_OFFLOAD_CHUNK_SIZE` bytes are hashed on
+    a worker thread (hashlib releases the GIL on large buffers) while the next
+    chunk is being serialized. Each calling thread gets its own worker, which
+    is recreated in forked child processes.
+
+    MD5 states come from the `md5` backend selected when the digester is
+    created (`hashlib` by default, see `xhshow.utils.backends`). The builtin
+    backend is cheaper for short strings but holds the GIL, so offloaded
+    chunks then no longer overlap with serialization.
+    """
+
+    __slots__ = ("config", "prefix_cache", "content_cache", "_md5")
+
+    def __init__(self, config: CryptoConfig):
+        self.config = config
+        self.prefix_cache = LRUCache(config.MD5_PREFIX_CACHE_SIZE)
+        self.content_cache = LRUCache(config.CONTENT_CACHE_SIZE)
+        self._md5 = get_backend("md5")()
+
+    def digest(self, uri: str, separator: str, tail: str) -> tuple[int, bytes]:
+        """
+        Compute content length and MD5 digest
+
+        Args:
+            uri: Request URI path
+            separator: Endpoint separator ("?", "{" or "")
+            tail: Variable content following the separator
+
+        Returns:
+            tuple[int, bytes]: (content string length, raw MD5 digest)
+        """
+        md5 = self._prefix_state(uri, separator).copy()
+        if tail:
+            md5.update(tail.encode("utf-8"))
+        return len(uri) + len(separator) + len(tail), md5.digest()
+
+    def digest_bytes(
+        self, uri: str, separator: str, tail: bytes | bytearray | memoryview, tail_length: int
+    ) -> tuple[int, bytes]:
+        """
+        Compute content length and MD5 digest from an already encoded tail
+
+        Args:
+            uri: Request URI path
+            separator: Endpoint separator ("?", "{" or "")
+            tail: UTF-8 encoded content following the separator
+            tail_length: Length of the tail as a str (character count)
+
+        Returns:
+            tuple[int, bytes]: (content string length, raw MD5 digest)
+        """
+        md5 = self._prefix_state(uri, separator).copy()
+        md5.update(tail)
+        return len(uri) + len(separator) + tail_length, md5.digest()
+
+    def digest_json(self, uri: str, payload: dict[str, Any]) -> tuple[int, bytes]:
+        """
+        Compute content length and MD5 digest of `uri + json(payload)` by streaming
+
+        Args:
+            uri: Request URI path
+            payload: POST request body data
+
+        Returns:
+            tuple[int, bytes]: (content string length, raw MD5 digest)
+        """
+        md5 = self._prefix_state(uri, "{").copy()
+        chunk_size = self.config.DIGEST_OFFLOAD_CHUNK_SIZE
+        chunks = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).iterencode(payload)
+
+        # The prefix state already covers the JSON opening "{"
+        first = next(chunks)
+        length = len(uri) + len(first)
+        buffer = [first[1:]]
+        buffered = len(first) - 1
+        pending: Future | None = None
+
+        for chunk in chunks:
+            length += len(chunk)
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= chunk_size:
+                data = "".join(buffer).encode("utf-8")
+                buffer.clear()
+                buffered = 0
+                # Keep at most one chunk in flight to bound memory
+                if pending is not None:
+                    pending.result()
+                pending = _get_hash_executor().submit(md5.update, data)
+
+        if pending is not None:
+            pending.result()
+        md5.update("".join(buffer).encode("utf-8"))
+        return length, md5.digest()
+
+    def _prefix_state(self, uri: str, separator: str) -> Any:
+        """Get the MD5 state fed with `uri + separator`, building it on a miss"""
+        key = (uri, separator)
+        state = self.prefix_cache.get(key)
+        if state is None:
+            state = self._md5((uri + separator).encode("utf-8"))
+            self.prefix_cache.put(key, state)
+        return state
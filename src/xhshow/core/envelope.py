@@ -0,0 +1,64 @@
+"""Precompiled XYS signature envelope"""
+
+import json
+
+from ..config import CryptoConfig
+from ..utils.backends import selected_backend
+from ..utils.encoder import Base64Encoder
+from ..utils.shared import shared_instance
+
+__all__ = ["XysEnvelope"]
+
+
+class XysEnvelope:
+    """
+    XYS signature envelope compiled once per config
+
+    The signature data JSON only varies in the x3 Base64 value, which never
+    needs JSON escaping. The JSON is split around that value; the 3-byte
+    aligned part of the constant head is Base64 encoded once, so each call
+    only encodes the head remainder, the x3 value and the constant tail.
+    """
+
+    _MARKER = "\ue000"
+
+    __slots__ = ("config", "_encoder", "encoded_head", "head_rest", "tail")
+
+    def __init__(self, config: CryptoConfig, encoder: Base64Encoder | None = None):
+        self.config = config
+        self._encoder = encoder or Base64Encoder.shared(config)
+
+        signature_data = config.SIGNATURE_DATA_TEMPLATE.copy()
+        signature_data["x3"] = config.X3_PREFIX + self._MARKER
+        head, _, tail = json.dumps(signature_data, separators=(",", ":"), ensure_ascii=False).partition(self._MARKER)
+        head_bytes = head.encode("utf-8")
+
+        aligned = len(head_bytes) - len(head_bytes) % 3
+        self.encoded_head = config.XYS_PREFIX.encode("utf-8") + self._encoder.encode_bytes(head_bytes[:aligned])
+        self.head_rest = head_bytes[aligned:]
+        self.tail = tail.encode("utf-8")
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "XysEnvelope":
+        """
+        Get the process-wide envelope for a config
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            XysEnvelope: Shared envelope using the shared encoder
+        """
+        return shared_instance(cls, config, selected_backend("base64"))
+
+    def wrap(self, x3: bytes) -> bytes:
+        """
+        Build the complete XYS signature around an x3 value
+
+        Args:
+            x3: x3 Base64 value (X3 alphabet, without X3_PREFIX)
+
+        Returns:
+            bytes: Complete XYS signature as ASCII bytes
+        """
+        return self.encoded_head + self._encoder.encode_bytes(self.head_rest + x3 + self.tail)
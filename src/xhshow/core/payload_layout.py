@@ -0,0 +1,107 @@
+"""Fixed byte layout of the x3 payload"""
+
+import struct
+from typing import NamedTuple
+
+from ..config import CryptoConfig
+from ..utils.shared import shared_instance
+
+__all__ = ["PayloadField", "PayloadLayout"]
+
+
+class PayloadField(NamedTuple):
+    """Payload field position"""
+
+    name: str
+    offset: int
+    size: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
+
+class PayloadLayout:
+    """
+    Payload layout compiled for a config
+
+    Lists the offset and width of each field written by
+    `CryptoProcessor.build_payload_bytes`. The numeric fields from the seed
+    to the MD5 XOR segment are contiguous and packed with one `struct.Struct`.
+    """
+
+    A1_SIZE = 52
+    SOURCE_SIZE = 10
+    SIGNED_SIZE = 124
+
+    # Contiguous little-endian numeric block:
+    # seed, env fingerprint A, env fingerprint B, sequence, window props length, content length, MD5 XOR
+    NUMERIC_FORMAT = "<IQQIIIQ"
+
+    __slots__ = ("config", "fields", "size", "numeric", "numeric_offset")
+
+    def __init__(self, config: CryptoConfig):
+        self.config = config
+
+        field_sizes = [
+            ("version", len(config.VERSION_BYTES)),
+            ("seed", 4),
+            ("env_fingerprint_a", 8),
+            ("env_fingerprint_b", 8),
+            ("sequence", 4),
+            ("window_props_length", 4),
+            ("content_length", 4),
+            ("md5_xor", 8),
+            ("a1_length", 1),
+            ("a1", self.A1_SIZE),
+            ("source_length", 1),
+            ("source", self.SOURCE_SIZE),
+            ("flag", 1),
+            ("checksum_version", 1),
+            ("checksum_seed", 1),
+            ("checksum_tail", len(config.CHECKSUM_FIXED_TAIL)),
+        ]
+
+        self.fields: dict[str, PayloadField] = {}
+        offset = 0
+        for name, size in field_sizes:
+            self.fields[name] = PayloadField(name, offset, size)
+            offset += size
+        self.size = offset
+
+        self.numeric = struct.Struct(self.NUMERIC_FORMAT)
+        self.numeric_offset = self.fields["seed"].offset
+        assert self.numeric_offset + self.numeric.size == self.fields["md5_xor"].end
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "PayloadLayout":
+        """
+        Get the process-wide layout for a config
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            PayloadLayout: Shared layout
+        """
+        return shared_instance(cls, config)
+
+    def __getitem__(self, name: str) -> PayloadField:
+        return self.fields[name]
+
+    def template(self) -> bytearray:
+        """
+        Build a payload buffer with all constant fields filled in
+
+        Returns:
+            bytearray: Payload buffer, variable fields zeroed
+        """
+        config = self.config
+        buffer = bytearray(self.size)
+        buffer[self["version"].offset : self["version"].end] = bytes(config.VERSION_BYTES)
+        buffer[self["a1_length"].offset] = self.A1_SIZE
+        buffer[self["source_length"].offset] = self.SOURCE_SIZE
+        buffer[self["flag"].offset] = 1
+        buffer[self["checksum_version"].offset] = config.CHECKSUM_VERSION
+        buffer[self["checksum_tail"].offset : self["checksum_tail"].end] = bytes(config.CHECKSUM_FIXED_TAIL)
+        return buffer
@@ -0,0 +1,30 @@
+"""Prepared signed requests"""
+
+__all__ = ["SignedRequest"]
+
+
+class SignedRequest:
+    """
+    Request ready to be sent: final URL, exact body bytes and signed headers
+
+    The body bytes are the same serialization that was signed, so HTTP
+    clients should send them as-is (e.g. `data=` rather than `json=`).
+
+    Attributes:
+        method: Upper-case request method ("GET" or "POST")
+        url: Final URL (with the query string for GET requests)
+        body: UTF-8 JSON body for POST requests, None for GET requests
+        headers: Signed headers including x-s, x-s-common, x-t, x-b3-traceid, x-xray-traceid
+    """
+
+    __slots__ = ("method", "url", "body", "headers")
+
+    def __init__(self, method: str, url: str, body: bytes | None, headers: dict[str, str]):
+        self.method = method
+        self.url = url
+        self.body = body
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        body_size = "None" if self.body is None else f"{len(self.body)} bytes"
+        return f"SignedRequest(method={self.method!r}, url={self.url!r}, body={body_size})"
@@ -0,0 +1,118 @@
+"""Validate-once request templates for hot endpoints"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from ..utils.validators import RequestSignatureValidator
+
+if TYPE_CHECKING:
+    from ..client import Xhshow
+
+__all__ = ["RequestTemplate"]
+
+
+class RequestTemplate:
+    """
+    Request signer bound to one endpoint
+
+    Method, URI and xsec_appid are validated and normalized once when the
+    template is created (see `Xhshow.template`); signing only checks the
+    per-call a1 value and parameters.
+    """
+
+    __slots__ = ("_client", "method", "uri", "xsec_appid")
+
+    def __init__(self, client: "Xhshow", method: str, uri: str, xsec_appid: str):
+        """
+        Args:
+            client: Client used for signing
+            method: Validated upper-case request method
+            uri: Validated URI path
+            xsec_appid: Validated application identifier
+        """
+        self._client = client
+        self.method = method
+        self.uri = uri
+        self.xsec_appid = xsec_appid
+
+    def sign(self, a1_value: str, params: dict[str, Any] | None = None, timestamp: float | None = None) -> str:
+        """
+        Generate x-s signature for this endpoint
+
+        Args:
+            a1_value: a1 value from cookies
+            params: GET request parameters or POST request body data
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            str: Complete signature string
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+        """
+        return self.sign_bytes(a1_value, params, timestamp).decode("utf-8")
+
+    def sign_bytes(self, a1_value: str, params: dict[str, Any] | None = None, timestamp: float | None = None) -> bytes:
+        """
+        Generate x-s signature for this endpoint as ASCII bytes
+
+        Args:
+            a1_value: a1 value from cookies
+            params: GET request parameters or POST request body data
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            bytes: Complete signature
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+        """
+        return self._client._sign_xs_core_bytes(
+            self.method,
+            self.uri,
+            RequestSignatureValidator.validate_a1_value(a1_value),
+            self.xsec_appid,
+            RequestSignatureValidator.validate_payload(params),
+            timestamp,
+        )
+
+    def sign_headers(
+        self,
+        cookies: dict[str, Any] | str,
+        params: dict[str, Any] | None = None,
+        timestamp: float | None = None,
+    ) -> dict[str, str]:
+        """
+        Generate complete request headers for this endpoint
+
+        Args:
+            cookies: Complete cookie dictionary or cookie string
+            params: GET request parameters or POST request body data
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            dict: Complete headers including x-s, x-s-common, x-t, x-b3-traceid, x-xray-traceid
+
+        Raises:
+            TypeError: Parameter type error
+            ValueError: Parameter value error
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        client = self._client
+        cookie_dict, a1_value = client._parse_cookie_state(cookies)
+        x_s = client._sign_xs_core(
+            self.method,
+            self.uri,
+            a1_value,
+            self.xsec_appid,
+            RequestSignatureValidator.validate_payload(params),
+            timestamp,
+        )
+        return client._assemble_headers(x_s, client._xs_common_signer.sign(cookie_dict, timestamp), timestamp)
+
+    def __repr__(self) -> str:
+        return f"RequestTemplate(method={self.method!r}, uri={self.uri!r}, xsec_appid={self.xsec_appid!r})"
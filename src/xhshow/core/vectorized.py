@@ -0,0 +1,226 @@
+"""Optional NumPy backend for batch payload XOR and Base64 encoding"""
+
+import base64
+from typing import TYPE_CHECKING
+
+from ..config import CryptoConfig
+from ..utils.backends import selected_backend
+from ..utils.bit_ops import BitOperations
+from ..utils.encoder import Base64Encoder
+from ..utils.shared import shared_instance
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from .envelope import XysEnvelope
+    from .payload_layout import PayloadLayout
+
+__all__ = ["NumpyBatchEncoder", "get_batch_encoder"]
+
+
+class NumpyBatchEncoder:
+    """
+    Vectorized XOR and Base64 over a matrix of equal-length rows
+
+    A batch of payloads is handled as one (N, width) uint8 matrix: the key
+    XOR is a single broadcast operation, and the whole matrix is Base64
+    encoded in one call and mapped to the X3 or custom alphabet through a
+    translation table.
+    """
+
+    __slots__ = ("config", "_key", "_custom_table", "_x3_table")
+
+    def __init__(self, config: CryptoConfig):
+        if np is None:
+            raise ImportError("NumpyBatchEncoder requires numpy")
+
+        self.config = config
+        self._key = np.frombuffer(bytes.fromhex(config.HEX_KEY), dtype=np.uint8)
+        self._custom_table = bytes.maketrans(
+            config.STANDARD_BASE64_ALPHABET.encode("ascii"), config.CUSTOM_BASE64_ALPHABET.encode("ascii")
+        )
+        self._x3_table = bytes.maketrans(
+            config.STANDARD_BASE64_ALPHABET.encode("ascii"), config.X3_BASE64_ALPHABET.encode("ascii")
+        )
+
+    def as_rows(self, data: bytes | bytearray | memoryview, width: int) -> "np.ndarray":
+        """
+        View concatenated equal-length records as an (N, width) matrix
+
+        Args:
+            data: Concatenated records
+            width: Record length in bytes
+
+        Returns:
+            np.ndarray: uint8 matrix sharing memory with `data`
+        """
+        return np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+
+    def xor_rows(self, rows: "np.ndarray") -> "np.ndarray":
+        """
+        XOR every row with the key (same result as `BitOperations.xor_transform_bytes` per row)
+
+        Args:
+            rows: (N, width) uint8 matrix
+
+        Returns:
+            np.ndarray: New (N, width) uint8 matrix
+        """
+        result = rows.copy()
+        width = min(rows.shape[1], len(self._key))
+        result[:, :width] ^= self._key[:width]
+        return result
+
+    def encode_rows(self, rows: "np.ndarray") -> "np.ndarray":
+        """
+        Base64 encode every row with the custom alphabet
+
+        Args:
+            rows: (N, width) uint8 matrix
+
+        Returns:
+            np.ndarray: (N, 4 * ceil(width / 3)) matrix of ASCII codes
+        """
+        return self._b64encode_rows(rows, self._custom_table)
+
+    def encode_x3_rows(self, rows: "np.ndarray") -> "np.ndarray":
+        """
+        Base64 encode every row with the X3 alphabet
+
+        Args:
+            rows: (N, width) uint8 matrix
+
+        Returns:
+            np.ndarray: (N, 4 * ceil(width / 3)) matrix of ASCII codes
+        """
+        return self._b64encode_rows(rows, self._x3_table)
+
+    def build_x3_rows(
+        self,
+        templates: bytes | bytearray,
+        numerics: bytes | bytearray,
+        checksum_seeds: bytes | bytearray,
+        layout: "PayloadLayout",
+    ) -> "np.ndarray":
+        """
+        Assemble and encode the x3 values of a batch from `CryptoProcessor.build_payload_rows` output
+
+        The templates are already XORed; only the numeric block and checksum
+        seed columns are XORed with the matching key columns.
+
+        Args:
+            templates: Concatenated pre-XORed payload templates
+            numerics: Concatenated unencrypted numeric blocks
+            checksum_seeds: Checksum seed byte per payload (before key XOR)
+            layout: Payload layout of the config
+
+        Returns:
+            np.ndarray: (N, x3 length) matrix of X3 Base64 ASCII codes
+        """
+        rows = self.as_rows(templates, layout.SIGNED_SIZE).copy()
+
+        start = layout.numeric_offset
+        end = start + layout.numeric.size
+        rows[:, start:end] = self.as_rows(numerics, layout.numeric.size) ^ self._key[start:end]
+
+        checksum_offset = layout["checksum_seed"].offset
+        rows[:, checksum_offset] = np.frombuffer(checksum_seeds, dtype=np.uint8) ^ self._key[checksum_offset]
+
+        return self.encode_x3_rows(rows)
+
+    def wrap_rows(self, x3_rows: "np.ndarray", envelope: "XysEnvelope") -> list[bytes]:
+        """
+        Build complete XYS signatures around a matrix of x3 values
+
+        Args:
+            x3_rows: (N, x3 length) matrix of X3 Base64 ASCII codes
+            envelope: Signature envelope of the client config
+
+        Returns:
+            list[bytes]: Complete signatures as ASCII bytes, in row order
+        """
+        count, x3_width = x3_rows.shape
+        head_rest, tail = envelope.head_rest, envelope.tail
+        tail_start = len(head_rest) + x3_width
+
+        body = np.empty((count, tail_start + len(tail)), dtype=np.uint8)
+        body[:, : len(head_rest)] = np.frombuffer(head_rest, dtype=np.uint8)
+        body[:, len(head_rest) : tail_start] = x3_rows
+        body[:, tail_start:] = np.frombuffer(tail, dtype=np.uint8)
+
+        encoded = self.encode_rows(body)
+        data, row_width, head = encoded.tobytes(), encoded.shape[1], envelope.encoded_head
+        return [head + data[start : start + row_width] for start in range(0, len(data), row_width)]
+
+    @staticmethod
+    def _b64encode_rows(rows: "np.ndarray", table: bytes) -> "np.ndarray":
+        """
+        Base64 encode each row through an alphabet translation table
+
+        Rows are zero padded to whole 3-byte groups so the whole matrix is
+        encoded by one Base64 call without groups spanning two rows; the
+        padding characters of each row are then restored column-wise.
+        """
+        count, width = rows.shape
+        groups = -(-width // 3)
+        padding = groups * 3 - width
+
+        if padding:
+            padded = np.zeros((count, groups * 3), dtype=np.uint8)
+            padded[:, :width] = rows
+        else:
+            padded = np.ascontiguousarray(rows)
+
+        encoded = bytearray(base64.b64encode(padded.tobytes()).translate(table))
+        encoded_rows = np.frombuffer(encoded, dtype=np.uint8).reshape(count, groups * 4)
+        if padding:
+            encoded_rows[:, -padding:] = ord("=")
+        return encoded_rows
+
+
+def _matches_scalar(batch_encoder: NumpyBatchEncoder, config: CryptoConfig) -> bool:
+    """Check the vectorized primitives against the scalar encoder and XOR on sample rows"""
+    encoder = Base64Encoder.shared(config)
+    bit_ops = BitOperations.shared(config)
+    for width in (1, 2, 3, 124, 125, 200):
+        records = [bytes((row * 37 + column * 11) & 0xFF for column in range(width)) for row in range(4)]
+        rows = batch_encoder.as_rows(b"".join(records), width)
+
+        xored = batch_encoder.xor_rows(rows)
+        if [row.tobytes() for row in xored] != [bit_ops.xor_transform_bytes(record) for record in records]:
+            return False
+        if [row.tobytes() for row in batch_encoder.encode_rows(rows)] != [encoder.encode_bytes(r) for r in records]:
+            return False
+        if [row.tobytes() for row in batch_encoder.encode_x3_rows(rows)] != [
+            encoder.encode_x3_bytes(record) for record in records
+        ]:
+            return False
+    return True
+
+
+def get_batch_encoder(config: CryptoConfig) -> NumpyBatchEncoder | None:
+    """
+    Get the NumPy batch encoder for a config
+
+    Returns None when NumPy is not installed, when `NUMPY_BATCH_THRESHOLD` is 0,
+    or when the vectorized output does not match the scalar encoder. The
+    encoder and its equivalence check are shared by clients with equal configs.
+
+    Args:
+        config: Crypto configuration
+
+    Returns:
+        NumpyBatchEncoder | None: Batch encoder, or None when unavailable
+    """
+    if np is None or not config.NUMPY_BATCH_THRESHOLD:
+        return None
+    return shared_instance(_checked_batch_encoder, config, selected_backend("xor"), selected_backend("base64"))
+
+
+def _checked_batch_encoder(config: CryptoConfig) -> NumpyBatchEncoder | None:
+    """Build a batch encoder and keep it only if it matches the scalar path"""
+    batch_encoder = NumpyBatchEncoder(config)
+    return batch_encoder if _matches_scalar(batch_encoder, config) else None
@@ -0,0 +1,210 @@
+"""Sampled self-verification of produced signatures"""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from ..config import CryptoConfig
+from ..utils.encoder import Base64Encoder
+from .x3_parser import X3Parser, X3Payload
+
+__all__ = ["SignatureMismatch", "SignatureVerifier", "VerifyStats"]
+
+
+class SignatureMismatch(NamedTuple):
+    """Signature that did not decode back to its inputs"""
+
+    signature: bytes  # x-s as produced
+    fields: tuple[str, ...]  # mismatching fields, ("decode",) when the x-s could not be decoded
+    payload: X3Payload | None  # decoded x3 payload, None when decoding failed
+    error: str = ""
+
+
+class VerifyStats(NamedTuple):
+    """Self-verification statistics"""
+
+    sampled: int  # signatures selected by the sampling rate
+    checked: int  # sampled signatures decoded and compared
+    skipped: int  # sampled signatures dropped by the per-second budget
+    mismatches: int
+
+
+class SignatureVerifier:
+    """
+    Decode a sampled fraction of produced x-s values and compare them with the signing inputs
+
+    Each checked signature goes through the same round-trip as
+    `Xhshow.decode_xs` + `X3Parser.parse` (about 25 us); unsampled calls only
+    draw one random float (about 0.1 us). Sampling draws from its own random
+    stream, so enabling verification never changes the signatures of a
+    seeded client. `max_per_second` bounds the verification
+    work independently of the request rate (100/s costs about 0.25% of a core).
+    """
+
+    __slots__ = (
+        "config",
+        "rate",
+        "max_per_second",
+        "callback",
+        "sampled",
+        "checked",
+        "skipped",
+        "mismatches",
+        "_random",
+        "_lock",
+        "_encoder",
+        "_parser",
+        "_window",
+        "_window_count",
+        "_offset_bounds",
+    )
+
+    def __init__(
+        self,
+        config: CryptoConfig,
+        rate: float,
+        callback: Callable[[SignatureMismatch], None] | None = None,
+        max_per_second: int = 0,
+        seed: int | str | bytes | None = None,
+    ):
+        """
+        Args:
+            config: Crypto configuration the signatures are produced with
+            rate: Fraction of signatures to verify, 0.0 to 1.0
+            callback: Called with a `SignatureMismatch` for each failed check
+            max_per_second: Maximum checks per second, 0 for no limit
+            seed: Seed of the sampling stream, None seeds from OS entropy
+        """
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"rate must be between 0.0 and 1.0, got {rate}")
+        if max_per_second < 0:
+            raise ValueError(f"max_per_second must be >= 0, got {max_per_second}")
+
+        self.config = config
+        self.rate = rate
+        self.max_per_second = max_per_second
+        self.callback = callback
+        self.sampled = 0
+        self.checked = 0
+        self.skipped = 0
+        self.mismatches = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._encoder = Base64Encoder.shared(config)
+        self._parser = X3Parser.shared(config)
+        self._window = 0
+        self._window_count = 0
+        self._offset_bounds = (
+            config.ENV_FINGERPRINT_TIME_OFFSET_MIN * 1000 - 1,
+            config.ENV_FINGERPRINT_TIME_OFFSET_MAX * 1000 + 1,
+        )
+
+    def sample(self) -> bool:
+        """
+        Decide whether the next signature is verified
+
+        Returns:
+            bool: True for a sampled signature that fits the per-second budget
+        """
+        if self._random.random() >= self.rate:
+            return False
+
+        with self._lock:
+            self.sampled += 1
+            if self.max_per_second:
+                window = int(time.monotonic())
+                if window != self._window:
+                    self._window, self._window_count = window, 0
+                if self._window_count >= self.max_per_second:
+                    self.skipped += 1
+                    return False
+                self._window_count += 1
+        return True
+
+    def check(
+        self,
+        signature: bytes,
+        md5_digest: bytes,
+        content_length: int,
+        a1_value: str,
+        xsec_appid: str,
+        timestamp: float,
+    ) -> SignatureMismatch | None:
+        """
+        Decode a signature and compare it with its signing inputs
+
+        Compares the MD5 prefix, content length, a1, source, recovered
+        signing time and env fingerprint offset, and the payload constants.
+
+        Args:
+            signature: Complete x-s as ASCII bytes
+            md5_digest: Raw MD5 digest of the content string
+            content_length: Length of the content string
+            a1_value: a1 value the signature was produced for
+            xsec_appid: Application identifier
+            timestamp: Unix timestamp in seconds used for signing
+
+        Returns:
+            SignatureMismatch | None: Mismatch (also passed to the callback), None when consistent
+        """
+        mismatch = self._compare(signature, md5_digest, content_length, a1_value, xsec_appid, timestamp)
+        with self._lock:
+            self.checked += 1
+            if mismatch is not None:
+                self.mismatches += 1
+        if mismatch is not None and self.callback is not None:
+            self.callback(mismatch)
+        return mismatch
+
+    def stats(self) -> VerifyStats:
+        """
+        Get verification statistics
+
+        Returns:
+            VerifyStats: Sampled, checked, skipped and mismatching signature counts
+        """
+        return VerifyStats(self.sampled, self.checked, self.skipped, self.mismatches)
+
+    def _compare(
+        self,
+        signature: bytes,
+        md5_digest: bytes,
+        content_length: int,
+        a1_value: str,
+        xsec_appid: str,
+        timestamp: float,
+    ) -> SignatureMismatch | None:
+        config = self.config
+        try:
+            prefix = config.XYS_PREFIX.encode("utf-8")
+            if not signature.startswith(prefix):
+                raise ValueError(f"missing {config.XYS_PREFIX} prefix")
+            (signature_json,) = self._encoder.decode_many([signature[len(prefix) :]])
+            x3 = json.loads(signature_json)["x3"]
+            if not x3.startswith(config.X3_PREFIX):
+                raise ValueError(f"missing {config.X3_PREFIX} prefix")
+            payload = self._parser.parse(x3)
+        except (ValueError, KeyError, TypeError) as e:
+            return SignatureMismatch(signature, ("decode",), None, str(e))
+
+        timestamp_ms = int(timestamp * 1000)
+        offset_min, offset_max = self._offset_bounds
+        checks = (
+            ("valid", payload.valid),
+            ("md5_prefix", payload.md5_prefix == md5_digest[:8]),
+            ("content_length", payload.content_length == content_length & config.MAX_32BIT),
+            ("a1", payload.a1 == self._field_text(a1_value, self._parser.layout["a1"].size)),
+            ("source", payload.source == self._field_text(xsec_appid, self._parser.layout["source"].size)),
+            ("timestamp_ms", abs(payload.timestamp_ms - timestamp_ms) <= 1),
+            ("env_timestamp_ms", offset_min <= payload.timestamp_ms - payload.env_timestamp_ms <= offset_max),
+        )
+        fields = tuple(name for name, ok in checks if not ok)
+        return SignatureMismatch(signature, fields, payload) if fields else None
+
+    @staticmethod
+    def _field_text(value: str, size: int) -> str:
+        """Text of a fixed-size payload field as written by `CryptoProcessor`"""
+        return value.encode("utf-8")[:size].rstrip(b"\x00").decode("utf-8", "replace")
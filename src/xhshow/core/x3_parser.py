@@ -0,0 +1,411 @@
+"""Structured decoding of x3 signatures"""
+
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from ..config import CryptoConfig
+from ..utils.bit_ops import BitOperations
+from ..utils.encoder import Base64Encoder
+from ..utils.shared import shared_instance
+from .payload_layout import PayloadLayout
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+__all__ = ["PAYLOAD_COLUMNS", "X3Parser", "X3Payload"]
+
+BytesLike = bytes | bytearray | memoryview
+
+# Column name -> array typecode ("str" for string columns) of `X3Parser.parse_columns`.
+# Byte fields are stored as little-endian integers: `md5_prefix.to_bytes(8, "little") == md5[:8]`.
+PAYLOAD_COLUMNS: dict[str, str] = {
+    "valid": "B",
+    "version": "I",
+    "seed": "I",
+    "timestamp_ms": "q",
+    "env_timestamp_ms": "q",
+    "sequence": "I",
+    "window_props_length": "I",
+    "content_length": "I",
+    "md5_prefix": "Q",
+    "a1": "str",
+    "source": "str",
+    "checksum_version": "B",
+    "checksum_seed": "B",
+}
+
+_BYTE_MULTIPLIER = 0x0101010101010101
+
+
+def _int64(value: int) -> int:
+    """Wrap to a signed 64-bit value like NumPy (only reached by corrupted payloads)"""
+    return value if value < 1 << 63 else ((value + (1 << 63)) & 0xFFFFFFFFFFFFFFFF) - (1 << 63)
+
+
+class X3Payload(NamedTuple):
+    """Named fields of a decoded x3 payload"""
+
+    valid: bool  # constant fields, checksum seed and fingerprint mark are consistent
+    version: bytes
+    seed: int
+    timestamp_ms: int  # signing time from env fingerprint A, completed with B (+-1 ms)
+    env_timestamp_ms: int  # env fingerprint B: signing time minus a whole-second offset
+    sequence: int
+    window_props_length: int
+    content_length: int
+    md5_prefix: bytes  # first 8 bytes of the content string MD5
+    a1: str
+    source: str
+    checksum_version: int
+    checksum_seed: int  # before XOR with CHECKSUM_XOR_KEY
+
+
+class X3Parser:
+    """
+    Decode x3 signatures into the fields of `PayloadLayout`
+
+    The signed payload (`SIGNED_SIZE` bytes) is unpacked with one
+    `struct.Struct` built from the layout, so no per-byte lists are created.
+    `parse_columns` decodes many signatures into array-backed columns: the
+    whole batch is XORed as one big integer (or one NumPy broadcast) and
+    unpacked with `struct.iter_unpack` (or a structured dtype view).
+    """
+
+    __slots__ = (
+        "config",
+        "layout",
+        "_encoder",
+        "_bit_ops",
+        "_record",
+        "_record_fields",
+        "_constant_fields",
+        "_key",
+        "_prefix",
+        "_fingerprint_a_key",
+    )
+
+    def __init__(self, config: CryptoConfig):
+        self.config = config
+        self.layout = PayloadLayout.shared(config)
+        self._encoder = Base64Encoder.shared(config)
+        self._bit_ops = BitOperations.shared(config)
+        self._key = bytes.fromhex(config.HEX_KEY)[: PayloadLayout.SIGNED_SIZE]
+        self._prefix = config.X3_PREFIX
+        self._fingerprint_a_key = config.ENV_FINGERPRINT_XOR_KEY * _BYTE_MULTIPLIER
+
+        # Record struct over the signed bytes: numeric block as in the layout, other fields as bytes
+        layout = self.layout
+        codes, names, offset = ["<"], [], 0
+        for field in layout.fields.values():
+            if offset >= PayloadLayout.SIGNED_SIZE:
+                break
+            if field.name == "seed":
+                codes.append(layout.NUMERIC_FORMAT[1:])
+                names.extend(
+                    ["seed", "env_fingerprint_a", "env_fingerprint_b", "sequence", "window_props_length"]
+                    + ["content_length", "md5_xor"]
+                )
+                offset = layout.fields["md5_xor"].end
+                continue
+            if field.offset < offset:
+                continue
+            size = min(field.end, PayloadLayout.SIGNED_SIZE) - field.offset
+            codes.append("B" if size == 1 else f"{size}s")
+            names.append(field.name)
+            offset = field.offset + size
+        self._record = struct.Struct("".join(codes))
+        self._record_fields = {name: index for index, name in enumerate(names)}
+        assert self._record.size == PayloadLayout.SIGNED_SIZE
+
+        self._constant_fields = [
+            (name, value)
+            for name, value in (
+                ("version", bytes(config.VERSION_BYTES)),
+                ("a1_length", PayloadLayout.A1_SIZE),
+                ("source_length", PayloadLayout.SOURCE_SIZE),
+                ("flag", 1),
+                ("checksum_version", config.CHECKSUM_VERSION),
+                ("checksum_tail", bytes(config.CHECKSUM_FIXED_TAIL)[: self._tail_size()]),
+            )
+            if name in self._record_fields
+        ]
+
+    def _tail_size(self) -> int:
+        tail = self.layout["checksum_tail"]
+        return max(0, min(tail.end, PayloadLayout.SIGNED_SIZE) - tail.offset)
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "X3Parser":
+        """
+        Get the process-wide parser for a config
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            X3Parser: Shared parser
+        """
+        return shared_instance(cls, config)
+
+    def decode(self, x3_signature: str | BytesLike) -> bytes:
+        """
+        Decode an x3 signature to its XOR-reversed payload bytes
+
+        Args:
+            x3_signature: x3 value (str or ASCII bytes, with or without prefix)
+
+        Returns:
+            bytes: Decoded payload
+
+        Raises:
+            ValueError: Invalid Base64 input
+        """
+        (decoded,) = self._encoder.decode_x3_many([self._strip_prefix(x3_signature)])
+        return self._bit_ops.xor_transform_bytes(decoded)
+
+    def parse(self, x3_signature: str | BytesLike) -> X3Payload:
+        """
+        Decode an x3 signature into named fields
+
+        Args:
+            x3_signature: x3 value (str or ASCII bytes, with or without prefix)
+
+        Returns:
+            X3Payload: Decoded fields
+
+        Raises:
+            ValueError: Invalid Base64 input or payload length
+
+        Examples:
+            >>> X3Parser.shared().parse(client.decode_xs(x_s)["x3"]).timestamp_ms
+        """
+        return self.parse_payload(self.decode(x3_signature))
+
+    def parse_payload(self, payload: BytesLike) -> X3Payload:
+        """
+        Unpack XOR-reversed payload bytes into named fields
+
+        Args:
+            payload: Payload of at least `SIGNED_SIZE` bytes (bytes or memoryview)
+
+        Returns:
+            X3Payload: Decoded fields
+
+        Raises:
+            ValueError: Payload is shorter than `SIGNED_SIZE` bytes
+        """
+        if len(payload) < PayloadLayout.SIGNED_SIZE:
+            raise ValueError(f"x3 payload must be at least {PayloadLayout.SIGNED_SIZE} bytes, got {len(payload)}")
+
+        record = self._record.unpack_from(payload)
+        get = self._record_fields.__getitem__
+        seed = record[get("seed")]
+        fingerprint_a = record[get("env_fingerprint_a")] ^ self._fingerprint_a_key
+        fingerprint_b = record[get("env_fingerprint_b")]
+        checksum_seed = record[get("checksum_seed")]
+
+        high = fingerprint_a & ~0xFF
+        low = (fingerprint_b - high) % 1000
+        high_bytes = high.to_bytes(8, "little")
+        mark = ((sum(high_bytes[1:5]) & 0xFF) + sum(high_bytes[5:8])) & 0xFF
+        valid = (
+            fingerprint_a & 0xFF == mark
+            and checksum_seed ^ self.config.CHECKSUM_XOR_KEY == seed & 0xFF
+            and all(record[get(name)] == value for name, value in self._constant_fields)
+        )
+
+        return X3Payload(
+            valid=valid,
+            version=record[get("version")],
+            seed=seed,
+            timestamp_ms=high + low if low < 256 else high,
+            env_timestamp_ms=fingerprint_b,
+            sequence=record[get("sequence")],
+            window_props_length=record[get("window_props_length")],
+            content_length=record[get("content_length")],
+            md5_prefix=(record[get("md5_xor")] ^ ((seed & 0xFF) * _BYTE_MULTIPLIER)).to_bytes(8, "little"),
+            a1=record[get("a1")].rstrip(b"\x00").decode("utf-8", "replace"),
+            source=record[get("source")].rstrip(b"\x00").decode("utf-8", "replace"),
+            checksum_version=record[get("checksum_version")],
+            checksum_seed=checksum_seed ^ self.config.CHECKSUM_XOR_KEY,
+        )
+
+    def parse_columns(
+        self,
+        x3_signatures: Sequence[str | BytesLike] | str | BytesLike,
+        offsets: Sequence[int] | None = None,
+        numpy: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        Decode many x3 signatures into columns
+
+        Signatures that fail to decode get `valid == 0` and zero / empty fields.
+
+        Args:
+            x3_signatures: x3 values (with or without prefix), or one concatenated
+                buffer when `offsets` is given (see `Base64Encoder.decode_x3_many`)
+            offsets: Item boundaries in the buffer, `len(items) + 1` entries
+            numpy: Return NumPy arrays; None uses NumPy when installed
+
+        Returns:
+            dict: Column name -> `array.array` / `numpy.ndarray` (numeric) or
+                list[str], see `PAYLOAD_COLUMNS`
+
+        Examples:
+            >>> columns = X3Parser.shared().parse_columns(x3_values, numpy=False)
+            >>> max(columns["timestamp_ms"]) - min(columns["timestamp_ms"])
+        """
+        use_numpy = np is not None if numpy is None else numpy
+        if use_numpy and np is None:
+            raise ImportError("numpy columns require numpy")
+
+        payloads = self._decode_batch(x3_signatures, offsets)
+        size = PayloadLayout.SIGNED_SIZE
+        ok = [payload is not None and len(payload) == size for payload in payloads]
+        joined = b"".join(payload[:size] if good else bytes(size) for payload, good in zip(payloads, ok, strict=True))
+        if use_numpy:
+            return self._numpy_columns(joined, ok)
+        return self._array_columns(joined, ok)
+
+    def _strip_prefix(self, value: str | BytesLike) -> str | BytesLike:
+        if isinstance(value, str):
+            return value[len(self._prefix) :] if value.startswith(self._prefix) else value
+        prefix = self._prefix.encode()
+        return value[len(prefix) :] if bytes(value[: len(prefix)]) == prefix else value
+
+    def _decode_batch(
+        self, values: Sequence[str | BytesLike] | str | BytesLike, offsets: Sequence[int] | None
+    ) -> list[bytes | None]:
+        """Base64-decode a batch (without XOR), isolating invalid items"""
+        if offsets is not None:
+            source = values if isinstance(values, str) else memoryview(values)
+            values = [source[start:end] for start, end in zip(offsets[:-1], offsets[1:], strict=True)]
+        values = [self._strip_prefix(value) for value in values]
+        try:
+            return list(self._encoder.decode_x3_many(values))
+        except ValueError:
+            decoded: list[bytes | None] = []
+            for value in values:
+                try:
+                    decoded.extend(self._encoder.decode_x3_many([value]))
+                except ValueError:
+                    decoded.append(None)
+            return decoded
+
+    def _xor_batch(self, joined: bytes, count: int) -> bytes:
+        """XOR concatenated records with the repeated key as one big integer"""
+        length = len(joined)
+        return (int.from_bytes(joined, "little") ^ int.from_bytes(self._key * count, "little")).to_bytes(
+            length, "little"
+        )
+
+    def _array_columns(self, joined: bytes, ok: list[bool]) -> dict[str, Any]:
+        count = len(ok)
+        columns: dict[str, Any] = {name: [] if code == "str" else array(code) for name, code in PAYLOAD_COLUMNS.items()}
+        if not count:
+            return columns
+
+        records = list(zip(*self._record.iter_unpack(self._xor_batch(joined, count)), strict=True))
+        get = self._record_fields.__getitem__
+        seeds = records[get("seed")]
+        fingerprint_b = records[get("env_fingerprint_b")]
+        checksum_seeds = records[get("checksum_seed")]
+        xor_key = self.config.CHECKSUM_XOR_KEY
+
+        timestamps, valid = array("q"), array("B")
+        for index, (fingerprint_a, b_value) in enumerate(
+            zip(records[get("env_fingerprint_a")], fingerprint_b, strict=True)
+        ):
+            fingerprint_a ^= self._fingerprint_a_key
+            high = fingerprint_a & ~0xFF
+            low = (b_value - high) % 1000
+            timestamps.append(_int64(high + low if low < 256 else high))
+            high_bytes = high.to_bytes(8, "little")
+            valid.append(
+                ok[index]
+                and fingerprint_a & 0xFF == ((sum(high_bytes[1:5]) & 0xFF) + sum(high_bytes[5:8])) & 0xFF
+                and checksum_seeds[index] ^ xor_key == seeds[index] & 0xFF
+                and all(records[get(name)][index] == value for name, value in self._constant_fields)
+            )
+
+        columns["valid"] = valid
+        columns["version"] = array("I", (int.from_bytes(version, "little") for version in records[get("version")]))
+        columns["seed"] = array("I", seeds)
+        columns["timestamp_ms"] = timestamps
+        columns["env_timestamp_ms"] = array("q", map(_int64, fingerprint_b))
+        for name in ("sequence", "window_props_length", "content_length"):
+            columns[name] = array("I", records[get(name)])
+        columns["md5_prefix"] = array(
+            "Q",
+            (
+                md5 ^ ((seed & 0xFF) * _BYTE_MULTIPLIER)
+                for md5, seed in zip(records[get("md5_xor")], seeds, strict=True)
+            ),
+        )
+        for name in ("a1", "source"):
+            columns[name] = [value.rstrip(b"\x00").decode("utf-8", "replace") for value in records[get(name)]]
+        columns["checksum_version"] = array("B", records[get("checksum_version")])
+        columns["checksum_seed"] = array("B", (value ^ xor_key for value in checksum_seeds))
+        return self._clear_invalid(columns, ok)
+
+    def _numpy_columns(self, joined: bytes, ok: list[bool]) -> dict[str, Any]:
+        count = len(ok)
+        rows = np.frombuffer(joined, dtype=np.uint8).reshape(count, PayloadLayout.SIGNED_SIZE) ^ np.frombuffer(
+            self._key, dtype=np.uint8
+        )
+        layout = self.layout
+
+        def column(name: str, dtype: str) -> "np.ndarray":
+            field = layout[name]
+            return np.ascontiguousarray(rows[:, field.offset : field.end]).view(dtype).reshape(count)
+
+        seeds = column("seed", "<u4")
+        fingerprint_a = column("env_fingerprint_a", "<u8") ^ np.uint64(self._fingerprint_a_key)
+        fingerprint_b = column("env_fingerprint_b", "<u8").astype(np.int64)
+        high = (fingerprint_a & ~np.uint64(0xFF)).astype(np.int64)
+        low = (fingerprint_b - high) % 1000
+
+        high_bytes = np.ascontiguousarray(fingerprint_a).view(np.uint8).reshape(count, 8).astype(np.int64)
+        mark = ((high_bytes[:, 1:5].sum(axis=1) & 0xFF) + high_bytes[:, 5:8].sum(axis=1)) & 0xFF
+        checksum_seed = rows[:, layout["checksum_seed"].offset]
+        valid = np.array(ok, dtype=bool) & (high_bytes[:, 0] == mark)
+        valid &= (checksum_seed ^ self.config.CHECKSUM_XOR_KEY) == (seeds & 0xFF)
+        for name, value in self._constant_fields:
+            field = layout[name]
+            expected = np.frombuffer(bytes(value) if isinstance(value, bytes) else bytes([value]), dtype=np.uint8)
+            valid &= (rows[:, field.offset : field.offset + len(expected)] == expected).all(axis=1)
+
+        def strings(name: str) -> list[str]:
+            field = layout[name]
+            values = np.ascontiguousarray(rows[:, field.offset : field.end]).view(f"S{field.size}").reshape(count)
+            return [value.decode("utf-8", "replace") for value in values.tolist()]
+
+        columns = {
+            "valid": valid.astype(np.uint8),
+            "version": column("version", "<u4"),
+            "seed": seeds,
+            "timestamp_ms": np.where(low < 256, high + low, high),
+            "env_timestamp_ms": fingerprint_b,
+            "sequence": column("sequence", "<u4"),
+            "window_props_length": column("window_props_length", "<u4"),
+            "content_length": column("content_length", "<u4"),
+            "md5_prefix": column("md5_xor", "<u8") ^ ((seeds & 0xFF).astype(np.uint64) * np.uint64(_BYTE_MULTIPLIER)),
+            "a1": strings("a1"),
+            "source": strings("source"),
+            "checksum_version": rows[:, layout["checksum_version"].offset].copy(),
+            "checksum_seed": checksum_seed ^ np.uint8(self.config.CHECKSUM_XOR_KEY),
+        }
+        return self._clear_invalid(columns, ok)
+
+    @staticmethod
+    def _clear_invalid(columns: dict[str, Any], ok: list[bool]) -> dict[str, Any]:
+        """Zero the fields of signatures that failed to decode"""
+        for index, good in enumerate(ok):
+            if not good:
+                for values in columns.values():
+                    values[index] = "" if isinstance(values, list) else 0
+        return columns
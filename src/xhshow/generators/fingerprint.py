@@ -1,92 +1,137 @@
 """Browser fingerprint generator"""
 
 import hashlib
-import json
-import random
-import secrets
+import string
 import time
-import urllib.parse
-
-from Crypto.Cipher import ARC4
 
 from ..config import CryptoConfig
 from ..data import fingerprint_data as FPData
 from ..utils import encoder
+from ..utils.random_gen import RandomGenerator
+from ..utils.rc4 import RC4Keystream
+from ..utils.serializer import get_serializer
 from . import fingerprint_helpers as helpers
 
 __all__ = ["FingerprintGenerator"]
 
+# Characters `urllib.parse.quote(..., safe="!*'()~_-")` leaves unescaped
+_URL_SAFE_BYTES = (string.ascii_letters + string.digits + "_.-~" + "!*'()").encode("ascii")
+
 
 class FingerprintGenerator:
     """XHS Fingerprint generation function"""
 
-    def __init__(self, config: CryptoConfig):
+    # Fingerprint fields encrypted into b1, in serialization order
+    B1_KEYS = (
+        "x33",
+        "x34",
+        "x35",
+        "x36",
+        "x37",
+        "x38",
+        "x39",
+        "x42",
+        "x43",
+        "x44",
+        "x45",
+        "x46",
+        "x48",
+        "x49",
+        "x50",
+        "x51",
+        "x52",
+        "x82",
+    )
+
+    __slots__ = ("config", "random_generator", "_rc4", "_encoder", "_serializer")
+
+    def __init__(self, config: CryptoConfig, random_generator: RandomGenerator | None = None):
         self.config = config
-        self._b1_key = self.config.B1_SECRET_KEY.encode()
-        self._encoder = encoder.Base64Encoder(self.config)
+        self.random_generator = random_generator or RandomGenerator()
+        self._rc4 = RC4Keystream.shared(self.config)
+        self._encoder = encoder.Base64Encoder.shared(self.config)
+        self._serializer = get_serializer(self.config.JSON_SERIALIZER)
 
     def generate_b1(self, fp: dict) -> str:
         """
         Generate b1 parameter from fingerprint
 
         Args:
-            fp: Fingerprint dictionary
+            fp: Fingerprint dictionary, or the fields from `generate_b1_fields`
 
         Returns:
             Base64 encoded b1 string
         """
-        b1_fp = {
-            "x33": fp["x33"],
-            "x34": fp["x34"],
-            "x35": fp["x35"],
-            "x36": fp["x36"],
-            "x37": fp["x37"],
-            "x38": fp["x38"],
-            "x39": fp["x39"],
-            "x42": fp["x42"],
-            "x43": fp["x43"],
-            "x44": fp["x44"],
-            "x45": fp["x45"],
-            "x46": fp["x46"],
-            "x48": fp["x48"],
-            "x49": fp["x49"],
-            "x50": fp["x50"],
-            "x51": fp["x51"],
-            "x52": fp["x52"],
-            "x82": fp["x82"],
-        }
-        b1_json = json.dumps(b1_fp, separators=(",", ":"), ensure_ascii=False)
-        cipher = ARC4.new(self._b1_key)
-        ciphertext = cipher.encrypt(b1_json.encode("utf-8")).decode("latin1")
-        encoded_url = urllib.parse.quote(ciphertext, safe="!*'()~_-")
-        b = []
-        for c in encoded_url.split("%")[1:]:
-            chars = list(c)
-            b.append(int("".join(chars[:2]), 16))
-            [b.append(ord(j)) for j in chars[2:]]
-
-        b1 = self._encoder.encode(bytearray(b))
+        b1_fp = {key: fp[key] for key in self.B1_KEYS}
+        ciphertext = self._rc4.encrypt(self._serializer.dumps_bytes(b1_fp))
+
+        # Same bytes as percent-encoding the latin-1 ciphertext with
+        # `urllib.parse.quote` and decoding the escapes back: its UTF-8 form
+        # without the leading characters that quote leaves unescaped
+        encoded = ciphertext.decode("latin1").encode("utf-8").lstrip(_URL_SAFE_BYTES)
+        b1 = self._encoder.encode(encoded)
 
         return b1
 
-    def generate(self, cookies: dict, user_agent: str) -> dict:
+    def generate_b1_fields(self, timestamp: float | None = None) -> dict:
+        """
+        Generate only the fingerprint fields encrypted into b1
+
+        Skips the rest of the fingerprint (screen, WebGL, fonts, plugins,
+        cookie string); the only random draw is x36.
+
+        Args:
+            timestamp: Unix timestamp in seconds (defaults to current time)
+
+        Returns:
+            Fingerprint fields `B1_KEYS`, the same values `generate` would produce
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        return {
+            "x33": "0",
+            "x34": "0",
+            "x35": "0",
+            "x36": f"{self.random_generator.rng.randint(1, 20)}",
+            "x37": "0|0|0|0|0|0|0|0|0|1|0|0|0|0|0|0|0|0|1|0|0|0|0|0",
+            "x38": "0|0|1|0|1|0|0|0|0|0|1|0|1|0|1|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0",
+            "x39": 0,
+            "x42": "3.4.4",
+            "x43": helpers.generate_canvas_hash(),
+            "x44": f"{int(timestamp * 1000)}",
+            "x45": "__SEC_CAV__1-1-1-1-1|__SEC_WSA__|",
+            "x46": "false",
+            "x48": "",
+            "x49": "{list:[],type:}",
+            "x50": "",
+            "x51": "",
+            "x52": "",
+            "x82": "_0x17a2|_0x1954",
+        }
+
+    def generate(self, cookies: dict, user_agent: str, timestamp: float | None = None) -> dict:
         """
         Generate browser fingerprint
 
         Args:
             cookies: Cookie dictionary
             user_agent: User agent string
+            timestamp: Unix timestamp in seconds (defaults to current time)
 
         Returns:
             Complete fingerprint dictionary
         """
         cookie_string = "; ".join(f"{k}={v}" for k, v in cookies.items())
+        if timestamp is None:
+            timestamp = time.time()
+        rng = self.random_generator.rng
 
-        screen_config = helpers.get_screen_config()
-        is_incognito_mode = helpers.weighted_random_choice(["true", "false"], [0.95, 0.05])
-        vendor, renderer = helpers.get_renderer_info()
+        screen_config = helpers.get_screen_config(rng)
+        is_incognito_mode = helpers.weighted_random_choice(["true", "false"], [0.95, 0.05], rng)
+        vendor, renderer = helpers.get_renderer_info(rng)
 
-        x78_y = random.randint(2350, 2450)
+        x78_y = rng.randint(2350, 2450)
         fp = {
             "x1": user_agent,
             "x2": "false",
@@ -94,14 +139,16 @@ class FingerprintGenerator:
             "x4": helpers.weighted_random_choice(
                 FPData.COLOR_DEPTH_OPTIONS["values"],
                 FPData.COLOR_DEPTH_OPTIONS["weights"],
+                rng,
             ),
             "x5": helpers.weighted_random_choice(
                 FPData.DEVICE_MEMORY_OPTIONS["values"],
                 FPData.DEVICE_MEMORY_OPTIONS["weights"],
+                rng,
             ),
             "x6": "24",
             "x7": f"{vendor},{renderer}",
-            "x8": helpers.weighted_random_choice(FPData.CORE_OPTIONS["values"], FPData.CORE_OPTIONS["weights"]),
+            "x8": helpers.weighted_random_choice(FPData.CORE_OPTIONS["values"], FPData.CORE_OPTIONS["weights"], rng),
             "x9": f"{screen_config['width']};{screen_config['height']}",
             "x10": f"{screen_config['availWidth']};{screen_config['availHeight']}",
             "x11": "-480",
@@ -115,7 +162,7 @@ class FingerprintGenerator:
             "x19": "Win32",
             "x20": "",
             "x21": FPData.BROWSER_PLUGINS,
-            "x22": helpers.generate_webgl_hash(),
+            "x22": helpers.generate_webgl_hash(rng),
             "x23": "false",
             "x24": "false",
             "x25": "false",
@@ -124,28 +171,29 @@ class FingerprintGenerator:
             "x28": "0,false,false",
             "x29": "4,7,8",
             "x30": "swf object not loaded",
-            "x33": "0",
-            "x34": "0",
-            "x35": "0",
-            "x36": f"{random.randint(1, 20)}",
-            "x37": "0|0|0|0|0|0|0|0|0|1|0|0|0|0|0|0|0|0|1|0|0|0|0|0",
-            "x38": "0|0|1|0|1|0|0|0|0|0|1|0|1|0|1|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0|0",
-            "x39": 0,
+            # b1 fields are generated here so the random draws keep their order
+            "x33": (b1 := self.generate_b1_fields(timestamp))["x33"],
+            "x34": b1["x34"],
+            "x35": b1["x35"],
+            "x36": b1["x36"],
+            "x37": b1["x37"],
+            "x38": b1["x38"],
+            "x39": b1["x39"],
             "x40": "0",
             "x41": "0",
-            "x42": "3.4.4",
-            "x43": helpers.generate_canvas_hash(),
-            "x44": f"{int(time.time() * 1000)}",
-            "x45": "__SEC_CAV__1-1-1-1-1|__SEC_WSA__|",
-            "x46": "false",
+            "x42": b1["x42"],
+            "x43": b1["x43"],
+            "x44": b1["x44"],
+            "x45": b1["x45"],
+            "x46": b1["x46"],
             "x47": "1|0|0|0|0|0",
-            "x48": "",
-            "x49": "{list:[],type:}",
-            "x50": "",
-            "x51": "",
-            "x52": "",
+            "x48": b1["x48"],
+            "x49": b1["x49"],
+            "x50": b1["x50"],
+            "x51": b1["x51"],
+            "x52": b1["x52"],
             "x55": "380,380,360,400,380,400,420,380,400,400,360,360,440,420",
-            "x56": f"{vendor}|{renderer}|{helpers.generate_webgl_hash()}|35",
+            "x56": f"{vendor}|{renderer}|{helpers.generate_webgl_hash(rng)}|35",
             "x57": cookie_string,
             "x58": "180",
             "x59": "2",
@@ -182,10 +230,10 @@ class FingerprintGenerator:
                 "width": 290.828125,
                 "font": FPData.FONTS,
             },
-            "x82": "_0x17a2|_0x1954",
+            "x82": b1["x82"],
             "x31": "124.04347527516074",
             "x79": "144|599565058866",
-            "x53": hashlib.md5(secrets.token_bytes(32)).hexdigest(),
+            "x53": hashlib.md5(self.random_generator.token_bytes(32)).hexdigest(),
             "x54": FPData.VOICE_HASH_OPTIONS,
             "x80": "1|[object FileSystemDirectoryHandle]",
         }
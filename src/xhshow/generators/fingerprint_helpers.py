@@ -16,53 +16,61 @@ __all__ = [
 ]
 
 
-def weighted_random_choice(options: list, weights: list) -> Any:
+def weighted_random_choice(options: list, weights: list, rng: random.Random | None = None) -> Any:
     """
     Random choice a value from list according to the given weights
 
     Args:
         options: Option list
         weights: Weight list mapping the option list (without normalization)
+        rng: Random source, defaults to the module-level `random` state
 
     Returns:
         Randomly chosen value from options
     """
-    return f"{random.choices(options, weights=weights, k=1)[0]}"
+    return f"{(rng or random).choices(options, weights=weights, k=1)[0]}"
 
 
-def get_renderer_info() -> tuple[str, str]:
+def get_renderer_info(rng: random.Random | None = None) -> tuple[str, str]:
     """
     Get random GPU renderer information
 
+    Args:
+        rng: Random source, defaults to the module-level `random` state
+
     Returns:
         Tuple of (vendor, renderer)
     """
-    renderer_str = random.choice(FPData.GPU_VENDORS)
+    renderer_str = (rng or random).choice(FPData.GPU_VENDORS)
     vendor, renderer = renderer_str.split("|")
     return vendor, renderer
 
 
-def get_screen_config() -> dict[str, Any]:
+def get_screen_config(rng: random.Random | None = None) -> dict[str, Any]:
     """
     Get random screen configuration with width, height, and available dimensions
 
+    Args:
+        rng: Random source, defaults to the module-level `random` state
+
     Returns:
         Dictionary containing screen configuration
     """
     width_str, height_str = weighted_random_choice(
         FPData.SCREEN_RESOLUTIONS["resolutions"],
         FPData.SCREEN_RESOLUTIONS["weights"],
+        rng,
     ).split(";")
 
     width = int(width_str)
     height = int(height_str)
 
-    if random.choice([True, False]):
-        avail_width = width - int(weighted_random_choice([0, 30, 60, 80], [0.1, 0.4, 0.3, 0.2]))
+    if (rng or random).choice([True, False]):
+        avail_width = width - int(weighted_random_choice([0, 30, 60, 80], [0.1, 0.4, 0.3, 0.2], rng))
         avail_height = height
     else:
         avail_width = width
-        avail_height = height - int(weighted_random_choice([30, 60, 80, 100], [0.2, 0.5, 0.2, 0.1]))
+        avail_height = height - int(weighted_random_choice([30, 60, 80, 100], [0.2, 0.5, 0.2, 0.1], rng))
 
     return {
         "width": width,
@@ -82,11 +90,14 @@ def generate_canvas_hash() -> str:
     return FPData.CANVAS_HASH
 
 
-def generate_webgl_hash() -> str:
+def generate_webgl_hash(rng: random.Random | None = None) -> str:
     """
     Generate WebGL fingerprint hash
 
+    Args:
+        rng: Random source, defaults to `secrets.token_bytes`
+
     Returns:
         WebGL hash (MD5 hex string)
     """
-    return hashlib.md5(secrets.token_bytes(32)).hexdigest()
+    return hashlib.md5(rng.randbytes(32) if rng is not None else secrets.token_bytes(32)).hexdigest()
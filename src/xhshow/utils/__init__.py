@@ -2,7 +2,7 @@ from .bit_ops import BitOperations
 from .encoder import Base64Encoder
 from .hex_utils import HexProcessor
 from .random_gen import RandomGenerator
-from .url_utils import build_url, extract_uri
+from .url_utils import append_query, build_url, encode_query, extract_uri
 
 __all__ = [
     "BitOperations",
@@ -11,4 +11,6 @@ __all__ = [
     "RandomGenerator",
     "extract_uri",
     "build_url",
+    "encode_query",
+    "append_query",
 ]
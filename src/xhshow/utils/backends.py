@@ -0,0 +1,429 @@
+"""Interchangeable implementations of the signing primitives"""
+
+import base64
+import binascii
+import hashlib
+import time
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import _md5
+except ImportError:  # pragma: no cover - interpreter without the builtin module
+    _md5 = None
+
+__all__ = [
+    "PRIMITIVES",
+    "available_backends",
+    "backend_info",
+    "calibrate",
+    "get_backend",
+    "register_backend",
+    "select_backend",
+    "selected_backend",
+]
+
+STANDARD_BASE64_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+CRC32_POLY = 0xEDB88320
+
+# Each backend is a factory returning the callable used on the hot path:
+#   xor:    factory(key: bytes) -> f(data) -> bytes, XOR of the first len(key) bytes, rest unchanged
+#   base64: factory(alphabet: str) -> f(data) -> bytes, padded Base64 using a 64-character alphabet
+#   crc32:  factory() -> f(data: bytes) -> int, unsigned JS-style CRC32 (`(-1 ^ c ^ POLY) >>> 0`)
+#   md5:    factory() -> hash constructor supporting update / copy / digest
+PRIMITIVES = ("xor", "base64", "crc32", "md5")
+
+
+def _xor_loop(key: bytes) -> Callable[[Any], bytes]:
+    """Reference: per-byte XOR loop"""
+
+    def xor(data: Any) -> bytes:
+        result = bytearray(data)
+        for index in range(min(len(result), len(key))):
+            result[index] ^= key[index]
+        return bytes(result)
+
+    return xor
+
+
+def _xor_bigint(key: bytes) -> Callable[[Any], bytes]:
+    """Single big-integer XOR against the key"""
+    key_length = len(key)
+    key_int = int.from_bytes(key, "big")
+
+    def xor(data: Any) -> bytes:
+        length = len(data)
+        if length >= key_length:
+            head = (int.from_bytes(data[:key_length], "big") ^ key_int).to_bytes(key_length, "big")
+            return head + bytes(data[key_length:]) if length > key_length else head
+        return (int.from_bytes(data, "big") ^ (key_int >> (8 * (key_length - length)))).to_bytes(length, "big")
+
+    return xor
+
+
+def _xor_numpy(key: bytes) -> Callable[[Any], bytes]:
+    """NumPy uint8 array XOR"""
+    key_array = np.frombuffer(key, dtype=np.uint8)
+
+    def xor(data: Any) -> bytes:
+        result = np.frombuffer(bytes(data), dtype=np.uint8).copy()
+        head = min(len(result), len(key_array))
+        result[:head] ^= key_array[:head]
+        return result.tobytes()
+
+    return xor
+
+
+def _base64_translate(alphabet: str) -> Callable[[Any], bytes]:
+    """Reference: `base64.b64encode` then `bytes.translate` to the alphabet"""
+    table = bytes.maketrans(STANDARD_BASE64_ALPHABET.encode(), alphabet.encode())
+    b64encode = base64.b64encode
+
+    def encode(data: Any) -> bytes:
+        return b64encode(data).translate(table)
+
+    return encode
+
+
+def _base64_binascii(alphabet: str) -> Callable[[Any], bytes]:
+    """`binascii.b2a_base64` without the `base64` module wrapper, then `bytes.translate`"""
+    table = bytes.maketrans(STANDARD_BASE64_ALPHABET.encode(), alphabet.encode())
+    b2a_base64 = binascii.b2a_base64
+
+    def encode(data: Any) -> bytes:
+        return b2a_base64(data, newline=False).translate(table)
+
+    return encode
+
+
+def _base64_numpy(alphabet: str) -> Callable[[Any], bytes]:
+    """NumPy 6-bit index split and alphabet array lookup"""
+    table = np.frombuffer(alphabet.encode(), dtype=np.uint8)
+
+    def encode(data: Any) -> bytes:
+        length = len(data)
+        groups = -(-length // 3)
+        padded = np.zeros(groups * 3, dtype=np.uint32)
+        padded[:length] = np.frombuffer(bytes(data), dtype=np.uint8)
+        triples = padded.reshape(groups, 3)
+        values = (triples[:, 0] << 16) | (triples[:, 1] << 8) | triples[:, 2]
+        indices = np.stack([values >> 18, (values >> 12) & 0x3F, (values >> 6) & 0x3F, values & 0x3F], axis=1)
+        encoded = table[indices.reshape(-1)]
+        padding = groups * 3 - length
+        if padding:
+            encoded[-padding:] = ord("=")
+        return encoded.tobytes()
+
+    return encode
+
+
+def _crc32_table() -> Callable[[bytes], int]:
+    """Reference: table-driven CRC32 loop"""
+    table = []
+    for value in range(256):
+        for _ in range(8):
+            value = (value >> 1) ^ CRC32_POLY if value & 1 else value >> 1
+        table.append(value)
+
+    def crc32(data: bytes) -> int:
+        state = 0xFFFFFFFF
+        for byte in data:
+            state = table[(state ^ byte) & 0xFF] ^ (state >> 8)
+        return (0xFFFFFFFF ^ state ^ CRC32_POLY) & 0xFFFFFFFF
+
+    return crc32
+
+
+def _crc32_zlib() -> Callable[[bytes], int]:
+    """`zlib.crc32`; its final NOT cancels against the JS-style `-1 ^ c`"""
+    zlib_crc32 = zlib.crc32
+
+    def crc32(data: bytes) -> int:
+        return zlib_crc32(data) ^ CRC32_POLY
+
+    return crc32
+
+
+def _md5_hashlib() -> Callable[..., Any]:
+    """Reference: `hashlib.md5` (OpenSSL when available, releases the GIL on large inputs)"""
+    return hashlib.md5
+
+
+def _md5_builtin() -> Callable[..., Any]:
+    """CPython builtin `_md5` module (lower per-call overhead on short inputs)"""
+    return _md5.md5
+
+
+_REGISTRY: dict[str, dict[str, Callable[..., Any]]] = {primitive: {} for primitive in PRIMITIVES}
+_verified: dict[tuple[str, str], bool] = {}
+_selected: dict[str, str] = {}
+_timings: dict[str, dict[str, float]] = {}
+
+# Preferred order before calibration; the first registered backend is the reference
+_PREFERENCE: dict[str, tuple[str, ...]] = {
+    "xor": ("bigint", "numpy", "loop"),
+    "base64": ("translate", "binascii", "numpy"),
+    "crc32": ("zlib", "table"),
+    "md5": ("hashlib", "builtin"),
+}
+
+
+def register_backend(primitive: str, name: str, factory: Callable[..., Any]) -> None:
+    """
+    Register an implementation of a primitive
+
+    The backend is only used after it matches the reference implementation
+    (the first backend registered for the primitive) on the built-in corpus.
+
+    Args:
+        primitive: One of `PRIMITIVES`
+        name: Backend name
+        factory: Factory returning the hot-path callable (see `PRIMITIVES`)
+
+    Raises:
+        ValueError: Unknown primitive
+    """
+    if primitive not in _REGISTRY:
+        raise ValueError(f"Unknown primitive '{primitive}', expected one of {PRIMITIVES}")
+    _REGISTRY[primitive][name] = factory
+    _verified.pop((primitive, name), None)
+
+
+register_backend("xor", "loop", _xor_loop)
+register_backend("xor", "bigint", _xor_bigint)
+register_backend("base64", "translate", _base64_translate)
+register_backend("base64", "binascii", _base64_binascii)
+register_backend("crc32", "table", _crc32_table)
+register_backend("crc32", "zlib", _crc32_zlib)
+register_backend("md5", "hashlib", _md5_hashlib)
+if _md5 is not None:
+    register_backend("md5", "builtin", _md5_builtin)
+if np is not None:
+    register_backend("xor", "numpy", _xor_numpy)
+    register_backend("base64", "numpy", _base64_numpy)
+
+
+def _sample(length: int, salt: int) -> bytes:
+    return bytes((index * 131 + salt * 17 + (index >> 3)) & 0xFF for index in range(length))
+
+
+def _xor_outputs(factory: Callable[..., Any]) -> list[bytes]:
+    outputs = []
+    for key_length in (1, 16, 124):
+        xor = factory(_sample(key_length, key_length))
+        outputs.extend(xor(_sample(length, 7)) for length in (0, 1, key_length - 1, key_length, key_length + 9, 300))
+        outputs.append(xor(memoryview(_sample(key_length + 3, 1))))
+    return outputs
+
+
+def _base64_outputs(factory: Callable[..., Any]) -> list[bytes]:
+    outputs = []
+    for alphabet in (STANDARD_BASE64_ALPHABET, STANDARD_BASE64_ALPHABET[::-1]):
+        encode = factory(alphabet)
+        outputs.extend(encode(_sample(length, 3)) for length in (0, 1, 2, 3, 4, 5, 124, 125, 126, 512))
+        outputs.append(encode(bytearray(_sample(124, 5))))
+        outputs.append(encode(memoryview(_sample(125, 6))))
+    return outputs
+
+
+def _crc32_outputs(factory: Callable[..., Any]) -> list[int]:
+    crc32 = factory()
+    return [crc32(data) for data in (b"", b"a", b"test_data", bytes(range(256)), _sample(3000, 9))]
+
+
+def _md5_outputs(factory: Callable[..., Any]) -> list[bytes]:
+    constructor = factory()
+    outputs = [constructor(_sample(length, 2)).digest() for length in (0, 1, 55, 56, 64, 1000)]
+    state = constructor(b"/api/sns/web/v1/user_posted?")
+    for tail in (b"", b"num=30", _sample(5000, 4)):
+        copied = state.copy()
+        copied.update(tail)
+        outputs.append(copied.digest())
+    outputs.append(state.digest())
+    return outputs
+
+
+_CORPUS_OUTPUTS: dict[str, Callable[[Callable[..., Any]], list[Any]]] = {
+    "xor": _xor_outputs,
+    "base64": _base64_outputs,
+    "crc32": _crc32_outputs,
+    "md5": _md5_outputs,
+}
+
+
+def _passes_equivalence(primitive: str, name: str) -> bool:
+    """Check a backend against the primitive's reference backend on the corpus (cached)"""
+    key = (primitive, name)
+    result = _verified.get(key)
+    if result is None:
+        backends = _REGISTRY[primitive]
+        reference = next(iter(backends.values()))
+        outputs = _CORPUS_OUTPUTS[primitive]
+        try:
+            result = outputs(backends[name]) == outputs(reference)
+        except Exception:
+            result = False
+        _verified[key] = result
+    return result
+
+
+def available_backends(primitive: str) -> list[str]:
+    """
+    List registered backends of a primitive that pass the equivalence checks
+
+    Args:
+        primitive: One of `PRIMITIVES`
+
+    Returns:
+        list[str]: Backend names in registration order, reference first
+    """
+    return [name for name in _REGISTRY[primitive] if _passes_equivalence(primitive, name)]
+
+
+def selected_backend(primitive: str) -> str:
+    """
+    Get the name of the selected backend of a primitive
+
+    Without an explicit selection or calibration, the first available backend
+    in the default preference order is selected.
+
+    Args:
+        primitive: One of `PRIMITIVES`
+
+    Returns:
+        str: Backend name
+    """
+    name = _selected.get(primitive)
+    if name is None:
+        available = available_backends(primitive)
+        preferred = [candidate for candidate in _PREFERENCE.get(primitive, ()) if candidate in available]
+        name = _selected[primitive] = (preferred or available)[0]
+    return name
+
+
+def get_backend(primitive: str, name: str | None = None) -> Callable[..., Any]:
+    """
+    Get the factory of a primitive backend
+
+    Args:
+        primitive: One of `PRIMITIVES`
+        name: Backend name, None for the selected backend
+
+    Returns:
+        Callable: Backend factory (see `PRIMITIVES` for its signature)
+
+    Raises:
+        ValueError: Unknown or non-equivalent backend
+
+    Examples:
+        >>> xor = get_backend("xor")(bytes.fromhex("af572b95"))
+        >>> xor(b"abcdef")
+    """
+    if name is None:
+        name = selected_backend(primitive)
+    if name not in _REGISTRY[primitive]:
+        raise ValueError(f"{primitive} backend '{name}' is not available")
+    if not _passes_equivalence(primitive, name):
+        raise ValueError(f"{primitive} backend '{name}' does not match the reference implementation")
+    return _REGISTRY[primitive][name]
+
+
+def select_backend(primitive: str, name: str) -> None:
+    """
+    Select the backend used by objects created afterwards
+
+    Args:
+        primitive: One of `PRIMITIVES`
+        name: Backend name
+
+    Raises:
+        ValueError: Unknown or non-equivalent backend
+    """
+    get_backend(primitive, name)
+    _selected[primitive] = name
+
+
+def _workload(primitive: str, factory: Callable[..., Any]) -> Callable[[], Any]:
+    """Representative per-signature call of a primitive"""
+    if primitive == "xor":
+        xor = factory(_sample(124, 1))
+        payload = _sample(124, 2)
+        return lambda: xor(payload)
+    if primitive == "base64":
+        encode = factory(STANDARD_BASE64_ALPHABET[::-1])
+        payload = _sample(124, 3)
+        return lambda: encode(payload)
+    if primitive == "crc32":
+        crc32 = factory()
+        b1 = _sample(400, 4)
+        return lambda: crc32(b1)
+    constructor = factory()
+    state = constructor(b"/api/sns/web/v1/user_posted?")
+    tail = b"num=30&cursor=&user_id=5ff0e6410000000001008400&image_formats=jpg,webp,avif"
+
+    def digest() -> bytes:
+        copied = state.copy()
+        copied.update(tail)
+        return copied.digest()
+
+    return digest
+
+
+def calibrate(primitives: tuple[str, ...] = PRIMITIVES, number: int = 2000, repeat: int = 3) -> dict[str, str]:
+    """
+    Time every equivalent backend on this interpreter and select the fastest
+
+    Objects created after calibration use the selected backends.
+
+    Args:
+        primitives: Primitives to calibrate
+        number: Calls per timing run
+        repeat: Timing runs per backend (best is kept)
+
+    Returns:
+        dict[str, str]: Selected backend name per primitive
+
+    Examples:
+        >>> calibrate()
+        {'xor': 'bigint', 'base64': 'translate', 'crc32': 'zlib', 'md5': 'builtin'}
+    """
+    for primitive in primitives:
+        timings = {}
+        for name in available_backends(primitive):
+            call = _workload(primitive, _REGISTRY[primitive][name])
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(number):
+                    call()
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best / number * 1e6
+        _timings[primitive] = timings
+        _selected[primitive] = min(timings, key=timings.__getitem__)
+    return {primitive: selected_backend(primitive) for primitive in primitives}
+
+
+def backend_info() -> dict[str, dict[str, Any]]:
+    """
+    Describe the registered, available and selected backends
+
+    Returns:
+        dict: Per primitive: `selected` backend name, `available` backends
+            passing the equivalence checks, `registered` backends and
+            `timings_us` from the last calibration (empty if not calibrated)
+    """
+    return {
+        primitive: {
+            "selected": selected_backend(primitive),
+            "available": available_backends(primitive),
+            "registered": list(_REGISTRY[primitive]),
+            "timings_us": dict(_timings.get(primitive, {})),
+        }
+        for primitive in PRIMITIVES
+    }
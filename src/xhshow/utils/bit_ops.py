@@ -1,6 +1,8 @@
 """Bit operations and seed transformation module"""
 
 from ..config import CryptoConfig
+from .backends import get_backend, selected_backend
+from .shared import shared_instance
 
 __all__ = ["BitOperations"]
 
@@ -8,8 +10,25 @@ __all__ = ["BitOperations"]
 class BitOperations:
     """Bit operations and seed transformation utility class"""
 
+    __slots__ = ("config", "_key_bytes", "_xor_bytes")
+
     def __init__(self, config: CryptoConfig):
         self.config = config
+        self._key_bytes = bytes.fromhex(config.HEX_KEY)
+        self._xor_bytes = get_backend("xor")(self._key_bytes)
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "BitOperations":
+        """
+        Get the process-wide instance for a config and selected `xor` backend
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            BitOperations: Shared instance
+        """
+        return shared_instance(cls, config, selected_backend("xor"))
 
     def normalize_to_32bit(self, value: int) -> int:
         """
@@ -70,7 +89,7 @@ class BitOperations:
             bytearray: Transformed byte array
         """
         result_bytes = bytearray(len(source_integers))
-        key_bytes = bytes.fromhex(self.config.HEX_KEY)
+        key_bytes = self._key_bytes
         key_length = len(key_bytes)
 
         for index in range(len(source_integers)):
@@ -80,3 +99,19 @@ class BitOperations:
                 result_bytes[index] = source_integers[index] & 0xFF
 
         return result_bytes
+
+    def xor_transform_bytes(self, source_bytes: bytes | bytearray | memoryview) -> bytes:
+        """
+        Perform XOR transformation on a byte buffer
+
+        Equivalent to `xor_transform_array` for byte input, computed by the
+        `xor` backend selected when this object was created (a single
+        big-integer XOR by default, see `xhshow.utils.backends`).
+
+        Args:
+            source_bytes: Source byte buffer
+
+        Returns:
+            bytes: Transformed bytes (same length as the input)
+        """
+        return self._xor_bytes(source_bytes)
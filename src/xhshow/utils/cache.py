@@ -0,0 +1,156 @@
+"""Bounded caches with usage statistics"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+__all__ = ["CacheStats", "LRUCache", "TTLCache"]
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    """Cache usage statistics"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss/eviction counters"""
+
+    __slots__ = ("maxsize", "_data", "_lock", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of entries, 0 disables caching
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Any: Cached value or `default`
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get cache usage statistics
+
+        Returns:
+            CacheStats: Hits, misses, evictions, current size and maximum size
+        """
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries expire a fixed time after they are stored (expired entries count as evictions)"""
+
+    __slots__ = ("ttl", "_clock")
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize: Maximum number of entries, 0 disables caching
+            ttl: Entry lifetime in seconds
+            clock: Monotonic clock in seconds
+        """
+        if ttl <= 0:
+            raise ValueError(f"ttl must be > 0, got {ttl}")
+
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._clock = clock
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a live cached value and mark it as recently used
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or for an expired entry
+
+        Returns:
+            Any: Cached value or `default`
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] <= self._clock():
+                del self._data[key]
+                self.evictions += 1
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for `ttl` seconds, evicting the least recently used entry when full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        super().put(key, (self._clock() + self.ttl, value))
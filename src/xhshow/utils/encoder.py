@@ -2,14 +2,41 @@
 
 import base64
 import binascii
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from ..config import CryptoConfig
+from .backends import get_backend, selected_backend
+from .shared import shared_instance
 
 __all__ = ["Base64Encoder"]
 
+BytesLike = bytes | bytearray | memoryview
+
+# Separates items of a batch; never part of a Base64 alphabet
+_SEPARATOR = b"\n"
+
+
+def _split_buffer(data: BytesLike | str, offsets: Sequence[int]) -> list:
+    """Slice a concatenated buffer at `offsets` (item i is `data[offsets[i]:offsets[i + 1]]`) without copying"""
+    source = data if isinstance(data, str) else memoryview(data)
+    return list(map(source.__getitem__, map(slice, offsets[:-1], offsets[1:])))
+
 
 class Base64Encoder:
+    __slots__ = (
+        "config",
+        "_custom_encode_table",
+        "_custom_decode_table",
+        "_x3_encode_table",
+        "_x3_decode_table",
+        "_encode_custom_bytes",
+        "_encode_x3_bytes",
+        "_custom_encode_bytes_table",
+        "_custom_decode_bytes_table",
+        "_x3_encode_bytes_table",
+        "_x3_decode_bytes_table",
+    )
+
     def __init__(self, config: CryptoConfig):
         self.config = config
         # Cache translation tables for better performance
@@ -29,6 +56,30 @@ class Base64Encoder:
             config.X3_BASE64_ALPHABET,
             config.STANDARD_BASE64_ALPHABET,
         )
+        standard = config.STANDARD_BASE64_ALPHABET.encode()
+        self._custom_encode_bytes_table = bytes.maketrans(standard, config.CUSTOM_BASE64_ALPHABET.encode())
+        self._custom_decode_bytes_table = bytes.maketrans(config.CUSTOM_BASE64_ALPHABET.encode(), standard)
+        self._x3_encode_bytes_table = bytes.maketrans(standard, config.X3_BASE64_ALPHABET.encode())
+        self._x3_decode_bytes_table = bytes.maketrans(config.X3_BASE64_ALPHABET.encode(), standard)
+        base64_backend = get_backend("base64")
+        self._encode_custom_bytes = base64_backend(config.CUSTOM_BASE64_ALPHABET)
+        self._encode_x3_bytes = base64_backend(config.X3_BASE64_ALPHABET)
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "Base64Encoder":
+        """
+        Get the process-wide encoder for a config
+
+        Translation tables are built once per distinct config value and
+        selected `base64` backend; encoders hold no mutable state.
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            Base64Encoder: Shared encoder instance
+        """
+        return shared_instance(cls, config, selected_backend("base64"))
 
     def encode(self, data_to_encode: bytes | str | Iterable[int]) -> str:
         """
@@ -47,10 +98,20 @@ class Base64Encoder:
         else:
             # Iterable[int] case
             data_bytes = bytearray(data_to_encode)
-        standard_encoded_bytes = base64.b64encode(data_bytes)
-        standard_encoded_string = standard_encoded_bytes.decode("utf-8")
 
-        return standard_encoded_string.translate(self._custom_encode_table)
+        return self.encode_bytes(data_bytes).decode("utf-8")
+
+    def encode_bytes(self, data_bytes: bytes | bytearray | memoryview) -> bytes:
+        """
+        Encode bytes using custom Base64 alphabet without leaving bytes
+
+        Args:
+            data_bytes: Input byte data
+
+        Returns:
+            bytes: ASCII Base64 bytes encoded using custom alphabet
+        """
+        return self._encode_custom_bytes(data_bytes)
 
     def decode(self, encoded_string: str) -> str:
         """
@@ -104,7 +165,128 @@ class Base64Encoder:
         Returns:
             str: Base64 encoded string with X3 custom alphabet
         """
-        standard_encoded_bytes = base64.b64encode(input_bytes)
-        standard_encoded_string = standard_encoded_bytes.decode("utf-8")
+        return self.encode_x3_bytes(input_bytes).decode("utf-8")
+
+    def encode_x3_bytes(self, input_bytes: bytes | bytearray | memoryview) -> bytes:
+        """
+        Encode x3 signature using X3_BASE64_ALPHABET without leaving bytes
+
+        Args:
+            input_bytes: Input byte data
+
+        Returns:
+            bytes: ASCII Base64 bytes encoded with X3 custom alphabet
+        """
+        return self._encode_x3_bytes(input_bytes)
+
+    def encode_many(self, items: Sequence[BytesLike] | BytesLike, offsets: Sequence[int] | None = None) -> list[bytes]:
+        """
+        Encode a batch of byte strings using custom Base64 alphabet
+
+        Items are Base64 encoded by `map` over `binascii.b2a_base64`, joined,
+        and mapped to the custom alphabet with one translation over the batch.
+
+        Args:
+            items: Byte strings, or one concatenated buffer when `offsets` is given
+            offsets: Item boundaries in the buffer, `len(items) + 1` entries
+                (item i is `buffer[offsets[i]:offsets[i + 1]]`)
+
+        Returns:
+            list[bytes]: ASCII Base64 bytes per item, equal to `encode_bytes(item)`
+
+        Examples:
+            >>> encoder.encode_many([b"a", b"bc"])
+            >>> encoder.encode_many(b"abc", offsets=[0, 1, 3])
+        """
+        return self._encode_many(items, offsets, self._custom_encode_bytes_table)
+
+    def encode_x3_many(
+        self, items: Sequence[BytesLike] | BytesLike, offsets: Sequence[int] | None = None
+    ) -> list[bytes]:
+        """
+        Encode a batch of x3 payloads using X3_BASE64_ALPHABET
+
+        Args:
+            items: Byte strings, or one concatenated buffer when `offsets` is given
+            offsets: Item boundaries in the buffer, `len(items) + 1` entries
+
+        Returns:
+            list[bytes]: ASCII Base64 bytes per item, equal to `encode_x3_bytes(item)`
+        """
+        return self._encode_many(items, offsets, self._x3_encode_bytes_table)
 
-        return standard_encoded_string.translate(self._x3_encode_table)
+    def decode_many(
+        self, items: Sequence[str | BytesLike] | str | BytesLike, offsets: Sequence[int] | None = None
+    ) -> list[bytes]:
+        """
+        Decode a batch of strings encoded with custom Base64 alphabet
+
+        Unlike `decode`, results stay bytes (no UTF-8 decoding). The batch is
+        joined and mapped to the standard alphabet with one translation.
+
+        Args:
+            items: Encoded strings (all str or all bytes-like), or one
+                concatenated buffer when `offsets` is given
+            offsets: Item boundaries in the buffer, `len(items) + 1` entries
+
+        Returns:
+            list[bytes]: Decoded bytes per item
+
+        Raises:
+            ValueError: Base64 decoding failed
+        """
+        return self._decode_many(items, offsets, self._custom_decode_bytes_table)
+
+    def decode_x3_many(
+        self, items: Sequence[str | BytesLike] | str | BytesLike, offsets: Sequence[int] | None = None
+    ) -> list[bytes]:
+        """
+        Decode a batch of x3 signatures using X3_BASE64_ALPHABET
+
+        Args:
+            items: Encoded x3 values (all str or all bytes-like), or one
+                concatenated buffer when `offsets` is given
+            offsets: Item boundaries in the buffer, `len(items) + 1` entries
+
+        Returns:
+            list[bytes]: Decoded bytes per item, equal to `decode_x3(item)`
+
+        Raises:
+            ValueError: Base64 decoding failed
+        """
+        return self._decode_many(items, offsets, self._x3_decode_bytes_table)
+
+    @staticmethod
+    def _encode_many(
+        items: Sequence[BytesLike] | BytesLike, offsets: Sequence[int] | None, table: bytes
+    ) -> list[bytes]:
+        """Encode items with one join, one translation and one split over the batch"""
+        if offsets is not None:
+            items = _split_buffer(items, offsets)
+        # b2a_base64 terminates each item with the separator
+        return b"".join(map(binascii.b2a_base64, items)).translate(table).split(_SEPARATOR)[:-1]
+
+    @staticmethod
+    def _decode_many(
+        items: Sequence[str | BytesLike] | str | BytesLike, offsets: Sequence[int] | None, table: bytes
+    ) -> list[bytes]:
+        """Decode items with one join, one translation and one split over the batch"""
+        if offsets is not None:
+            items = _split_buffer(items, offsets)
+        if not items:
+            return []
+
+        try:
+            if isinstance(items[0], str):
+                joined = "\n".join(items).encode("ascii")
+            else:
+                joined = _SEPARATOR.join(items)
+            parts = joined.translate(table).split(_SEPARATOR)
+            if len(parts) != len(items):
+                # Separator inside an item: translate items one by one
+                parts = [
+                    (item.encode("ascii") if isinstance(item, str) else bytes(item)).translate(table) for item in items
+                ]
+            return list(map(binascii.a2b_base64, parts))
+        except (binascii.Error, ValueError) as e:
+            raise ValueError("Invalid Base64 input: unable to decode string") from e
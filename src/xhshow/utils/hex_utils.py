@@ -1,6 +1,7 @@
 """Hexadecimal processing module"""
 
 from ..config import CryptoConfig
+from .shared import shared_instance
 
 __all__ = ["HexProcessor"]
 
@@ -8,9 +9,24 @@ __all__ = ["HexProcessor"]
 class HexProcessor:
     """Hexadecimal data processing utility class"""
 
+    __slots__ = ("config",)
+
     def __init__(self, config: CryptoConfig):
         self.config = config
 
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "HexProcessor":
+        """
+        Get the process-wide instance for a config
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            HexProcessor: Shared instance
+        """
+        return shared_instance(cls, config)
+
     def hex_string_to_bytes(self, hex_string: str) -> list[int]:
         """
         Convert hexadecimal string to byte array
@@ -1,16 +1,78 @@
+import os
 import random
+import threading
 import time
+import weakref
+from collections.abc import Sequence
 
-from ..config import CryptoConfig
+from .shared import intern_config
 
 __all__ = ["RandomGenerator"]
 
+# Unseeded generators are reseeded in forked children so processes never share a stream
+_unseeded_generators: "weakref.WeakSet[RandomGenerator]" = weakref.WeakSet()
+
 
 class RandomGenerator:
-    """Random number generator utility"""
+    """
+    Random number generator utility
+
+    Each generator owns an independent `random.Random` stream used for every
+    random value of a client: payload fields, trace IDs and fingerprint
+    sampling. Passing a seed makes the whole stream reproducible.
+    """
+
+    # 64-bit words fetched per entropy pool refill
+    POOL_WORDS = 512
+
+    def __init__(self, seed: int | str | bytes | None = None):
+        """
+        Args:
+            seed: Seed of the random stream, None seeds from OS entropy
+                (and reseeds automatically in forked child processes)
+        """
+        self.config = intern_config()
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._pools = threading.local()
+        if seed is None:
+            _unseeded_generators.add(self)
+        self._field_plans: dict[tuple[tuple[int, int], ...], tuple[tuple[tuple[int, int], ...], int, int]] = {}
+
+    def spawn(self) -> "RandomGenerator":
+        """
+        Create an independent child generator, e.g. one per thread or worker process
+
+        Children of a seeded generator are seeded from its stream, so a
+        seeded parent spawns the same children in the same order.
+
+        Returns:
+            RandomGenerator: New generator with its own stream
+
+        Examples:
+            >>> parent = RandomGenerator(seed=42)
+            >>> workers = [parent.spawn() for _ in range(4)]
+        """
+        if self.seed is None:
+            return RandomGenerator()
+        return RandomGenerator(seed=self.rng.getrandbits(128))
+
+    def token_bytes(self, byte_count: int) -> bytes:
+        """
+        Generate random bytes from this generator's stream
+
+        Args:
+            byte_count (int): Number of bytes to generate
 
-    def __init__(self):
-        self.config = CryptoConfig()
+        Returns:
+            bytes: Random bytes
+        """
+        return self.rng.randbytes(byte_count)
+
+    def _reseed(self) -> None:
+        """Reseed from OS entropy and drop buffered words (after fork)"""
+        self.rng.seed()
+        self._pools = threading.local()
 
     def generate_random_bytes(self, byte_count: int) -> list[int]:
         """
@@ -22,7 +84,7 @@ class RandomGenerator:
         Returns:
             list[int]: Random byte array
         """
-        return [random.randint(0, self.config.MAX_BYTE) for _ in range(byte_count)]
+        return [self.rng.randint(0, self.config.MAX_BYTE) for _ in range(byte_count)]
 
     def generate_random_byte_in_range(self, min_val: int, max_val: int) -> int:
         """
@@ -35,7 +97,7 @@ class RandomGenerator:
         Returns:
             int: Random integer in specified range
         """
-        return random.randint(min_val, max_val)
+        return self.rng.randint(min_val, max_val)
 
     def generate_random_int(self) -> int:
         """
@@ -44,7 +106,68 @@ class RandomGenerator:
         Returns:
             int: Random 32-bit integer
         """
-        return random.randint(0, self.config.MAX_32BIT)
+        return self.rng.randint(0, self.config.MAX_32BIT)
+
+    def generate_fields(self, bounds: Sequence[tuple[int, int]]) -> tuple[int, ...]:
+        """
+        Generate several independent uniform integers from a single pooled draw
+
+        Equivalent in distribution to one `random.randint(min, max)` per
+        field: one 64-bit word from the thread's entropy pool is mapped to the
+        product of the field ranges (rejection sampling keeps it exactly
+        uniform) and split into the fields with divmod.
+
+        Args:
+            bounds: Inclusive `(min, max)` range of each field
+
+        Returns:
+            tuple[int, ...]: One random integer per field, in the order of `bounds`
+
+        Examples:
+            >>> generator = RandomGenerator()
+            >>> seed, offset = generator.generate_fields(((0, 0xFFFFFFFF), (10, 50)))
+        """
+        plan = self._field_plans.get(bounds)
+        if plan is None:
+            plan = self._field_plans[bounds] = self._plan_fields(bounds)
+        fields_plan, total, limit = plan
+
+        if not limit:
+            value = self.rng.randrange(total)
+        else:
+            value = self._next_word()
+            while value >= limit:
+                value = self._next_word()
+
+        fields = []
+        for min_val, span in fields_plan:
+            value, offset = divmod(value, span)
+            fields.append(min_val + offset)
+        return tuple(fields)
+
+    @staticmethod
+    def _plan_fields(bounds: Sequence[tuple[int, int]]) -> tuple[tuple[tuple[int, int], ...], int, int]:
+        """Precompute (min, span) per field, the span product and the rejection limit for 64-bit draws"""
+        fields_plan = tuple((min_val, max_val - min_val + 1) for min_val, max_val in bounds)
+        if any(span <= 0 for _, span in fields_plan):
+            raise ValueError(f"Invalid field bounds: {bounds!r}")
+
+        total = 1
+        for _, span in fields_plan:
+            total *= span
+
+        # Largest multiple of `total` representable in 64 bits (0: too wide for one word)
+        limit = (1 << 64) // total * total
+        return fields_plan, total, limit
+
+    def _next_word(self) -> int:
+        """Take the next 64-bit word from this thread's entropy pool, refilling it in bulk"""
+        try:
+            return next(self._pools.words)
+        except (AttributeError, StopIteration):
+            block = self.rng.getrandbits(64 * self.POOL_WORDS).to_bytes(8 * self.POOL_WORDS, "little")
+            pool = self._pools.words = iter(memoryview(block).cast("Q"))
+            return next(pool)
 
     def generate_b3_trace_id(self) -> str:
         """
@@ -53,7 +176,7 @@ class RandomGenerator:
         Returns:
             str: 16-character hexadecimal trace ID
         """
-        return "".join(random.choice(self.config.HEX_CHARS) for _ in range(self.config.B3_TRACE_ID_LENGTH))
+        return "".join(self.rng.choice(self.config.HEX_CHARS) for _ in range(self.config.B3_TRACE_ID_LENGTH))
 
     def generate_xray_trace_id(self, timestamp: int | None = None, seq: int | None = None) -> str:
         """
@@ -69,7 +192,7 @@ class RandomGenerator:
         if timestamp is None:
             timestamp = int(time.time() * 1000)
         if seq is None:
-            seq = random.randint(0, self.config.XRAY_TRACE_ID_SEQ_MAX)
+            seq = self.rng.randint(0, self.config.XRAY_TRACE_ID_SEQ_MAX)
 
         # First 16 chars: XHS xray parameter uses timestamp bit operations
         part1 = format(
@@ -77,6 +200,15 @@ class RandomGenerator:
             f"0{self.config.XRAY_TRACE_ID_PART1_LENGTH}x",
         )
         # Last 16 chars: completely random, untraceable, can be simplified
-        part2 = "".join(random.choice(self.config.HEX_CHARS) for _ in range(self.config.XRAY_TRACE_ID_PART2_LENGTH))
+        part2 = "".join(self.rng.choice(self.config.HEX_CHARS) for _ in range(self.config.XRAY_TRACE_ID_PART2_LENGTH))
 
         return part1 + part2
+
+
+def _reseed_after_fork() -> None:
+    for generator in list(_unseeded_generators):
+        generator._reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
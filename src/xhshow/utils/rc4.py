@@ -0,0 +1,105 @@
+"""Fixed-key RC4 keystream"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from ..config import CryptoConfig
+from .backends import get_backend, selected_backend
+from .shared import shared_instance
+
+__all__ = ["RC4Keystream", "rc4_keystream"]
+
+
+def rc4_keystream(key: bytes, size: int) -> bytes:
+    """
+    Generate the first bytes of an RC4 keystream
+
+    Args:
+        key: RC4 key (1 to 256 bytes)
+        size: Number of keystream bytes
+
+    Returns:
+        bytes: Keystream, `RC4(key).encrypt(bytes(size))`
+    """
+    state = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + state[i] + key[i % len(key)]) & 0xFF
+        state[i], state[j] = state[j], state[i]
+
+    keystream = bytearray(size)
+    i = j = 0
+    for index in range(size):
+        i = (i + 1) & 0xFF
+        j = (j + state[i]) & 0xFF
+        state[i], state[j] = state[j], state[i]
+        keystream[index] = state[(state[i] + state[j]) & 0xFF]
+    return bytes(keystream)
+
+
+class RC4Keystream:
+    """
+    RC4 keystream of the b1 key (`B1_SECRET_KEY`) compiled once per config
+
+    b1 is encrypted with a constant key and no nonce, so every message uses
+    the same keystream prefix and encryption is a single XOR (`xor` backend)
+    against it. The keystream starts at `INITIAL_SIZE` bytes and doubles
+    whenever a longer message arrives.
+    """
+
+    # b1 plaintext is about 420 bytes
+    INITIAL_SIZE = 1024
+
+    __slots__ = ("config", "key", "_cipher", "_lock")
+
+    def __init__(self, config: CryptoConfig):
+        self.config = config
+        self.key = config.B1_SECRET_KEY.encode("utf-8")
+        self._lock = threading.Lock()
+        self._cipher = self._compile(self.INITIAL_SIZE)
+
+    @classmethod
+    def shared(cls, config: CryptoConfig | None = None) -> "RC4Keystream":
+        """
+        Get the process-wide keystream for a config and selected `xor` backend
+
+        Args:
+            config: Crypto configuration, None for the default
+
+        Returns:
+            RC4Keystream: Shared keystream
+        """
+        return shared_instance(cls, config, selected_backend("xor"))
+
+    def __len__(self) -> int:
+        return self._cipher[0]
+
+    def encrypt(self, data: bytes | bytearray | memoryview) -> bytes:
+        """
+        RC4-encrypt (or decrypt) a message
+
+        Args:
+            data: Message bytes
+
+        Returns:
+            bytes: Same bytes as `ARC4.new(key).encrypt(data)`
+        """
+        size, xor = self._cipher
+        if len(data) > size:
+            size, xor = self._grow(len(data))
+        return xor(data)
+
+    def _compile(self, size: int) -> tuple[int, Callable[[Any], bytes]]:
+        """Generate `size` keystream bytes and bind them to the `xor` backend"""
+        return size, get_backend("xor")(rc4_keystream(self.key, size))
+
+    def _grow(self, size: int) -> tuple[int, Callable[[Any], bytes]]:
+        """Extend the keystream to at least `size` bytes (doubling)"""
+        with self._lock:
+            current = self._cipher[0]
+            if size > current:
+                while current < size:
+                    current *= 2
+                self._cipher = self._compile(current)
+            return self._cipher
@@ -0,0 +1,181 @@
+"""Compact JSON serializer backends"""
+
+import gc
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+__all__ = ["JsonSerializer", "OrjsonSerializer", "get_serializer", "available_serializers"]
+
+# Values whose serialization differs between backends are covered here;
+# a backend is only selected when it matches the stdlib output on all of them.
+_CONFORMANCE_CORPUS: list[Any] = [
+    {},
+    [],
+    {"b": 1, "a": 2, "c": {"z": [], "y": {}}},
+    {"username": "测试", "emoji": "😀", "mixed": "é ü ß 中文 \u2028\u2029\ud7ff"},
+    {"control": "\x00\x01\x1f\x7f", "escape": '"\\/\b\f\n\r\t'},
+    {"int": [0, -1, 2**31, -(2**63), 2**64 - 1], "bool": [True, False], "none": None},
+    {"float": [0.0, -0.0, 0.1, 1.5, -2.25, 1e-4, 123456789.123, 9999999999999998.0, 1 / 3]},
+    {"nested": [[1, [2, [3, {"k": ["v", None]}]]], ("tuple", 1)]},
+]
+
+
+class JsonSerializer:
+    """Standard library backend: `json.dumps(separators=(",", ":"), ensure_ascii=False)`"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Serialize object to compact JSON string
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            str: Compact JSON with unicode characters preserved
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """
+        Serialize object to compact UTF-8 JSON bytes
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            bytes: UTF-8 encoded compact JSON
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson backend producing byte-identical output to `JsonSerializer`
+
+    Objects are serialized with orjson first and re-encoded with
+    `JsonSerializer` when orjson raises (integers beyond 64 bits, non-str
+    keys, subclasses, circular or very deep containers, other types) or its
+    output could differ from the standard library: types only orjson
+    supports (enum, UUID) and exponent or non-finite floats.
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        data = self._dumps_orjson(obj)
+        return super().dumps(obj) if data is None else data.decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        data = self._dumps_orjson(obj)
+        return super().dumps_bytes(obj) if data is None else data
+
+    @staticmethod
+    def _dumps_orjson(obj: Any) -> bytes | None:
+        """Serialize with orjson, None when the standard library has to be used"""
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return None
+        return None if _may_differ_from_stdlib(obj) else data
+
+
+# Subclasses, dataclasses and datetimes raise instead of being serialized natively
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _may_differ_from_stdlib(obj: Any) -> bool:
+    """
+    Check the values of an object orjson serialized for output the standard library would not produce
+
+    Only runs after orjson succeeded, so the object is acyclic and its keys
+    are str. Containers are expanded one level at a time with
+    `gc.get_referents`, which keeps the Python work to one type check per
+    value instead of a full recursive walk.
+    """
+    values = [obj]
+    while values:
+        containers = []
+        for value in values:
+            value_type = type(value)
+            if value_type is dict or value_type is list or value_type is tuple:
+                containers.append(value)
+            elif value_type is float:
+                # repr() switches to exponent notation outside [1e-4, 1e16), NaN fails both bounds
+                if value and not 1e-4 <= abs(value) < 1e16:
+                    return True
+            elif value_type not in _SCALAR_TYPES:
+                return True
+        values = gc.get_referents(*containers)
+    return False
+
+
+_SERIALIZERS: dict[str, JsonSerializer] = {"json": JsonSerializer()}
+if orjson is not None:
+    _SERIALIZERS["orjson"] = OrjsonSerializer()
+
+_conformance_results: dict[str, bool] = {}
+
+
+def _passes_conformance(serializer: JsonSerializer) -> bool:
+    """Check a backend against the standard library on the conformance corpus (cached)"""
+    result = _conformance_results.get(serializer.name)
+    if result is None:
+        reference = _SERIALIZERS["json"]
+        try:
+            result = all(
+                serializer.dumps_bytes(sample) == reference.dumps_bytes(sample)
+                and serializer.dumps(sample) == reference.dumps(sample)
+                for sample in _CONFORMANCE_CORPUS
+            )
+        except Exception:
+            result = False
+        _conformance_results[serializer.name] = result
+    return result
+
+
+def available_serializers() -> list[str]:
+    """
+    List serializer backends that are installed and pass the conformance corpus
+
+    Returns:
+        list[str]: Backend names, standard library first
+    """
+    return [name for name, serializer in _SERIALIZERS.items() if _passes_conformance(serializer)]
+
+
+def get_serializer(name: str = "auto") -> JsonSerializer:
+    """
+    Get a JSON serializer backend
+
+    Args:
+        name: "json", "orjson" or "auto" (fastest available backend
+            that passes the conformance corpus)
+
+    Returns:
+        JsonSerializer: Shared serializer instance
+
+    Raises:
+        ValueError: Unknown or unavailable backend
+    """
+    if name == "auto":
+        fast = _SERIALIZERS.get("orjson")
+        return fast if fast is not None and _passes_conformance(fast) else _SERIALIZERS["json"]
+
+    serializer = _SERIALIZERS.get(name)
+    if serializer is None:
+        raise ValueError(f"JSON serializer '{name}' is not available")
+    if not _passes_conformance(serializer):
+        raise ValueError(f"JSON serializer '{name}' does not match the standard library output")
+    return serializer
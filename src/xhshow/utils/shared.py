@@ -0,0 +1,114 @@
+"""Process-wide registry of immutable objects derived from a config"""
+
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import fields
+from typing import Any, TypeVar
+
+from ..config import CryptoConfig
+
+__all__ = ["clear_shared", "config_key", "intern_config", "shared_count", "shared_instance"]
+
+T = TypeVar("T")
+
+# Entries live for the whole process; one set per distinct config (and backend selection)
+_shared: dict[Hashable, Any] = {}
+_canonical_configs: dict[int, CryptoConfig] = {}
+# Reentrant: shared objects may build other shared objects while being created
+_lock = threading.RLock()
+_DEFAULT_CONFIG_KEY = ("config", "default")
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    return type(value), value
+
+
+def config_key(config: CryptoConfig) -> Hashable:
+    """
+    Build a hashable key of all config values
+
+    `CryptoConfig` holds lists and dicts, so it is not hashable itself.
+    Dict order is kept in the key since it changes serialized templates.
+
+    Args:
+        config: Crypto configuration
+
+    Returns:
+        Hashable: Key equal for configs with equal values
+    """
+    return tuple((item.name, _freeze(getattr(config, item.name))) for item in fields(config))
+
+
+def _get_or_create(key: Hashable, factory: Callable[[], T]) -> T:
+    instance = _shared.get(key, _MISSING)
+    if instance is _MISSING:
+        with _lock:
+            instance = _shared.get(key, _MISSING)
+            if instance is _MISSING:
+                instance = _shared[key] = factory()
+    return instance
+
+
+def intern_config(config: CryptoConfig | None = None) -> CryptoConfig:
+    """
+    Get the canonical instance of a config
+
+    Args:
+        config: Crypto configuration, None for the default `CryptoConfig()`
+
+    Returns:
+        CryptoConfig: Process-wide instance equal to `config`
+    """
+    if config is None:
+        return _get_or_create(_DEFAULT_CONFIG_KEY, lambda: intern_config(CryptoConfig()))
+    if _canonical_configs.get(id(config)) is config:
+        return config
+
+    canonical = _get_or_create((CryptoConfig, config_key(config)), lambda: config)
+    _canonical_configs[id(canonical)] = canonical
+    return canonical
+
+
+def shared_instance(cls: Callable[[CryptoConfig], T], config: CryptoConfig | None, *variant: Hashable) -> T:
+    """
+    Get the process-wide instance of an immutable helper class for a config
+
+    The instance is created once per distinct config value, so clients
+    built from equal configs share lookup tables and compiled layouts.
+
+    Args:
+        cls: Class constructed as `cls(config)`
+        config: Crypto configuration, None for the default
+        *variant: Extra key parts the instance depends on (e.g. selected backend names)
+
+    Returns:
+        Shared instance of `cls`
+
+    Examples:
+        >>> shared_instance(Base64Encoder, CryptoConfig()) is shared_instance(Base64Encoder, CryptoConfig())
+        True
+    """
+    canonical = intern_config(config)
+    return _get_or_create((cls, id(canonical), *variant), lambda: cls(canonical))
+
+
+def shared_count() -> int:
+    """
+    Count shared objects (canonical configs included)
+
+    Returns:
+        int: Number of registry entries
+    """
+    return len(_shared)
+
+
+def clear_shared() -> None:
+    """Drop all shared objects; instances already handed out stay valid"""
+    with _lock:
+        _shared.clear()
+        _canonical_configs.clear()
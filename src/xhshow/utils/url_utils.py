@@ -1,6 +1,6 @@
 from urllib.parse import urlparse
 
-__all__ = ["extract_uri", "build_url"]
+__all__ = ["extract_uri", "build_url", "encode_query", "append_query"]
 
 
 def extract_uri(url: str) -> str:
@@ -82,21 +82,68 @@ def build_url(base_url: str, params: dict | None = None) -> str:
     if not params:
         return base_url
 
+    return append_query(base_url, encode_query(params))
+
+
+def encode_query(params: dict | None) -> str:
+    """
+    Encode query parameters with XHS platform rules
+
+    Shared by `build_url` and the x-s content string so both always agree:
+    only '=' in values is encoded as '%3D', lists/tuples are comma-joined,
+    None becomes an empty value and other values use `str()`.
+
+    Args:
+        params: Query parameters dictionary
+
+    Returns:
+        str: Query string without leading '?' (empty if no params)
+
+    Examples:
+        >>> encode_query({"a": "1", "tags": ["tech", "python"], "b": None, "c": "x=y"})
+        'a=1&tags=tech,python&b=&c=x%3Dy'
+    """
+    if not params:
+        return ""
+
     query_parts = []
     for key, value in params.items():
-        if isinstance(value, list | tuple):
-            formatted_value = ",".join(str(v) for v in value)
-        elif value is not None:
-            formatted_value = str(value)
-        else:
+        value_type = type(value)
+        if value_type is str:
+            formatted_value = value
+        elif value is None:
             formatted_value = ""
+        elif value_type is list or value_type is tuple or isinstance(value, list | tuple):
+            formatted_value = ",".join(map(str, value))
+        else:
+            formatted_value = str(value)
 
         # XHS platform requires only '=' to be encoded as '%3D'
         # Other special characters must remain unencoded for signature matching
-        encoded_value = formatted_value.replace("=", "%3D")
-        query_parts.append(f"{key}={encoded_value}")
+        if "=" in formatted_value:
+            formatted_value = formatted_value.replace("=", "%3D")
+        query_parts.append(f"{key}={formatted_value}")
+
+    return "&".join(query_parts)
 
-    query_string = "&".join(query_parts)
+
+def append_query(base_url: str, query_string: str) -> str:
+    """
+    Append an encoded query string to a URL
+
+    Args:
+        base_url: Base URL (may already contain a query string)
+        query_string: Encoded query string without leading '?'
+
+    Returns:
+        str: URL with the query string appended
+
+    Examples:
+        >>> append_query("/api/path?existing=1", "new=2")
+        '/api/path?existing=1&new=2'
+    """
+    if not query_string:
+        return base_url
 
     # Determine correct separator based on URL structure
     if "?" not in base_url:
@@ -0,0 +1,135 @@
+"""Tests for the x-s header log audit tool"""
+
+import json
+
+import pytest
+
+from xhshow import RandomGenerator, Xhshow
+from xhshow.audit import AUDIT_COLUMNS, audit_files, main, read_columns, write_columns
+
+TIMESTAMP = 1764896636.081
+URI = "/api/sns/web/v1/user_posted"
+
+
+def sign(client: Xhshow, index: int, a1: str | None = None) -> dict:
+    cookies = {"a1": a1 or f"a1_value_{index % 3}", "web_session": "session"}
+    return client.sign_headers_get(URI, cookies, params={"cursor": str(index)}, timestamp=TIMESTAMP + index * 7.3)
+
+
+class TestAudit:
+    """测试签名日志审计"""
+
+    def setup_method(self):
+        self.client = Xhshow(random_generator=RandomGenerator(seed=20))
+
+    def _write_log(self, tmp_path):
+        """Mixed JSON lines, plain text lines and unrelated lines"""
+        lines = []
+        for index in range(30):
+            headers = sign(self.client, index)
+            if index % 2:
+                lines.append(json.dumps(headers))
+            else:
+                lines.append(f"{headers['x-t']} {headers['x-s']} {headers['x-s-common']}")
+            if index % 10 == 0:
+                lines.append("GET /health 200")
+        path = tmp_path / "headers.log"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def test_decodes_fields(self, tmp_path):
+        """测试解析出的字段与签名输入一致"""
+        log_file = self._write_log(tmp_path)
+        columns = audit_files([str(log_file)], workers=1)
+
+        assert set(columns) == set(AUDIT_COLUMNS)
+        assert len(columns["line"]) == 30
+        assert list(columns["valid"]) == [1] * 30
+        assert list(columns["skew_ms"]) == [0] * 30
+        assert columns["a1"] == [f"a1_value_{i % 3}" for i in range(30)]
+        assert columns["xsc_a1"] == columns["a1"]
+        assert set(columns["a1_match"]) == {1}
+        assert set(columns["xsc_crc_valid"]) == {1}
+        assert set(columns["source"]) == {"xhs-pc-web"}
+        assert list(columns["timestamp_ms"]) == [int((TIMESTAMP + i * 7.3) * 1000) for i in range(30)]
+        assert all(10000 <= offset <= 50001 for offset in columns["time_offset_ms"])
+        # Unrelated lines are skipped but still counted in line numbers
+        assert list(columns["line"][:3]) == [1, 3, 4]
+
+    def test_detects_problems(self, tmp_path):
+        """测试检测 a1 不一致、时间偏差与损坏的签名"""
+        client = self.client
+        good = sign(client, 0)
+        other = sign(client, 1, a1="other_a1")
+        long_a1 = sign(client, 2, a1="a1_" + "0123456789" * 7)
+        skewed_x_t = int(good["x-t"]) + 60000
+        encoder = client.crypto_processor.b64encoder
+        x3 = bytearray(encoder.decode_x3(client.decode_xs(good["x-s"])["x3"][len(client.config.X3_PREFIX) :]))
+        x3[0] ^= 1  # version byte
+        corrupted = client._envelope.wrap(encoder.encode_x3_bytes(x3)).decode()
+        path = tmp_path / "bad.log"
+        path.write_text(
+            "\n".join(
+                [
+                    json.dumps({"x-s": good["x-s"], "x-t": good["x-t"], "x-s-common": other["x-s-common"]}),
+                    json.dumps({"x-s": good["x-s"], "x-t": str(skewed_x_t)}),
+                    f"{good['x-t']} {corrupted}",
+                    "XYS_notbase64!",
+                    json.dumps(long_a1),
+                    json.dumps({"x-s": good["x-s"], "x-t": good["x-t"], "x-s-common": "A" * 64}),
+                    json.dumps({"x-s": "XYS_notbase64!", "x-t": good["x-t"], "x-s-common": good["x-s-common"]}),
+                ]
+            )
+        )
+
+        columns = audit_files([str(path)], workers=1)
+
+        # x3 keeps only the first 52 bytes of a1; undecodable headers are not counted as mismatches
+        assert list(columns["a1_match"]) == [0, -1, -1, -1, 1, -1, -1]
+        assert columns["skew_ms"][1] == -60000
+        assert list(columns["valid"]) == [1, 1, 0, 0, 1, 1, 0]
+        assert list(columns["xsc_crc_valid"]) == [1, -1, -1, -1, 1, 0, 1]
+
+    def test_process_pool_matches_inline(self, tmp_path):
+        """测试进程池分块结果与单进程一致"""
+        log_file = self._write_log(tmp_path)
+        second = tmp_path / "second.log"
+        second.write_bytes(log_file.read_bytes())
+
+        inline = audit_files([str(log_file), str(second)], workers=1)
+        pooled = audit_files([str(log_file), str(second)], workers=2, chunk_size=4096)
+
+        assert pooled == inline
+        assert list(pooled["file"]) == [0] * 30 + [1] * 30
+
+    def test_columns_roundtrip(self, tmp_path):
+        """测试列式文件读写往返一致"""
+        log_file = self._write_log(tmp_path)
+        columns = audit_files([str(log_file)], workers=1)
+        output = tmp_path / "audit.xhsa"
+        with open(output, "wb") as file:
+            write_columns(columns, file)
+
+        assert read_columns(str(output)) == columns
+        with pytest.raises(ValueError):
+            read_columns(str(log_file))
+
+    def test_empty_file(self, tmp_path):
+        """测试空文件"""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+        columns = audit_files([str(path)], workers=1)
+
+        assert all(len(values) == 0 for values in columns.values())
+
+    def test_cli(self, tmp_path, capsys):
+        """测试命令行输出摘要与进度"""
+        log_file = self._write_log(tmp_path)
+        output = tmp_path / "audit.xhsa"
+
+        assert main([str(log_file), "-o", str(output), "-w", "1"]) == 0
+        captured = capsys.readouterr()
+        assert "30 rows" in captured.out
+        assert "0 invalid" in captured.out
+        assert "rows/s" in captured.err
+        assert len(read_columns(str(output))["line"]) == 30
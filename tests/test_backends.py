@@ -0,0 +1,141 @@
+"""Tests for the primitive backend registry"""
+
+import hashlib
+import random
+
+import pytest
+
+from xhshow import CryptoConfig, RandomGenerator, Xhshow
+from xhshow.core.crc32_encrypt import CRC32
+from xhshow.utils import backends
+from xhshow.utils.backends import (
+    PRIMITIVES,
+    available_backends,
+    backend_info,
+    calibrate,
+    get_backend,
+    register_backend,
+    select_backend,
+    selected_backend,
+)
+
+URI = "/api/sns/web/v1/user_posted"
+COOKIES = {"a1": "test_a1_value", "web_session": "session"}
+TIMESTAMP = 1764896636.081
+
+
+class TestBackendEquivalence:
+    """测试各后端与参考实现一致"""
+
+    @pytest.mark.parametrize("name", available_backends("xor"))
+    def test_xor(self, name):
+        """测试异或后端对任意长度输入一致"""
+        rng = random.Random(name)
+        key = rng.randbytes(124)
+        reference, backend = get_backend("xor", "loop")(key), get_backend("xor", name)(key)
+        for length in (0, 5, 123, 124, 125, 400):
+            data = rng.randbytes(length)
+            assert backend(data) == reference(data)
+
+    @pytest.mark.parametrize("name", available_backends("base64"))
+    def test_base64(self, name):
+        """测试 Base64 后端与自定义字母表编码一致"""
+        config = CryptoConfig()
+        rng = random.Random(name)
+        reference = get_backend("base64", "translate")(config.X3_BASE64_ALPHABET)
+        backend = get_backend("base64", name)(config.X3_BASE64_ALPHABET)
+        for length in range(0, 130):
+            data = rng.randbytes(length)
+            assert backend(data) == reference(data)
+
+    @pytest.mark.parametrize("name", available_backends("crc32"))
+    def test_crc32(self, name):
+        """测试 CRC32 后端与查表实现一致"""
+        crc32 = get_backend("crc32", name)()
+        for data in (b"", b"test_data", random.Random(1).randbytes(1000)):
+            c = CRC32._crc32_core(data)
+            assert crc32(data) == (CRC32.MASK32 ^ c ^ CRC32.POLY) & CRC32.MASK32
+
+    @pytest.mark.parametrize("name", available_backends("md5"))
+    def test_md5(self, name):
+        """测试 MD5 后端支持 copy/update 且摘要一致"""
+        state = get_backend("md5", name)()(b"/api/sns/web/v1/user_posted?")
+        copied = state.copy()
+        copied.update(b"num=30")
+        assert copied.digest() == hashlib.md5(b"/api/sns/web/v1/user_posted?num=30").digest()
+
+    def test_crc32_js_strings(self):
+        """测试 JS 模式下非 Latin-1 字符按低 8 位处理"""
+        text = "测试 abc é"
+        expected_state = CRC32._crc32_core(text, string_mode="js")
+        expected = (CRC32.MASK32 ^ expected_state ^ CRC32.POLY) & CRC32.MASK32
+        assert CRC32.crc32_js_int(text, signed=False) == expected
+
+
+class TestBackendSelection:
+    """测试后端注册、选择、校准与查询"""
+
+    def setup_method(self):
+        # Isolate registry state changed by a test
+        self.saved = (backends._REGISTRY, backends._verified, backends._selected, backends._timings, CRC32._BACKENDS)
+        backends._REGISTRY = {primitive: dict(b) for primitive, b in backends._REGISTRY.items()}
+        backends._verified = dict(backends._verified)
+        backends._selected = dict(backends._selected)
+        backends._timings = {}
+        CRC32._BACKENDS = {}
+
+    def teardown_method(self):
+        (backends._REGISTRY, backends._verified, backends._selected, backends._timings, CRC32._BACKENDS) = self.saved
+
+    def test_default_selection(self):
+        """测试默认选择通过等价校验的后端"""
+        info = backend_info()
+        assert set(info) == set(PRIMITIVES)
+        for primitive, entry in info.items():
+            assert entry["selected"] in entry["available"]
+            assert entry["selected"] == selected_backend(primitive)
+            assert entry["available"][0] == entry["registered"][0]
+
+    def test_non_equivalent_backend_rejected(self):
+        """测试与参考实现不一致的后端不可用"""
+        register_backend("crc32", "broken", lambda: lambda data: 0)
+
+        assert "broken" in backend_info()["crc32"]["registered"]
+        assert "broken" not in available_backends("crc32")
+        with pytest.raises(ValueError, match="does not match"):
+            select_backend("crc32", "broken")
+
+    def test_unknown_names(self):
+        """测试未知原语或后端抛出 ValueError"""
+        with pytest.raises(ValueError, match="Unknown primitive"):
+            register_backend("sha1", "x", hashlib.sha1)
+        with pytest.raises(ValueError, match="not available"):
+            get_backend("xor", "missing")
+
+    def test_select_applies_to_new_clients(self):
+        """测试切换后端后新客户端输出不变"""
+        reference = Xhshow(random_generator=RandomGenerator(seed=3))
+        expected_get = reference.sign_headers_get(URI, COOKIES, params={"num": "30"}, timestamp=TIMESTAMP)
+        expected_post = reference.sign_headers_post(URI, COOKIES, payload={"username": "测试"}, timestamp=TIMESTAMP)
+
+        for primitive in PRIMITIVES:
+            select_backend(primitive, available_backends(primitive)[0])
+        client = Xhshow(random_generator=RandomGenerator(seed=3))
+
+        assert client.crypto_processor.bit_ops._xor_bytes.__qualname__.startswith("_xor_loop")
+        assert client.sign_headers_get(URI, COOKIES, params={"num": "30"}, timestamp=TIMESTAMP) == expected_get
+        assert (
+            client.sign_headers_post(URI, COOKIES, payload={"username": "测试"}, timestamp=TIMESTAMP) == expected_post
+        )
+
+    def test_calibrate(self):
+        """测试校准记录耗时并选择最快的后端"""
+        selected = calibrate(("crc32", "md5"), number=20, repeat=1)
+        info = backend_info()
+
+        assert set(selected) == {"crc32", "md5"}
+        for primitive in ("crc32", "md5"):
+            timings = info[primitive]["timings_us"]
+            assert set(timings) == set(available_backends(primitive))
+            assert selected[primitive] == min(timings, key=timings.__getitem__)
+        assert info["xor"]["timings_us"] == {}
@@ -0,0 +1,143 @@
+"""Tests for batch signing APIs"""
+
+import time
+
+import pytest
+
+from xhshow import CryptoConfig, RequestSpec, Xhshow
+from xhshow.core.common_sign import XsCommonSigner
+
+
+class TestBatchSigning:
+    """测试批量签名功能"""
+
+    def setup_method(self):
+        self.client = Xhshow()
+        self.cookies = {"a1": "test_a1_value", "web_session": "test_session"}
+        self.timestamp = 1764896636.081
+
+    def test_sign_xs_many_matches_sign_xs(self):
+        """测试批量 x-s 与逐个签名结构一致"""
+        specs = [
+            ("GET", "https://edith.xiaohongshu.com/api/sns/web/v1/user_posted", "test_a1_value", {"num": "30"}),
+            RequestSpec("POST", "/api/sns/web/v1/login", "test_a1_value", {"username": "test"}),
+        ]
+
+        signatures = self.client.sign_xs_many(specs, timestamp=self.timestamp)
+
+        assert len(signatures) == 2
+        for signature, spec in zip(signatures, specs, strict=True):
+            decoded = self.client.decode_xs(signature)
+            single = self.client.decode_xs(
+                self.client.sign_xs(spec[0], spec[1], spec[2], payload=spec[3], timestamp=self.timestamp)
+            )
+            assert decoded.keys() == single.keys()
+            # Deterministic prefix: version bytes (4) + random seed (4) differ, fingerprint A must match
+            assert self.client.decode_x3(decoded["x3"])[8:16] == self.client.decode_x3(single["x3"])[8:16]
+
+    def test_sign_xs_many_validates_each_spec(self):
+        """测试批量签名逐项校验参数"""
+        with pytest.raises(ValueError, match="method must be 'GET' or 'POST'"):
+            self.client.sign_xs_many([("PUT", "/api/path", "a1", None)])
+
+        with pytest.raises(TypeError, match="a1_value must be str"):
+            self.client.sign_xs_many([("GET", "/api/path", 123, None)])
+
+        with pytest.raises(ValueError, match="Cannot extract valid URI path"):
+            self.client.sign_xs_many([("GET", "https://example.com/", "a1", None)])
+
+    def test_sign_headers_many(self):
+        """测试批量生成请求头"""
+        specs = [
+            ("GET", "/api/sns/web/v1/user_posted", self.cookies, {"num": "30"}),
+            ("POST", "/api/sns/web/v1/login", self.cookies, {"username": "test"}, "xhs-pc-web"),
+            ("GET", "/api/sns/web/v1/homefeed", "a1=other_a1; web_session=s", None),
+        ]
+
+        headers_list = self.client.sign_headers_many(specs, timestamp=self.timestamp)
+
+        assert len(headers_list) == 3
+        for headers in headers_list:
+            assert set(headers) == {"x-s", "x-s-common", "x-t", "x-b3-traceid", "x-xray-traceid"}
+            assert headers["x-s"].startswith("XYS_")
+            assert headers["x-t"] == "1764896636081"
+
+        # x-s-common is signed per request like `sign_headers`; reuse comes from the x-s-common cache
+        client = Xhshow(CryptoConfig().with_overrides(XS_COMMON_CACHE_SIZE=8))
+        cached = client.sign_headers_many(specs, timestamp=self.timestamp)
+        assert cached[0]["x-s-common"] == cached[1]["x-s-common"]
+        assert cached[0]["x-s-common"] != cached[2]["x-s-common"]
+
+    def test_sign_headers_many_missing_a1(self):
+        """测试批量签名缺少 a1 时抛出异常"""
+        with pytest.raises(ValueError, match="Missing 'a1' in cookies"):
+            self.client.sign_headers_many([("GET", "/api/path", {"web_session": "s"}, None)])
+
+    def test_sign_many_empty(self):
+        """测试空批量输入"""
+        assert self.client.sign_xs_many([]) == []
+        assert self.client.sign_headers_many([]) == []
+
+
+class TestSignIter:
+    """测试流式签名功能"""
+
+    def setup_method(self):
+        self.client = Xhshow()
+        self.cookies = {"a1": "test_a1_value", "web_session": "test_session"}
+
+    def _specs(self, count):
+        for i in range(count):
+            yield ("GET", "/api/sns/web/v1/user_posted", self.cookies, {"cursor": str(i)})
+
+    def test_sign_iter_is_lazy(self):
+        """测试流式签名按需消费输入"""
+        consumed = []
+
+        def specs():
+            for spec in self._specs(1000):
+                consumed.append(spec)
+                yield spec
+
+        iterator = self.client.sign_iter(specs())
+        first = next(iterator)
+
+        assert first["x-s"].startswith("XYS_")
+        assert len(consumed) == 1
+
+    def test_sign_iter_chunked(self):
+        """测试流式签名分块输出"""
+        chunks = list(self.client.sign_iter(self._specs(7), chunk_size=3, timestamp=1764896636.081))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert all(headers["x-t"] == "1764896636081" for chunk in chunks for headers in chunk)
+
+    def test_sign_iter_x_s_common_per_request(self, monkeypatch):
+        """测试流式签名逐条生成 x-s-common，仅复用 Cookie 解析结果"""
+        sign = XsCommonSigner.sign
+        signed = []
+
+        def record_sign(self, cookies, timestamp=None):
+            signed.append(timestamp)
+            return sign(self, cookies, timestamp)
+
+        monkeypatch.setattr(XsCommonSigner, "sign", record_sign)
+        monkeypatch.setattr(time, "time", iter([1764896636.081, 1764896700.5, 1764896800.25]).__next__)
+        headers = list(self.client.sign_iter(self._specs(3)))
+
+        assert signed == [1764896636.081, 1764896700.5, 1764896800.25]
+        assert [h["x-t"] for h in headers] == ["1764896636081", "1764896700500", "1764896800250"]
+
+    def test_sign_iter_uses_x_s_common_cache(self):
+        """测试流式签名经过 x-s-common 缓存"""
+        client = Xhshow(CryptoConfig().with_overrides(XS_COMMON_CACHE_SIZE=8))
+        headers = list(client.sign_iter(self._specs(5), timestamp=1764896636.081))
+
+        assert len({h["x-s-common"] for h in headers}) == 1
+        assert client.cache_stats()["xs_common"].hits == 4
+
+    def test_sign_iter_invalid_chunk_size(self):
+        """测试非法分块大小"""
+        for chunk_size in (0, -1, 1.5):
+            with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+                self.client.sign_iter(self._specs(1), chunk_size=chunk_size)
@@ -0,0 +1,330 @@
+"""Tests for signing caches"""
+
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+from xhshow import CryptoConfig, RandomGenerator, Xhshow
+from xhshow.core import digest
+from xhshow.core.common_sign import cookie_digest
+from xhshow.core.digest import ContentDigester, canonical_request_key
+from xhshow.utils.cache import CacheStats, LRUCache, TTLCache
+
+
+class TestLRUCache:
+    """测试 LRU 缓存"""
+
+    def test_get_put_and_stats(self):
+        """测试读写与命中统计"""
+        cache = LRUCache(2)
+
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=1, maxsize=2)
+
+    def test_eviction_order(self):
+        """测试按最近使用顺序淘汰"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_disabled_and_invalid_size(self):
+        """测试容量为0时禁用缓存及非法容量"""
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        assert len(cache) == 0
+
+        with pytest.raises(ValueError):
+            LRUCache(-1)
+
+    def test_clear(self):
+        """测试清空缓存"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert cache.stats() == CacheStats(0, 0, 0, 0, 2)
+
+
+class TestTTLCache:
+    """测试带过期时间的 LRU 缓存"""
+
+    def test_expiry(self):
+        """测试条目过期后失效并计入淘汰"""
+        now = [100.0]
+        cache = TTLCache(2, ttl=10, clock=lambda: now[0])
+        cache.put("a", 1)
+
+        now[0] = 109.9
+        assert cache.get("a") == 1
+        now[0] = 110.0
+        assert cache.get("a") is None
+        assert cache.stats() == CacheStats(hits=1, misses=1, evictions=1, size=0, maxsize=2)
+
+    def test_bounded_and_invalid_ttl(self):
+        """测试容量上限与非法过期时间"""
+        cache = TTLCache(2, ttl=60)
+        for key in "abc":
+            cache.put(key, key)
+
+        assert "a" not in cache and len(cache) == 2
+        with pytest.raises(ValueError):
+            TTLCache(2, ttl=0)
+
+
+class TestXsCommonCache:
+    """测试按 Cookie 缓存 x-s-common"""
+
+    COOKIES = {"a1": "a1_value", "web_session": "session", "webId": "web_id"}
+
+    def test_disabled_by_default(self):
+        """测试默认不缓存，且复用签名器不改变输出"""
+        client = Xhshow(random_generator=RandomGenerator(seed=23))
+        first = client.sign_xs_common(self.COOKIES, timestamp=1764896636.081)
+
+        assert client.sign_xs_common(self.COOKIES, timestamp=1764896636.081) != first
+        assert client.cache_stats()["xs_common"] == CacheStats(0, 0, 0, 0, 0)
+
+    def test_cache_hit(self):
+        """测试同一 Cookie 命中缓存（与键顺序及 Cookie 字符串无关）"""
+        config = CryptoConfig().with_overrides(XS_COMMON_CACHE_SIZE=8, XS_COMMON_CACHE_TTL=60)
+        client = Xhshow(config)
+        first = client.sign_headers_get("/api/sns/web/v1/user_posted", self.COOKIES, params={"num": "30"})
+        reordered = dict(reversed(list(self.COOKIES.items())))
+        cookie_string = "; ".join(f"{name}={value}" for name, value in self.COOKIES.items())
+
+        assert client.sign_xs_common(reordered) == first["x-s-common"]
+        assert client.sign_xs_common(cookie_string) == first["x-s-common"]
+        assert client.sign_xs_common({**self.COOKIES, "a1": "other"}) != first["x-s-common"]
+        assert client.cache_stats()["xs_common"] == CacheStats(hits=2, misses=2, evictions=0, size=2, maxsize=8)
+
+    def test_cookie_digest(self):
+        """测试 Cookie 摘要"""
+        assert cookie_digest({"a": "1", "b": "2"}) == cookie_digest({"b": "2", "a": "1"})
+        assert cookie_digest({"a": "1", "b": "2"}) != cookie_digest({"a": "1", "b": "3"})
+        assert len(cookie_digest({})) == 16
+
+
+class TestContentDigester:
+    """测试 MD5 前缀状态缓存"""
+
+    @pytest.mark.parametrize(
+        "uri, separator, tail",
+        [
+            ("/api/sns/web/v1/homefeed", "", ""),
+            ("/api/sns/web/v1/user_posted", "?", "num=30&cursor=&tags=a,b"),
+            ("/api/sns/web/v1/login", "{", '"username":"测试"}'),
+        ],
+    )
+    def test_digest_matches_full_md5(self, uri, separator, tail):
+        """测试前缀状态复用结果与完整计算一致"""
+        digester = ContentDigester(CryptoConfig())
+        content = uri + separator + tail
+
+        for _ in range(2):
+            assert digester.digest(uri, separator, tail) == (
+                len(content),
+                hashlib.md5(content.encode("utf-8")).digest(),
+            )
+
+        assert digester.prefix_cache.stats()[:2] == (1, 1)
+
+    def test_prefix_cache_bounded(self):
+        """测试前缀缓存容量受限"""
+        digester = ContentDigester(CryptoConfig().with_overrides(MD5_PREFIX_CACHE_SIZE=2))
+
+        for i in range(5):
+            digester.digest(f"/api/path/{i}", "?", "a=1")
+
+        stats = digester.prefix_cache.stats()
+        assert stats.size == 2
+        assert stats.evictions == 3
+
+    def test_client_cache_stats(self):
+        """测试客户端缓存统计"""
+        client = Xhshow()
+        for _ in range(3):
+            client.sign_xs("GET", "/api/sns/web/v1/user_posted", "test_a1_value", payload={"num": "30"})
+
+        stats = client.cache_stats()["md5_prefix"]
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+
+class TestContentCache:
+    """测试内容串与 d 值缓存"""
+
+    def test_canonical_key_distinguishes_types(self):
+        """测试规范化键区分值类型"""
+        keys = {
+            canonical_request_key("GET", "/api", payload)
+            for payload in (
+                {"a": 1},
+                {"a": True},
+                {"a": 1.0},
+                {"a": "1"},
+                {"a": -0.0},
+                {"a": 0.0},
+                {"a": [1]},
+                {"a": (1,)},
+            )
+        }
+
+        assert len(keys) == 8
+        assert canonical_request_key("GET", "/api", None) == canonical_request_key("GET", "/api", {})
+        assert canonical_request_key("GET", "/api", {"a": 1, "b": 2}) != canonical_request_key(
+            "GET", "/api", {"b": 2, "a": 1}
+        )
+
+    def test_canonical_key_unsupported_value(self):
+        """测试不支持的值类型不参与缓存"""
+        assert canonical_request_key("GET", "/api", {"a": object()}) is None
+        assert canonical_request_key("GET", "/api", {"a": {1, 2}}) is None
+
+    def test_content_cache_hit(self):
+        """测试缓存命中结果与未命中一致"""
+        client = Xhshow(CryptoConfig().with_overrides(CONTENT_CACHE_SIZE=8))
+        uri = "/api/sns/web/v1/user_posted"
+        params = {"num": "30", "tags": ["a", "b=c"], "n": None}
+        content = client._build_content_string("GET", uri, params)
+        expected = (len(content), hashlib.md5(content.encode()).digest())
+
+        assert client._digest_content("GET", uri, params) == expected
+        assert client._digest_content("GET", uri, dict(params)) == expected
+
+        stats = client.cache_stats()["content"]
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_content_cache_disabled_by_default(self):
+        """测试默认不启用内容缓存"""
+        client = Xhshow()
+        client.sign_xs("GET", "/api/sns/web/v1/user_posted", "test_a1_value", payload={"num": "30"})
+
+        assert client.cache_stats()["content"] == CacheStats(0, 0, 0, 0, 0)
+
+
+class TestPayloadTemplateCache:
+    """测试按账号缓存的预异或载荷模板"""
+
+    A1 = "18c5a7f8b0dxyz4dq7mvqbbkz9t0yb2hs6x3l6f7a50000123456"
+
+    def _reference_x3(self, client, digest, a1, appid, length, timestamp):
+        processor = client.crypto_processor
+        payload = processor.build_payload_bytes(digest, a1, appid, length, timestamp)
+        return processor.b64encoder.encode_x3_bytes(processor.bit_ops.xor_transform_bytes(payload[:124]))
+
+    @pytest.mark.parametrize(
+        "a1, appid",
+        [
+            (A1, "xhs-pc-web"),
+            ("short_a1", "app"),
+            ("a" * 80, "a-very-long-app-identifier"),
+            ("中文a1", "xhs-pc-web"),
+        ],
+    )
+    def test_matches_full_payload(self, a1, appid):
+        """测试模板路径与完整载荷异或结果一致"""
+        client = Xhshow()
+        client.crypto_processor.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+        digest = hashlib.md5(b"content").digest()
+
+        for _ in range(2):
+            expected = self._reference_x3(client, digest, a1, appid, 77, 1764896636.081)
+            assert client.crypto_processor.build_x3_bytes(digest, a1, appid, 77, 1764896636.081) == expected
+
+        stats = client.cache_stats()["payload_template"]
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_bounded_and_disabled(self):
+        """测试模板缓存容量上限与关闭"""
+        client = Xhshow(CryptoConfig().with_overrides(PAYLOAD_TEMPLATE_CACHE_SIZE=2))
+        for index in range(5):
+            client.sign_xs("GET", "/api", f"a1_{index}")
+
+        stats = client.cache_stats()["payload_template"]
+        assert (stats.size, stats.evictions) == (2, 3)
+
+        disabled = Xhshow(CryptoConfig().with_overrides(PAYLOAD_TEMPLATE_CACHE_SIZE=0))
+        for signer in (client, disabled):
+            signer.crypto_processor.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+        expected = client.sign_xs("GET", "/api", self.A1, timestamp=1764896636.081)
+        assert disabled.sign_xs("GET", "/api", self.A1, timestamp=1764896636.081) == expected
+        assert disabled.cache_stats()["payload_template"].size == 0
+
+
+class TestStreamingDigest:
+    """测试 POST 请求体流式摘要"""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {},
+            {"username": "测试", "password": "123456"},
+            {"content": "评论" * 50000, "items": [{"id": i, "score": i / 3, "ok": i % 2 == 0} for i in range(5000)]},
+        ],
+    )
+    def test_digest_json_matches_full_md5(self, payload):
+        """测试流式摘要与完整计算一致"""
+        digester = ContentDigester(CryptoConfig().with_overrides(DIGEST_OFFLOAD_CHUNK_SIZE=4096))
+        uri = "/api/sns/web/v1/comment/post"
+        content = uri + json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+        assert digester.digest_json(uri, payload) == (len(content), hashlib.md5(content.encode("utf-8")).digest())
+
+    def test_client_streaming_signature_matches(self):
+        """测试启用流式摘要时签名结果不变"""
+        payload = {"note_id": "abc", "content": "x=y," * 40000}
+        streaming = Xhshow(
+            CryptoConfig().with_overrides(POST_DIGEST_STREAMING=True), random_generator=RandomGenerator(seed=3)
+        )
+        client = Xhshow(random_generator=RandomGenerator(seed=3))
+
+        expected = client.sign_xs("POST", "/api/sns/web/v1/comment/post", "a1", payload=payload, timestamp=1.5e9)
+        result = streaming.sign_xs("POST", "/api/sns/web/v1/comment/post", "a1", payload=payload, timestamp=1.5e9)
+
+        assert result == expected
+
+    def test_worker_per_thread(self):
+        """测试每个调用线程使用独立的哈希工作线程"""
+        executors = []
+        thread = threading.Thread(target=lambda: executors.append(digest._get_hash_executor()))
+        thread.start()
+        thread.join()
+
+        assert digest._get_hash_executor() is digest._get_hash_executor()
+        assert executors[0] is not digest._get_hash_executor()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_streaming_after_fork(self):
+        """测试子进程中流式摘要不会阻塞在继承的工作线程上"""
+        digester = ContentDigester(CryptoConfig().with_overrides(DIGEST_OFFLOAD_CHUNK_SIZE=64))
+        uri = "/api/sns/web/v1/comment/post"
+        payload = {"items": [{"id": i, "text": "评论" * 20} for i in range(200)]}
+        expected = digester.digest_json(uri, payload)
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.close(read_fd)
+            try:
+                os.write(write_fd, digester.digest_json(uri, payload)[1])
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        child_output = os.read(read_fd, 16)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_output == expected[1]
@@ -1,9 +1,13 @@
 """Tests for cookie parsing and sign_headers functionality"""
 
+import json
+
 import pytest
 
-from xhshow import Xhshow
+from xhshow import RandomGenerator, Xhshow
 from xhshow.core.common_sign import XsCommonSigner
+from xhshow.core.crc32_encrypt import CRC32
+from xhshow.generators.fingerprint import FingerprintGenerator
 
 
 class TestCookieParsing:
@@ -189,6 +193,33 @@ class TestXsCommonSigner:
         assert len(result1) > 0
         assert len(result2) > 0
 
+    def test_b1_fields_match_full_fingerprint(self):
+        """测试 b1 字段与完整指纹中的对应字段一致"""
+        generator = FingerprintGenerator(self.signer.config, RandomGenerator(seed=24))
+        fingerprint = generator.generate({"a1": "test_a1_value"}, "ua", timestamp=1764896636.081)
+        fields = generator.generate_b1_fields(timestamp=1764896636.081)
+
+        assert tuple(fields) == FingerprintGenerator.B1_KEYS
+        assert 1 <= int(fields["x36"]) <= 20
+        assert {**fields, "x36": fingerprint["x36"]} == {key: fingerprint[key] for key in FingerprintGenerator.B1_KEYS}
+        assert generator.generate_b1(fields) == generator.generate_b1({**fingerprint, "x36": fields["x36"]})
+
+    def test_full_fingerprint_key_order(self):
+        """测试完整指纹的键顺序保持不变"""
+        generator = FingerprintGenerator(self.signer.config, RandomGenerator(seed=24))
+        fingerprint = generator.generate({"a1": "test_a1_value"}, "ua", timestamp=1764896636.081)
+        expected = [f"x{index}" for index in (*range(1, 31), *range(33, 53), *range(55, 79), 82, 31, 79, 53, 54, 80)]
+
+        assert list(fingerprint) == expected
+
+    def test_sign_structure(self):
+        """测试 x-s-common 结构与 b1 校验值"""
+        result = self.signer.sign({"a1": "test_a1_value", "web_session": "test_session"}, timestamp=1764896636.081)
+        data = json.loads(self.signer._encoder.decode(result))
+
+        assert data["x5"] == "test_a1_value"
+        assert data["x9"] == CRC32.crc32_js_int(data["x8"])
+
 
 class TestSignHeaders:
     """测试 sign_headers 系列方法"""
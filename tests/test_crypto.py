@@ -1,7 +1,14 @@
+import json
+import random
+import urllib.parse
+
 import pytest
 
-from xhshow import CryptoProcessor, Xhshow
+from xhshow import CryptoConfig, CryptoProcessor, Xhshow
 from xhshow.core.crc32_encrypt import CRC32
+from xhshow.core.envelope import XysEnvelope
+from xhshow.generators.fingerprint import FingerprintGenerator
+from xhshow.utils.rc4 import RC4Keystream, rc4_keystream
 
 
 class TestCryptoProcessor:
@@ -47,6 +54,74 @@ class TestCryptoProcessor:
         assert len(result) == len(test_array)
         assert all(isinstance(x, int) and 0 <= x <= 255 for x in result)
 
+    def test_bit_ops_xor_transform_bytes(self):
+        """测试XOR字节变换与数组变换一致"""
+        for length in (0, 8, 124, 125, 200):
+            data = bytes(i * 7 & 0xFF for i in range(length))
+            expected = self.crypto.bit_ops.xor_transform_array(list(data))
+            assert self.crypto.bit_ops.xor_transform_bytes(data) == expected
+            assert self.crypto.bit_ops.xor_transform_bytes(memoryview(data)) == expected
+
+    def test_build_payload_bytes_matches_array(self):
+        """测试字节载荷与数组载荷一致"""
+        hex_param = "d41d8cd98f00b204e9800998ecf8427e"
+
+        self.crypto.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+        expected = self.crypto.build_payload_array(hex_param, "test_a1_value", "xhs-pc-web", "abc", 1764896636.081)
+        result = self.crypto.build_payload_bytes(
+            bytes.fromhex(hex_param), "test_a1_value", "xhs-pc-web", 3, 1764896636.081
+        )
+
+        assert isinstance(result, bytearray)
+        assert list(result) == expected
+
+    def test_payload_layout_offsets(self):
+        """测试载荷布局偏移与常量字段"""
+        layout = self.crypto.layout
+
+        assert layout.size == 125
+        assert layout.SIGNED_SIZE == 124
+        assert (layout["seed"].offset, layout["seed"].end) == (4, 8)
+        assert layout["content_length"].offset == 32
+        assert (layout["md5_xor"].offset, layout["md5_xor"].end) == (36, 44)
+        assert (layout["a1"].offset, layout["a1"].end) == (45, 97)
+        assert (layout["source"].offset, layout["source"].end) == (98, 108)
+        assert layout["checksum_seed"].offset == 110
+
+        template = layout.template()
+        assert template[:4] == bytes(self.crypto.config.VERSION_BYTES)
+        assert template[44] == 52
+        assert template[97] == 10
+        assert template[108] == 1
+        assert template[111:] == bytes(self.crypto.config.CHECKSUM_FIXED_TAIL)
+
+    def test_build_payload_fixed_values(self):
+        """测试固定随机值下的载荷与签名字节级一致"""
+        self.crypto.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+
+        result = self.crypto.build_payload_bytes(
+            bytes.fromhex("d41d8cd98f00b204e9800998ecf8427e"), "1234567890abcdef_a1", "xhs-pc-web", 34, 1764896636.081
+        )
+        assert result.hex() == (
+            "77686029efcdab89255520c5b328292929ec08ec9a0100001700000000040000220000003bf2633660ef5deb"
+            "34313233343536373839306162636465665f6131" + "00" * 33 + "0a7868732d70632d77656201019c"
+            "f9416767c9b583635e0744fa8415"
+        )
+
+        x3 = self.crypto.build_x3_bytes(
+            bytes.fromhex("d41d8cd98f00b204e9800998ecf8427e"), "1234567890abcdef_a1", "xhs-pc-web", 34, 1764896636.081
+        )
+        assert x3 == self.crypto.b64encoder.encode_x3_bytes(self.crypto.bit_ops.xor_transform_bytes(result[:124]))
+
+    def test_build_payload_bytes_returns_copy(self):
+        """测试载荷字节返回独立副本"""
+        digest = bytes(16)
+        first = self.crypto.build_payload_bytes(digest, "a1_first", "xhs-pc-web", 1, 1764896636.081)
+        snapshot = bytes(first)
+        self.crypto.build_payload_bytes(digest, "a1_second_value", "xhs-pc-web", 2, 1764896636.081)
+
+        assert first == snapshot
+
     def test_base58_encoder(self):
         """测试Base58编码"""
         # Base58已移除,此测试不再需要
@@ -88,6 +163,13 @@ class TestCryptoProcessor:
         decoded = self.crypto.b64encoder.decode_x3(result)
         assert decoded == test_bytes
 
+    def test_base64_bytes_encoders(self):
+        """测试Base64字节编码与字符串编码一致"""
+        data = bytes(range(124))
+
+        assert self.crypto.b64encoder.encode_bytes(data).decode() == self.crypto.b64encoder.encode(data)
+        assert self.crypto.b64encoder.encode_x3_bytes(data).decode() == self.crypto.b64encoder.encode_x3(data)
+
     def test_base64_x3_decoder_invalid_input(self):
         """测试x3签名Base64解码对非法输入的异常处理"""
         # Test with truly invalid Base64 after alphabet translation
@@ -124,6 +206,38 @@ class TestCryptoProcessor:
         assert isinstance(result, int)
         assert 0 <= result <= 0xFFFFFFFF
 
+    def test_random_generator_fields(self):
+        """测试单次抽取的多字段随机数范围与分布"""
+        generator = self.crypto.random_gen
+        bounds = ((0, 0xFFFFFFFF), (10, 50), (15, 50), (900, 1200))
+
+        samples = [generator.generate_fields(bounds) for _ in range(3 * generator.POOL_WORDS)]
+        for fields in samples:
+            assert len(fields) == 4
+            assert all(low <= value <= high for value, (low, high) in zip(fields, bounds, strict=True))
+
+        # 每个取值都应出现，且频率接近均匀分布
+        offsets = [fields[1] for fields in samples]
+        assert set(offsets) == set(range(10, 51))
+        assert max(offsets.count(value) for value in range(10, 51)) < 4 * len(samples) / 41
+
+        assert generator.generate_fields(((7, 7), (3, 4)))[0] == 7
+        # 超过 64 位的字段组合回退到逐次抽取
+        wide = generator.generate_fields(((0, 2**40), (0, 2**40)))
+        assert all(0 <= value <= 2**40 for value in wide)
+
+        with pytest.raises(ValueError):
+            generator.generate_fields(((5, 4),))
+
+    def test_random_generator_fields_rejection(self, monkeypatch):
+        """测试超出均匀区间的抽取被拒绝重抽"""
+        generator = self.crypto.random_gen
+        bounds = ((0, 2**63 + 1),)
+        words = iter([2**64 - 1, 5])
+        monkeypatch.setattr(generator, "_next_word", lambda: next(words))
+
+        assert generator.generate_fields(bounds) == (5,)
+
 
 class TestXhshow:
     """测试Xhshow客户端类"""
@@ -256,6 +370,22 @@ class TestXhshow:
         assert result.startswith("XYS_")
         assert len(result) > 10
 
+    def test_sign_xs_bytes(self):
+        """测试字节签名与字符串签名一致"""
+        payload = {"username": "测试", "tags": ["a", "b"]}
+
+        self.client.crypto_processor.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+        expected = self.client.sign_xs(
+            "POST", "/api/sns/web/v1/login", "test_a1_value", payload=payload, timestamp=1764896636.081
+        )
+        result = self.client.sign_xs_bytes(
+            "POST", "/api/sns/web/v1/login", "test_a1_value", payload=payload, timestamp=1764896636.081
+        )
+
+        assert isinstance(result, bytes)
+        assert result.decode() == expected
+        assert self.client.decode_xs(expected)["x3"].startswith("mns0301_")
+
 
 class TestIntegration:
     """集成测试"""
@@ -654,6 +784,137 @@ class TestIntegration:
             )
 
 
+class TestBase64Batch:
+    """测试 Base64 批量编解码"""
+
+    def setup_method(self):
+        self.encoder = CryptoProcessor().b64encoder
+        self.items = [bytes((i * 7 + j) & 0xFF for j in range(i)) for i in range(0, 130, 3)] + [b"\n\n", b""]
+
+    def test_encode_many_matches_single(self):
+        """测试批量编码与逐个编码一致"""
+        assert self.encoder.encode_many(self.items) == [self.encoder.encode_bytes(i) for i in self.items]
+        assert self.encoder.encode_x3_many(self.items) == [self.encoder.encode_x3_bytes(i) for i in self.items]
+        assert self.encoder.encode_many([]) == []
+
+    def test_offsets(self):
+        """测试拼接缓冲区加偏移量的输入"""
+        buffer = bytearray(b"".join(self.items))
+        offsets = [0]
+        for item in self.items:
+            offsets.append(offsets[-1] + len(item))
+
+        encoded = self.encoder.encode_x3_many(buffer, offsets)
+        assert encoded == self.encoder.encode_x3_many(self.items)
+
+        joined = b"".join(encoded)
+        encoded_offsets = [0]
+        for item in encoded:
+            encoded_offsets.append(encoded_offsets[-1] + len(item))
+        assert self.encoder.decode_x3_many(joined, encoded_offsets) == self.items
+        assert self.encoder.decode_x3_many(joined.decode(), encoded_offsets) == self.items
+
+    def test_decode_many_roundtrip(self):
+        """测试批量解码支持 str 与 bytes 并返回 bytes"""
+        custom = self.encoder.encode_many(self.items)
+        x3 = self.encoder.encode_x3_many(self.items)
+
+        assert self.encoder.decode_many(custom) == self.items
+        assert self.encoder.decode_many([item.decode() for item in custom]) == self.items
+        assert self.encoder.decode_x3_many([item.decode() for item in x3]) == [
+            self.encoder.decode_x3(item.decode()) for item in x3
+        ]
+        assert self.encoder.decode_x3_many([]) == []
+
+    def test_decode_many_separator_in_item(self):
+        """测试条目内含换行时仍按条目解码"""
+        x3 = [item.decode() for item in self.encoder.encode_x3_many(self.items[:4])]
+        x3[1] = x3[1][:2] + "\n" + x3[1][2:]
+
+        assert self.encoder.decode_x3_many(x3) == [self.encoder.decode_x3(item) for item in x3]
+
+    def test_decode_many_invalid(self):
+        """测试非法输入抛出 ValueError"""
+        with pytest.raises(ValueError, match="Invalid Base64 input"):
+            self.encoder.decode_x3_many(["MfgA", "abc"])
+        with pytest.raises(ValueError, match="Invalid Base64 input"):
+            self.encoder.decode_many(["测试"])
+
+
+class TestXysEnvelope:
+    """测试预编译 XYS 外层封装"""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"X3_PREFIX": "custom_", "XYS_PREFIX": "CUSTOM_"},
+            {"SIGNATURE_DATA_TEMPLATE": {"x3": "", "x0": "4.2.6", "x1": "测试", "x4": ""}},
+            {"SIGNATURE_DATA_TEMPLATE": {"x0": "4.2.6", "x1": "xhs-pc-web", "x2": "Win", "x3": ""}},
+        ],
+    )
+    def test_wrap_matches_json_dumps(self, overrides):
+        """测试封装结果与 json.dumps 逐字节一致"""
+        config = CryptoConfig().with_overrides(**overrides)
+        processor = CryptoProcessor(config)
+        envelope = XysEnvelope(config, processor.b64encoder)
+
+        for length in range(0, 170, 7):
+            x3 = processor.b64encoder.encode_x3_bytes(bytes(range(length)))
+            signature_data = config.SIGNATURE_DATA_TEMPLATE.copy()
+            signature_data["x3"] = config.X3_PREFIX + x3.decode()
+            expected = config.XYS_PREFIX + processor.b64encoder.encode(
+                json.dumps(signature_data, separators=(",", ":"), ensure_ascii=False)
+            )
+
+            assert envelope.wrap(x3).decode() == expected
+
+
+class TestRC4Keystream:
+    """测试预计算 RC4 密钥流"""
+
+    def test_matches_arc4(self):
+        """测试与 pycryptodome ARC4 一致，包括密钥流扩容"""
+        arc4 = pytest.importorskip("Crypto.Cipher.ARC4")
+        keystream = RC4Keystream(CryptoConfig())
+        key = CryptoConfig().B1_SECRET_KEY.encode()
+
+        assert rc4_keystream(key, 64) == arc4.new(key).encrypt(bytes(64))
+        for size in (0, 1, 420, RC4Keystream.INITIAL_SIZE, 5000):
+            data = random.Random(size).randbytes(size)
+            assert keystream.encrypt(data) == arc4.new(key).encrypt(data)
+        assert len(keystream) == RC4Keystream.INITIAL_SIZE * 8
+
+    def test_shared(self):
+        """测试按配置共享"""
+        assert RC4Keystream.shared() is RC4Keystream.shared(CryptoConfig())
+        other = RC4Keystream.shared(CryptoConfig().with_overrides(B1_SECRET_KEY="other"))
+        assert other.encrypt(b"abc") != RC4Keystream.shared().encrypt(b"abc")
+
+    def test_b1_matches_url_quote_encoding(self):
+        """测试 b1 与 ARC4 + URL 编码再解析的原实现一致"""
+        arc4 = pytest.importorskip("Crypto.Cipher.ARC4")
+        config = CryptoConfig()
+        generator = FingerprintGenerator(config)
+        rng = random.Random(25)
+
+        def reference(fields: dict) -> str:
+            b1_fp = {key: fields[key] for key in FingerprintGenerator.B1_KEYS}
+            plaintext = json.dumps(b1_fp, separators=(",", ":"), ensure_ascii=False).encode()
+            ciphertext = arc4.new(config.B1_SECRET_KEY.encode()).encrypt(plaintext).decode("latin1")
+            b = []
+            for c in urllib.parse.quote(ciphertext, safe="!*'()~_-").split("%")[1:]:
+                b.append(int(c[:2], 16))
+                b.extend(ord(j) for j in c[2:])
+            return generator._encoder.encode(bytearray(b))
+
+        for index in range(200):
+            fields = generator.generate_b1_fields(timestamp=1764896636.081 + index)
+            fields["x52"] = "".join(chr(rng.randrange(32, 0x3000)) for _ in range(rng.randrange(0, 600)))
+            fields["x48"] = "".join(rng.choice("aZ09_.-~!*'()%é ") for _ in range(rng.randrange(0, 20)))
+            assert generator.generate_b1(fields) == reference(fields)
+
+
 class TestCRC32:
     """测试 CRC32 加密功能"""
 
@@ -0,0 +1,78 @@
+"""Tests for prepared signed requests"""
+
+import hashlib
+
+import pytest
+
+from xhshow import SignedRequest, Xhshow
+
+
+def decoded_content_fields(client, x_s):
+    """Return (content length, MD5 prefix) recovered from an x-s signature"""
+    payload = client.decode_x3(client.decode_xs(x_s)["x3"])
+    seed_byte_0 = payload[4]
+    content_length = int.from_bytes(payload[32:36], "little")
+    md5_prefix = bytes(b ^ seed_byte_0 for b in payload[36:44])
+    return content_length, md5_prefix
+
+
+class TestPrepareRequest:
+    """测试 prepare_request 预签名请求"""
+
+    def setup_method(self):
+        self.client = Xhshow()
+        self.cookies = {"a1": "test_a1_value", "web_session": "test_session"}
+
+    def test_prepare_post_request(self):
+        """测试 POST 请求体只序列化一次并用于签名"""
+        url = "https://edith.xiaohongshu.com/api/sns/web/v1/login"
+        payload = {"username": "测试", "tags": ["a", "b"]}
+
+        request = self.client.prepare_request("POST", url, self.cookies, payload=payload)
+
+        assert isinstance(request, SignedRequest)
+        assert request.method == "POST"
+        assert request.url == url
+        assert request.body == self.client.build_json_body(payload).encode("utf-8")
+        assert set(request.headers) == {"x-s", "x-s-common", "x-t", "x-b3-traceid", "x-xray-traceid"}
+
+        content = "/api/sns/web/v1/login" + request.body.decode("utf-8")
+        assert decoded_content_fields(self.client, request.headers["x-s"]) == (
+            len(content),
+            hashlib.md5(content.encode("utf-8")).digest()[:8],
+        )
+
+    def test_prepare_get_request(self):
+        """测试 GET 请求构建最终 URL"""
+        url = "https://edith.xiaohongshu.com/api/sns/web/v1/user_posted"
+        params = {"num": "30", "cursor": "a=b"}
+
+        request = self.client.prepare_request("GET", url, "a1=test_a1_value; web_session=s", params=params)
+
+        assert request.body is None
+        assert request.url == self.client.build_url(url, params)
+
+        content = self.client._build_content_string("GET", "/api/sns/web/v1/user_posted", params)
+        assert decoded_content_fields(self.client, request.headers["x-s"]) == (
+            len(content),
+            hashlib.md5(content.encode("utf-8")).digest()[:8],
+        )
+
+    def test_prepare_request_validation(self):
+        """测试 prepare_request 参数校验"""
+        url = "https://edith.xiaohongshu.com/api/sns/web/v1/login"
+
+        with pytest.raises(ValueError, match="GET requests must use 'params'"):
+            self.client.prepare_request("GET", url, self.cookies, payload={"a": 1})
+        with pytest.raises(ValueError, match="POST requests must use 'payload'"):
+            self.client.prepare_request("POST", url, self.cookies, params={"a": 1})
+        with pytest.raises(ValueError, match="Missing 'a1' in cookies"):
+            self.client.prepare_request("POST", url, {"web_session": "s"}, payload={})
+
+    def test_signed_request_slots(self):
+        """测试 SignedRequest 使用 __slots__"""
+        request = self.client.prepare_request("POST", "/api/sns/web/v1/login", self.cookies)
+
+        assert request.body == b"{}"
+        assert not hasattr(request, "__dict__")
+        assert "2 bytes" in repr(request)
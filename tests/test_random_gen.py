@@ -0,0 +1,133 @@
+"""Tests for per-client seedable random sources"""
+
+import os
+import random
+
+import pytest
+
+from xhshow import CryptoConfig, RandomGenerator, Xhshow
+from xhshow.core.common_sign import XsCommonSigner
+
+COOKIES = {"a1": "test_a1_value", "web_session": "session", "webId": "web_id"}
+TIMESTAMP = 1764896636.081
+SPECS = [
+    ("GET", "/api/sns/web/v1/user_posted", COOKIES, {"num": "30"}),
+    ("POST", "/api/sns/web/v1/login", COOKIES, {"username": "测试"}),
+    ("GET", "/api/sns/web/v1/homefeed", "a1=other_a1; web_session=s", None),
+    ("GET", "/api/sns/web/v1/user_posted", COOKIES, {"num": "31"}),
+]
+
+
+def sign_all(client: Xhshow) -> list:
+    return [
+        client.sign_headers_get("/api/sns/web/v1/user_posted", COOKIES, params={"num": "30"}, timestamp=TIMESTAMP),
+        client.sign_headers_post("/api/sns/web/v1/login", COOKIES, payload={"username": "测试"}, timestamp=TIMESTAMP),
+        client.sign_headers_many([("GET", "/api/sns/web/v1/homefeed", COOKIES, {"cursor": "1"})], TIMESTAMP),
+        client.get_b3_trace_id(),
+        client.get_xray_trace_id(int(TIMESTAMP * 1000)),
+    ]
+
+
+class TestSeededRandom:
+    """测试客户端独立且可设种子的随机源"""
+
+    def test_seeded_sign_headers_deterministic(self):
+        """测试相同种子生成完全一致的请求头"""
+        first = sign_all(Xhshow(random_generator=RandomGenerator(seed=42)))
+        second = sign_all(Xhshow(random_generator=RandomGenerator(seed=42)))
+        other = sign_all(Xhshow(random_generator=RandomGenerator(seed=43)))
+
+        assert first == second
+        assert first[0]["x-s"] != other[0]["x-s"]
+        assert first[0]["x-s-common"] != other[0]["x-s-common"]
+        assert first[0]["x-b3-traceid"] != other[0]["x-b3-traceid"]
+
+    @pytest.mark.parametrize("threshold", [0, 2])
+    def test_batch_apis_match_sign_headers(self, threshold):
+        """测试设种子后批量与流式接口的输出与逐个 sign_headers 一致"""
+        config = CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=threshold)
+        client = Xhshow(config, random_generator=RandomGenerator(seed=1))
+        expected = [
+            client.sign_headers(
+                method,
+                uri,
+                cookies,
+                params=data if method == "GET" else None,
+                payload=data if method == "POST" else None,
+                timestamp=TIMESTAMP,
+            )
+            for method, uri, cookies, data in SPECS
+        ]
+
+        many = Xhshow(config, random_generator=RandomGenerator(seed=1)).sign_headers_many(SPECS, TIMESTAMP)
+        streamed = list(Xhshow(config, random_generator=RandomGenerator(seed=1)).sign_iter(SPECS, timestamp=TIMESTAMP))
+
+        assert many == expected
+        assert streamed == expected
+
+    def test_client_shares_one_generator(self):
+        """测试载荷、追踪 ID 与指纹使用同一随机源"""
+        generator = RandomGenerator(seed=1)
+        client = Xhshow(random_generator=generator)
+
+        assert client.random_generator is generator
+        assert client.crypto_processor.random_gen is generator
+        assert XsCommonSigner(client.config, generator)._fp_generator.random_generator is generator
+
+    def test_global_random_state_untouched(self):
+        """测试签名不消耗全局 random 状态"""
+        client = Xhshow()
+        random.seed(7)
+        expected = random.random()
+
+        random.seed(7)
+        sign_all(client)
+        assert random.random() == expected
+
+    def test_unseeded_clients_independent(self):
+        """测试未设种子的客户端互不相同且不受全局种子影响"""
+        random.seed(1)
+        first = Xhshow().sign_xs("GET", "/api", "a1", timestamp=TIMESTAMP)
+        random.seed(1)
+        second = Xhshow().sign_xs("GET", "/api", "a1", timestamp=TIMESTAMP)
+
+        assert first != second
+
+    def test_fingerprint_uses_signing_timestamp(self):
+        """测试指纹时间字段使用签名时间戳"""
+        signer = XsCommonSigner(random_generator=RandomGenerator(seed=5))
+        fingerprint = signer._fp_generator.generate(COOKIES, "ua", timestamp=TIMESTAMP)
+
+        assert fingerprint["x44"] == str(int(TIMESTAMP * 1000))
+
+    def test_spawn(self):
+        """测试派生子生成器可复现且彼此独立"""
+        children = [RandomGenerator(seed=9).spawn() for _ in range(2)]
+        assert children[0].token_bytes(16) == children[1].token_bytes(16)
+
+        parent = RandomGenerator(seed=9)
+        first, second = parent.spawn(), parent.spawn()
+        assert first.token_bytes(16) != second.token_bytes(16)
+
+        assert RandomGenerator().spawn().seed is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_unseeded_reseeded_after_fork(self):
+        """测试未设种子的生成器在子进程中重新播种"""
+        unseeded = RandomGenerator()
+        seeded = RandomGenerator(seed=11)
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.close(read_fd)
+            os.write(write_fd, unseeded.token_bytes(16) + seeded.token_bytes(16))
+            os._exit(0)
+
+        os.close(write_fd)
+        child_output = os.read(read_fd, 32)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_output[:16] != unseeded.token_bytes(16)
+        assert child_output[16:] == seeded.token_bytes(16)
@@ -0,0 +1,189 @@
+"""Conformance tests for JSON serializer backends"""
+
+import datetime
+import enum
+import json
+import random
+import uuid
+
+import pytest
+
+from xhshow import CryptoConfig, Xhshow
+from xhshow.utils.serializer import JsonSerializer, available_serializers, get_serializer
+
+
+def stdlib_dumps(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+
+class Text(str):
+    pass
+
+
+def _shared_list():
+    shared = [1, 2]
+    return {"a": shared, "b": shared}
+
+
+CORPUS = [
+    {},
+    {"b": 1, "a": 2, "c": 3},
+    {"z": {"y": {"x": []}}, "a": [{}]},
+    {"username": "测试用户", "emoji": "😀👍", "accents": "éüßñ", "ls": "  ", "zh": "中文，标点。"},
+    {"control": "\x00\x01\x08\x1f\x7f", "escape": '"\\/\b\f\n\r\t', "empty": ""},
+    {"ints": [0, -1, 1, 2**31 - 1, -(2**31), 2**53 + 1, 2**63 - 1, -(2**63), 2**64 - 1]},
+    {"floats": [0.0, -0.0, 0.1, 0.2, 0.30000000000000004, 1.5, -2.25, 1e-4, 1 / 3, 2 / 3, 123456789.123]},
+    {"edge_floats": [9999999999999998.0, 1e15, 1e16, 1e-5, 5e-324, 1.7976931348623157e308]},
+    {"special_floats": [float("nan"), float("inf"), float("-inf")]},
+    {"big_ints": [2**64, -(2**63) - 1, 10**30]},
+    {"nested": [[1, [2, [3, [4, {"k": ["v", None, True, False]}]]]], ("tuple", 1)]},
+    {"keys": {"1": "a", "": "empty", "键": "值", "a b": "c=d&e"}},
+    _shared_list(),
+]
+
+
+class TestSerializerConformance:
+    """测试 JSON 序列化后端与标准库逐字节一致"""
+
+    @pytest.mark.parametrize("name", available_serializers())
+    @pytest.mark.parametrize("sample", CORPUS)
+    def test_corpus(self, name, sample):
+        """测试一致性语料"""
+        serializer = get_serializer(name)
+
+        assert serializer.dumps(sample) == stdlib_dumps(sample)
+        assert serializer.dumps_bytes(sample) == stdlib_dumps(sample).encode("utf-8")
+
+    @pytest.mark.parametrize("name", available_serializers())
+    def test_random_floats(self, name):
+        """测试随机浮点数格式一致"""
+        serializer = get_serializer(name)
+        rng = random.Random(2024)
+        values = [rng.uniform(-1, 1) * 10 ** rng.randint(-8, 20) for _ in range(2000)]
+        values += [rng.random() for _ in range(1000)]
+
+        assert serializer.dumps(values) == stdlib_dumps(values)
+
+    @pytest.mark.parametrize("name", available_serializers())
+    @pytest.mark.parametrize(
+        "sample",
+        [
+            {"key": Color.RED},
+            {"key": uuid.UUID(int=1)},
+            {"key": datetime.datetime(2024, 1, 1)},
+            {1: "non-str key"},
+        ],
+    )
+    def test_unsupported_values_match_stdlib(self, name, sample):
+        """测试标准库无法序列化的值在所有后端行为一致"""
+        serializer = get_serializer(name)
+
+        try:
+            expected = stdlib_dumps(sample)
+        except TypeError:
+            with pytest.raises(TypeError):
+                serializer.dumps(sample)
+        else:
+            assert serializer.dumps(sample) == expected
+
+    @pytest.mark.parametrize("name", available_serializers())
+    def test_subclasses_match_stdlib(self, name):
+        """测试 str/int 子类输出一致"""
+        serializer = get_serializer(name)
+        sample = {"level": Level.LOW, "text": Text("abc")}
+
+        assert serializer.dumps(sample) == stdlib_dumps(sample)
+
+    def test_circular_reference_raises(self):
+        """测试循环引用与标准库一样抛出异常"""
+        sample: dict = {}
+        sample["self"] = sample
+
+        for name in available_serializers():
+            with pytest.raises(ValueError):
+                get_serializer(name).dumps(sample)
+
+
+class TestSerializerSelection:
+    """测试序列化后端选择"""
+
+    def test_stdlib_always_available(self):
+        """测试标准库后端始终可用"""
+        assert available_serializers()[0] == "json"
+        assert type(get_serializer("json")) is JsonSerializer
+        assert get_serializer("auto").name in available_serializers()
+
+    def test_unknown_serializer(self):
+        """测试未知后端"""
+        with pytest.raises(ValueError, match="is not available"):
+            get_serializer("unknown")
+
+    def test_client_uses_configured_serializer(self):
+        """测试客户端按配置选择后端"""
+        client = Xhshow(CryptoConfig().with_overrides(JSON_SERIALIZER="json"))
+        payload = {"username": "测试", "score": 1e16}
+
+        assert client.serializer.name == "json"
+        assert client.build_json_body(payload) == stdlib_dumps(payload)
+        assert Xhshow().build_json_body(payload) == stdlib_dumps(payload)
+
+
+class TestOrjsonFastPath:
+    """测试 orjson 后端仅在输出可能不同时回退到标准库"""
+
+    def setup_method(self):
+        pytest.importorskip("orjson")
+        self.serializer = get_serializer("orjson")
+        self.fallbacks = []
+
+    def _record_fallbacks(self, monkeypatch):
+        dumps_bytes = JsonSerializer.dumps_bytes
+
+        def record(serializer, obj):
+            self.fallbacks.append(obj)
+            return dumps_bytes(serializer, obj)
+
+        monkeypatch.setattr(JsonSerializer, "dumps_bytes", record)
+
+    def test_plain_payload_uses_orjson(self, monkeypatch):
+        """测试常规请求体不回退"""
+        self._record_fallbacks(monkeypatch)
+        sample = {
+            "items": [
+                {"note_id": f"{i:024x}", "title": "笔记 e-1 1e5", "score": i / 7, "liked": i % 2 == 0, "n": i}
+                for i in range(200)
+            ],
+            "cursor": "",
+            "tags": [None, "a"],
+        }
+
+        assert self.serializer.dumps_bytes(sample) == stdlib_dumps(sample).encode("utf-8")
+        assert self.fallbacks == []
+
+    @pytest.mark.parametrize(
+        "sample",
+        [1e20, {"float": 1e16}, {"float": [1.5, -2.5e-7]}, {"float": 1e-5}, {"nan": [None, float("nan")]}],
+    )
+    def test_differing_floats_fall_back(self, monkeypatch, sample):
+        """测试指数形式与非有限浮点数回退"""
+        self._record_fallbacks(monkeypatch)
+
+        assert self.serializer.dumps_bytes(sample) == stdlib_dumps(sample).encode("utf-8")
+        assert len(self.fallbacks) == 1
+
+    @pytest.mark.parametrize("sample", [{"key": Color.RED}, {"key": uuid.UUID(int=1)}])
+    def test_orjson_only_types_fall_back(self, monkeypatch, sample):
+        """测试 orjson 可序列化而标准库不支持的类型回退"""
+        self._record_fallbacks(monkeypatch)
+
+        with pytest.raises(TypeError):
+            self.serializer.dumps_bytes(sample)
+        assert len(self.fallbacks) == 1
@@ -0,0 +1,89 @@
+"""Tests for the process-wide shared object registry"""
+
+import threading
+
+import pytest
+
+from xhshow import CryptoConfig, CryptoProcessor, RandomGenerator, Xhshow
+from xhshow.core.common_sign import XsCommonSigner
+from xhshow.utils.encoder import Base64Encoder
+from xhshow.utils.shared import config_key, intern_config, shared_count, shared_instance
+
+TIMESTAMP = 1764896636.081
+COOKIES = {"a1": "test_a1_value", "web_session": "session"}
+
+
+class TestSharedRegistry:
+    """测试相同配置的客户端共享不可变对象"""
+
+    def test_equal_configs_share_helpers(self):
+        """测试值相等的配置共享编码器、布局与信封"""
+        first = Xhshow(CryptoConfig().with_overrides(SEQUENCE_VALUE_MIN=20))
+        second = Xhshow(CryptoConfig().with_overrides(SEQUENCE_VALUE_MIN=20))
+
+        assert first.config is second.config
+        assert first.crypto_processor.b64encoder is second.crypto_processor.b64encoder
+        assert first.crypto_processor.bit_ops is second.crypto_processor.bit_ops
+        assert first.crypto_processor.layout is second.crypto_processor.layout
+        assert first._envelope is second._envelope
+        assert XsCommonSigner(first.config)._encoder is first.crypto_processor.b64encoder
+
+    def test_per_client_state_not_shared(self):
+        """测试随机源与缓存仍为每个客户端独有"""
+        first, second = Xhshow(), Xhshow()
+
+        assert first.random_generator is not second.random_generator
+        assert first.crypto_processor.template_cache is not second.crypto_processor.template_cache
+        assert first.content_digester is not second.content_digester
+
+    def test_distinct_configs_not_shared(self):
+        """测试不同配置使用各自的对象"""
+        default = Xhshow()
+        custom = Xhshow(CryptoConfig().with_overrides(X3_PREFIX="custom_"))
+        reordered = CryptoConfig().with_overrides(
+            SIGNATURE_DATA_TEMPLATE=dict(reversed(CryptoConfig().SIGNATURE_DATA_TEMPLATE.items()))
+        )
+
+        assert default.config is not custom.config
+        assert default._envelope is not custom._envelope
+        assert intern_config(reordered) is not intern_config(CryptoConfig())
+        assert config_key(CryptoConfig().with_overrides(CHECKSUM_VERSION=True)) != config_key(CryptoConfig())
+
+    def test_default_config(self):
+        """测试默认配置只创建一次"""
+        assert intern_config() is intern_config(None)
+        assert intern_config(CryptoConfig()) is intern_config()
+        assert Xhshow().config is CryptoProcessor().config is intern_config()
+
+    def test_output_unchanged(self):
+        """测试共享对象不影响签名结果"""
+        config = CryptoConfig().with_overrides(PAYLOAD_TEMPLATE_CACHE_SIZE=4)
+        clients = [Xhshow(config, random_generator=RandomGenerator(seed=8)) for _ in range(2)]
+        results = [
+            client.sign_headers_get("/api/sns/web/v1/user_posted", COOKIES, params={"num": "30"}, timestamp=TIMESTAMP)
+            for client in clients
+        ]
+
+        assert results[0] == results[1]
+
+    def test_concurrent_creation(self):
+        """测试并发获取只创建一个实例"""
+        config = CryptoConfig().with_overrides(CUSTOM_BASE64_ALPHABET=CryptoConfig().CUSTOM_BASE64_ALPHABET[::-1])
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(Base64Encoder.shared(config))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(encoder) for encoder in results}) == 1
+        assert shared_instance(Base64Encoder, config) is not results[0]  # different backend key
+        assert shared_count() > 0
+
+    def test_slots(self):
+        """测试核心类使用 __slots__"""
+        client = Xhshow()
+        for obj in (client, client.crypto_processor, client.crypto_processor.b64encoder, client._envelope):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
@@ -0,0 +1,60 @@
+"""Tests for validate-once request templates"""
+
+import pytest
+
+from xhshow import RequestTemplate, Xhshow
+
+
+class TestRequestTemplate:
+    """测试请求模板"""
+
+    def setup_method(self):
+        self.client = Xhshow()
+
+    def test_template_normalizes_once(self):
+        """测试模板创建时完成校验与规范化"""
+        template = self.client.template(" get ", " https://edith.xiaohongshu.com/api/sns/web/v1/user_posted?num=1 ")
+
+        assert isinstance(template, RequestTemplate)
+        assert template.method == "GET"
+        assert template.uri == "/api/sns/web/v1/user_posted"
+        assert template.xsec_appid == "xhs-pc-web"
+        assert not hasattr(template, "__dict__")
+
+    def test_template_sign_matches_sign_xs(self):
+        """测试模板签名与 sign_xs 一致"""
+        params = {"num": "30", "cursor": ""}
+        template = self.client.template("GET", "/api/sns/web/v1/user_posted")
+
+        self.client.crypto_processor.random_gen.generate_fields = lambda bounds: (0x89ABCDEF, 37, 23, 1024)
+        expected = self.client.sign_xs_get(
+            "/api/sns/web/v1/user_posted", "test_a1_value", params=params, timestamp=1.7e9
+        )
+        result = template.sign("test_a1_value", params, timestamp=1.7e9)
+
+        assert result == expected
+        assert template.sign_bytes("test_a1_value", params, timestamp=1.7e9) == expected.encode()
+
+    def test_template_sign_headers(self):
+        """测试模板生成完整请求头"""
+        template = self.client.template("POST", "/api/sns/web/v1/login")
+
+        headers = template.sign_headers("a1=test_a1_value; web_session=s", {"username": "test"}, timestamp=1.7e9)
+
+        assert set(headers) == {"x-s", "x-s-common", "x-t", "x-b3-traceid", "x-xray-traceid"}
+        assert headers["x-t"] == "1700000000000"
+
+    def test_template_validation(self):
+        """测试模板与逐次调用参数校验"""
+        with pytest.raises(ValueError, match="method must be 'GET' or 'POST'"):
+            self.client.template("PUT", "/api/path")
+        with pytest.raises(ValueError, match="Cannot extract valid URI path"):
+            self.client.template("GET", "https://example.com/")
+
+        template = self.client.template("GET", "/api/path")
+        with pytest.raises(ValueError, match="a1_value cannot be empty"):
+            template.sign(" ")
+        with pytest.raises(TypeError, match="payload must be dict or None"):
+            template.sign("a1", "invalid")  # type: ignore
+        with pytest.raises(ValueError, match="Missing 'a1' in cookies"):
+            template.sign_headers({"web_session": "s"})
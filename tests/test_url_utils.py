@@ -1,7 +1,7 @@
 import pytest
 
 from xhshow import Xhshow
-from xhshow.utils.url_utils import build_url, extract_uri
+from xhshow.utils.url_utils import append_query, build_url, encode_query, extract_uri
 
 
 class TestExtractUri:
@@ -80,6 +80,39 @@ class TestBuildUrl:
         assert url == "https://api.example.com/path"
 
 
+class TestEncodeQuery:
+    def test_encode_query_rules(self):
+        params = {"a": "1", "tags": ["x", "y=z"], "t": (1, 2.5), "n": None, "eq": "a=b=c", "num": 30, "flag": True}
+        assert encode_query(params) == "a=1&tags=x,y%3Dz&t=1,2.5&n=&eq=a%3Db%3Dc&num=30&flag=True"
+
+    def test_encode_query_empty(self):
+        assert encode_query(None) == ""
+        assert encode_query({}) == ""
+
+    def test_encode_query_str_subclass_uses_str(self):
+        class Token(str):
+            def __str__(self):
+                return "custom"
+
+        assert encode_query({"token": Token("raw")}) == "token=custom"
+
+    def test_append_query_separators(self):
+        assert append_query("/api/path", "a=1") == "/api/path?a=1"
+        assert append_query("/api/path?", "a=1") == "/api/path?a=1"
+        assert append_query("/api/path?x=1&", "a=1") == "/api/path?x=1&a=1"
+        assert append_query("/api/path?x=1", "a=1") == "/api/path?x=1&a=1"
+        assert append_query("/api/path", "") == "/api/path"
+
+    def test_signature_content_matches_url_query(self):
+        client = Xhshow()
+        params = {"num": "30", "cursor": "", "tags": ["a", "b=c"], "n": None}
+
+        content = client._build_content_string("GET", "/api/path", params)
+        url = build_url("/api/path", params)
+
+        assert content == url
+
+
 class TestGithubSmokeTest:
     """Smoke tests for GitHub CI"""
 
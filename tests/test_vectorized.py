@@ -0,0 +1,97 @@
+"""Tests for the NumPy batch backend"""
+
+import random
+
+import pytest
+
+from xhshow import CryptoConfig, RandomGenerator, Xhshow
+from xhshow.core import vectorized
+from xhshow.core.vectorized import get_batch_encoder
+
+np = pytest.importorskip("numpy")
+
+TIMESTAMP = 1764896636.081
+
+
+def build_specs(count: int) -> list[tuple]:
+    specs = []
+    for i in range(count):
+        a1_value = f"a1_value_{i % 3}" * (i % 5 + 1)
+        if i % 2:
+            specs.append(("POST", "/api/sns/web/v1/comment/post", a1_value, {"note_id": str(i), "content": "测试"}))
+        else:
+            specs.append(("GET", "/api/sns/web/v1/user_posted", a1_value, {"num": "30", "cursor": str(i)}, "app"))
+    return specs
+
+
+class TestNumpyBatchEncoder:
+    """测试 NumPy 批量编码与标量实现一致"""
+
+    def setup_method(self):
+        self.client = Xhshow()
+        self.batch_encoder = get_batch_encoder(self.client.config)
+
+    @pytest.mark.parametrize("width", [1, 2, 3, 4, 124, 125, 126, 200])
+    def test_primitives_match_scalar(self, width):
+        """测试异或与两种 Base64 编码逐行一致"""
+        processor = self.client.crypto_processor
+        rng = random.Random(width)
+        records = [bytes(rng.randrange(256) for _ in range(width)) for _ in range(7)]
+        rows = self.batch_encoder.as_rows(b"".join(records), width)
+
+        xored = self.batch_encoder.xor_rows(rows)
+        assert [row.tobytes() for row in xored] == [processor.bit_ops.xor_transform_bytes(r) for r in records]
+        assert [row.tobytes() for row in self.batch_encoder.encode_rows(rows)] == [
+            processor.b64encoder.encode_bytes(r) for r in records
+        ]
+        assert [row.tobytes() for row in self.batch_encoder.encode_x3_rows(rows)] == [
+            processor.b64encoder.encode_x3_bytes(r) for r in records
+        ]
+
+    def test_sign_xs_many_matches_scalar(self):
+        """测试向量化批量签名与标量路径逐字节一致"""
+        specs = build_specs(40)
+        scalar = Xhshow(
+            CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=0), random_generator=RandomGenerator(seed=2024)
+        )
+        batched = Xhshow(
+            CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=8), random_generator=RandomGenerator(seed=2024)
+        )
+
+        expected = scalar.sign_xs_many(specs, TIMESTAMP)
+        result = batched.sign_xs_many(specs, TIMESTAMP)
+
+        assert batched._batch_encoder is not None
+        assert result == expected
+        assert all(isinstance(signature, str) for signature in result)
+
+    def test_sign_headers_many_uses_batch_path(self):
+        """测试批量请求头走向量化路径且可解码"""
+        client = Xhshow(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=2))
+        cookies = {"a1": "test_a1_value", "web_session": "session"}
+        specs = [("GET", "/api/sns/web/v1/user_posted", cookies, {"cursor": str(i)}) for i in range(4)]
+
+        headers_list = client.sign_headers_many(specs, timestamp=TIMESTAMP)
+
+        assert client._batch_encoder is not None
+        for headers in headers_list:
+            decoded = client.decode_xs(headers["x-s"])
+            assert decoded["x3"].startswith(client.config.X3_PREFIX)
+
+    def test_below_threshold_stays_scalar(self):
+        """测试未达到阈值时不初始化向量化后端"""
+        client = Xhshow(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=100))
+        client.sign_xs_many(build_specs(10), TIMESTAMP)
+
+        assert client._batch_encoder_resolved is False
+
+    def test_unavailable_without_numpy(self, monkeypatch):
+        """测试未安装 NumPy 或阈值为 0 时回退到标量路径"""
+        assert get_batch_encoder(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=0)) is None
+
+        monkeypatch.setattr(vectorized, "np", None)
+        assert get_batch_encoder(CryptoConfig()) is None
+
+        client = Xhshow(CryptoConfig().with_overrides(NUMPY_BATCH_THRESHOLD=1))
+        assert len(client.sign_xs_many(build_specs(4), TIMESTAMP)) == 4
+        assert client._batch_encoder is None
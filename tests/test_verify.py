@@ -0,0 +1,114 @@
+"""Tests for sampled self-verification of produced signatures"""
+
+import hashlib
+
+import pytest
+
+from xhshow import CryptoConfig, CryptoProcessor, RandomGenerator, Xhshow
+from xhshow.core import verify
+from xhshow.core.verify import SignatureVerifier, VerifyStats
+
+TIMESTAMP = 1764896636.081
+URI = "/api/sns/web/v1/user_posted"
+
+
+def verifying_client(rate: float = 1.0, max_per_second: int = 0, seed: int = 22, **kwargs) -> Xhshow:
+    config = CryptoConfig().with_overrides(SELF_VERIFY_RATE=rate, SELF_VERIFY_MAX_PER_SECOND=max_per_second)
+    return Xhshow(config, random_generator=RandomGenerator(seed=seed), **kwargs)
+
+
+class TestSelfVerification:
+    """测试签名抽样自校验"""
+
+    def test_disabled_by_default(self):
+        """测试默认关闭"""
+        client = Xhshow()
+        client.sign_xs_get(URI, "a1_value", params={"num": "30"})
+
+        assert client.verify_stats() == VerifyStats(0, 0, 0, 0)
+
+    def test_all_paths_verified(self):
+        """测试单条、模板、批量（NumPy）与 prepare_request 路径均通过校验"""
+        mismatches = []
+        client = verifying_client(on_verify_mismatch=mismatches.append)
+
+        client.sign_xs_get(URI, "a1_value", params={"num": "30"})
+        client.sign_xs_post("/api/sns/web/v1/feed", "a1_value", payload={"source_note_id": "abc"}, timestamp=TIMESTAMP)
+        client.template("GET", URI).sign("a1_value", {"num": "10"})
+        client.prepare_request("GET", f"https://edith.xiaohongshu.com{URI}", {"a1": "a1_value"}, params={"num": "1"})
+        client.sign_xs_many([("GET", URI, f"a1_{index}", {"cursor": str(index)}) for index in range(100)], TIMESTAMP)
+
+        assert mismatches == []
+        assert client.verify_stats() == VerifyStats(104, 104, 0, 0)
+
+    def test_output_unchanged(self):
+        """测试开启校验不改变种子化客户端的签名"""
+        plain = Xhshow(random_generator=RandomGenerator(seed=22))
+        verifying = verifying_client(rate=0.5)
+        specs = [("GET", URI, "a1_value", {"cursor": str(index)}) for index in range(80)]
+
+        for index in range(20):
+            params = {"cursor": str(index)}
+            assert verifying.sign_xs_get(URI, "a1_value", params=params, timestamp=TIMESTAMP) == plain.sign_xs_get(
+                URI, "a1_value", params=params, timestamp=TIMESTAMP
+            )
+        assert verifying.sign_xs_many(specs, TIMESTAMP) == plain.sign_xs_many(specs, TIMESTAMP)
+
+    def test_sampling_rate(self):
+        """测试抽样比例"""
+        client = verifying_client(rate=0.25)
+        for index in range(2000):
+            client.sign_xs_get(URI, "a1_value", params={"cursor": str(index)}, timestamp=TIMESTAMP)
+
+        stats = client.verify_stats()
+        assert 400 <= stats.checked <= 600
+        assert stats.sampled == stats.checked and stats.mismatches == 0
+
+    def test_budget(self, monkeypatch):
+        """测试每秒校验次数上限"""
+        monkeypatch.setattr(verify.time, "monotonic", lambda: 1000.5)
+        client = verifying_client(max_per_second=5)
+        for index in range(20):
+            client.sign_xs_get(URI, "a1_value", params={"cursor": str(index)}, timestamp=TIMESTAMP)
+
+        assert client.verify_stats() == VerifyStats(20, 5, 15, 0)
+
+    def test_reports_mismatch(self, monkeypatch):
+        """测试签名与输入不一致时回调"""
+        build_x3_bytes = CryptoProcessor.build_x3_bytes
+
+        def wrong_a1(self, md5_digest, a1_value, *args):
+            return build_x3_bytes(self, md5_digest, a1_value + "_wrong", *args)
+
+        monkeypatch.setattr(CryptoProcessor, "build_x3_bytes", wrong_a1)
+        mismatches = []
+        client = verifying_client(on_verify_mismatch=mismatches.append)
+        x_s = client.sign_xs_get(URI, "a1_value", params={"num": "30"}, timestamp=TIMESTAMP)
+
+        assert len(mismatches) == 1
+        assert mismatches[0].fields == ("a1",)
+        assert mismatches[0].signature.decode() == x_s
+        assert mismatches[0].payload.a1 == "a1_value_wrong"
+        assert client.verify_stats().mismatches == 1
+
+    def test_check_fields(self):
+        """测试逐字段比对与无法解码的签名"""
+        client = Xhshow(random_generator=RandomGenerator(seed=22))
+        verifier = SignatureVerifier(client.config, rate=1.0)
+        content = f"{URI}?num=30"
+        digest = hashlib.md5(content.encode()).digest()
+        signature = client.sign_xs_get(URI, "a1_value", params={"num": "30"}, timestamp=TIMESTAMP).encode()
+
+        assert verifier.check(signature, digest, len(content), "a1_value", "xhs-pc-web", TIMESTAMP) is None
+        mismatch = verifier.check(signature, bytes(16), len(content) + 1, "a1_value", "xhs-pc-web", TIMESTAMP + 5)
+        assert mismatch.fields == ("md5_prefix", "content_length", "timestamp_ms")
+        mismatch = verifier.check(b"XYS_notbase64!", digest, len(content), "a1_value", "xhs-pc-web", TIMESTAMP)
+        assert mismatch.fields == ("decode",) and mismatch.payload is None and mismatch.error
+        assert verifier.stats() == VerifyStats(0, 3, 0, 2)
+
+    def test_invalid_arguments(self):
+        """测试非法参数"""
+        with pytest.raises(ValueError):
+            SignatureVerifier(CryptoConfig(), rate=1.5)
+        with pytest.raises(ValueError):
+            SignatureVerifier(CryptoConfig(), rate=0.5, max_per_second=-1)
@@ -0,0 +1,130 @@
+"""Tests for the structured x3 payload parser"""
+
+import hashlib
+from array import array
+
+import pytest
+
+from xhshow import CryptoConfig, RandomGenerator, Xhshow
+from xhshow.core.payload_layout import PayloadLayout
+from xhshow.core.x3_parser import PAYLOAD_COLUMNS, X3Parser, X3Payload
+
+TIMESTAMP = 1764896636.081
+URI = "/api/sns/web/v1/user_posted"
+
+
+def x3_of(client: Xhshow, index: int = 0) -> str:
+    x_s = client.sign_xs_get(URI, f"a1_value_{index}", params={"page": str(index)}, timestamp=TIMESTAMP + index)
+    return client.decode_xs(x_s)["x3"]
+
+
+class TestX3Parser:
+    """测试 x3 结构化解析"""
+
+    def setup_method(self):
+        self.client = Xhshow(random_generator=RandomGenerator(seed=21))
+        self.parser = X3Parser.shared()
+
+    def test_parse_fields(self):
+        """测试各字段与签名输入一致"""
+        payload = self.parser.parse(x3_of(self.client))
+        content = f"{URI}?page=0"
+
+        assert isinstance(payload, X3Payload)
+        assert payload.valid
+        assert payload.version == bytes(CryptoConfig().VERSION_BYTES)
+        assert payload.timestamp_ms == int(TIMESTAMP * 1000)
+        assert 10000 <= payload.timestamp_ms - payload.env_timestamp_ms <= 50001
+        assert payload.content_length == len(content)
+        assert payload.md5_prefix == hashlib.md5(content.encode()).digest()[:8]
+        assert payload.a1 == "a1_value_0"
+        assert payload.source == "xhs-pc-web"
+        assert payload.checksum_version == CryptoConfig().CHECKSUM_VERSION
+        assert payload.checksum_seed == payload.seed & 0xFF
+
+    def test_bytes_and_memoryview_input(self):
+        """测试 bytes、memoryview 与无前缀输入"""
+        x3 = x3_of(self.client)
+        expected = self.parser.parse(x3)
+        stripped = x3[len(CryptoConfig().X3_PREFIX) :]
+
+        assert self.parser.parse(x3.encode()) == expected
+        assert self.parser.parse(memoryview(x3.encode())) == expected
+        assert self.parser.parse(stripped) == expected
+        assert self.parser.parse_payload(memoryview(self.client.decode_x3(x3))) == expected
+
+    def test_decode_x3_unchanged(self):
+        """测试 decode_x3 返回值与逐字节 XOR 一致"""
+        x3 = x3_of(self.client)
+        processor = self.client.crypto_processor
+        decoded = processor.b64encoder.decode_x3(x3[len(self.client.config.X3_PREFIX) :])
+        result = self.client.decode_x3(x3)
+
+        assert isinstance(result, bytearray)
+        assert result == processor.bit_ops.xor_transform_array(list(decoded))
+        assert self.client.parse_x3(x3) == X3Parser.shared().parse_payload(result)
+
+    def test_invalid_input(self):
+        """测试非法输入与被篡改的载荷"""
+        with pytest.raises(ValueError):
+            self.parser.parse("mns0301_notbase64!")
+        with pytest.raises(ValueError):
+            self.parser.parse_payload(b"\x00" * 10)
+
+        payload = bytearray(self.client.decode_x3(x3_of(self.client)))
+        payload[PayloadLayout.shared()["flag"].offset] ^= 1
+        assert not self.parser.parse_payload(payload).valid
+
+    def test_columns_match_single(self):
+        """测试列式结果与逐条解析一致，失败项隔离"""
+        values = [x3_of(self.client, index) for index in range(20)]
+        values.insert(5, "mns0301_notbase64!")
+        columns = self.parser.parse_columns(values, numpy=False)
+
+        assert set(columns) == set(PAYLOAD_COLUMNS)
+        assert all(len(column) == 21 for column in columns.values())
+        assert isinstance(columns["timestamp_ms"], array)
+        assert columns["valid"][5] == 0 and columns["a1"][5] == "" and columns["seed"][5] == 0
+        for index, value in enumerate(values):
+            if index == 5:
+                continue
+            payload = self.parser.parse(value)
+            assert columns["valid"][index] == 1
+            assert columns["timestamp_ms"][index] == payload.timestamp_ms
+            assert columns["md5_prefix"][index].to_bytes(8, "little") == payload.md5_prefix
+            assert columns["version"][index].to_bytes(4, "little") == payload.version
+            assert columns["a1"][index] == payload.a1
+
+    def test_columns_from_buffer(self):
+        """测试拼接缓冲区与偏移量输入"""
+        values = [x3_of(self.client, index).encode() for index in range(5)]
+        offsets = [0]
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+
+        assert self.parser.parse_columns(b"".join(values), offsets, numpy=False) == self.parser.parse_columns(
+            values, numpy=False
+        )
+        assert all(len(column) == 0 for column in self.parser.parse_columns([], numpy=False).values())
+
+    def test_numpy_columns_match_arrays(self):
+        """测试 NumPy 列与 array 列一致"""
+        np = pytest.importorskip("numpy")
+        values = [x3_of(self.client, index) for index in range(20)] + ["mns0301_notbase64!"]
+        payload = bytearray(self.client.decode_x3(values[3]))
+        payload[PayloadLayout.shared()["checksum_seed"].offset] ^= 1
+        values[3] = (
+            self.client.config.X3_PREFIX
+            + self.client.crypto_processor.b64encoder.encode_x3_bytes(
+                self.client.crypto_processor.bit_ops.xor_transform_bytes(payload)
+            ).decode()
+        )
+
+        arrays = self.parser.parse_columns(values, numpy=False)
+        numpy_columns = self.parser.parse_columns(values, numpy=True)
+
+        assert isinstance(numpy_columns["seed"], np.ndarray)
+        assert list(arrays["valid"]) == [1, 1, 1, 0] + [1] * 16 + [0]
+        for name, code in PAYLOAD_COLUMNS.items():
+            expected = arrays[name] if code == "str" else arrays[name].tolist()
+            assert list(numpy_columns[name]) == expected, name